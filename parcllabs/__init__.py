@@ -6,4 +6,12 @@ DEFAULT_API_BASE = "https://api.parcllabs.com"
 api_key: str | None = None
 api_base = DEFAULT_API_BASE
 
+from parcllabs.async_parcllabs_client import AsyncParclLabsClient  # noqa: E402, F401
+from parcllabs.cache import ResponseCache  # noqa: E402, F401
+from parcllabs.json_decoder import JSONDecoder  # noqa: E402, F401
 from parcllabs.parcllabs_client import ParclLabsClient  # noqa: E402, F401
+from parcllabs.rate_limiter import RateLimiter  # noqa: E402, F401
+from parcllabs.retry import RetryPolicy  # noqa: E402, F401
+from parcllabs.services.market_index import MarketIndex  # noqa: E402, F401
+from parcllabs.sinks import ParquetSink  # noqa: E402, F401
+from parcllabs.store import DuckDBStore, SQLiteStore  # noqa: E402, F401
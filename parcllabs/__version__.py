@@ -1 +1 @@
-VERSION = "1.18.0"
+VERSION = "1.19.0"
@@ -0,0 +1,150 @@
+import asyncio
+from typing import Any
+
+from parcllabs import api_base
+from parcllabs.cache import ResponseCache
+from parcllabs.compression import accept_encoding
+from parcllabs.json_decoder import JSONDecoder
+from parcllabs.parcllabs_client import ParclLabsClient, ServiceGroup
+from parcllabs.rate_limiter import RateLimiter
+from parcllabs.retry import RetryPolicy
+from parcllabs.services.async_parcllabs_service import AsyncParclLabsService
+from parcllabs.services.market_index import MarketIndex
+from parcllabs.services.metrics.portfolio_size_service import (
+    AsyncPortfolioSizeService,
+    PortfolioSizeService,
+)
+from parcllabs.services.metrics.property_type_service import (
+    AsyncPropertyTypeService,
+    PropertyTypeService,
+)
+from parcllabs.services.parcllabs_service import ParclLabsService
+from parcllabs.services.properties.property_address import (
+    AsyncPropertyAddressSearch,
+    PropertyAddressSearch,
+)
+from parcllabs.services.properties.property_events_service import (
+    AsyncPropertyEventsService,
+    PropertyEventsService,
+)
+from parcllabs.services.properties.property_search import AsyncPropertySearch, PropertySearch
+from parcllabs.services.properties.property_v2 import AsyncPropertyV2Service, PropertyV2Service
+from parcllabs.services.search import AsyncSearchMarkets, SearchMarkets
+from parcllabs.store import LocalStore
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+ASYNC_SERVICE_CLASSES = {
+    ParclLabsService: AsyncParclLabsService,
+    PropertyTypeService: AsyncPropertyTypeService,
+    PortfolioSizeService: AsyncPortfolioSizeService,
+    SearchMarkets: AsyncSearchMarkets,
+    PropertySearch: AsyncPropertySearch,
+    PropertyEventsService: AsyncPropertyEventsService,
+    PropertyAddressSearch: AsyncPropertyAddressSearch,
+    PropertyV2Service: AsyncPropertyV2Service,
+}
+
+
+class AsyncParclLabsClient(ParclLabsClient):
+    """
+    Asyncio client for the Parcl Labs API.
+
+    Exposes the same service groups as ParclLabsClient (``price_feed``,
+    ``market_metrics``, ``property_v2``, ...) but every ``retrieve`` is awaitable
+    and runs on a shared ``httpx.AsyncClient``. Chunks, pages and per-parcl_id
+    requests are gathered concurrently, with at most ``max_concurrency`` requests
+    in flight across the whole client.
+
+    Usage:
+        async with AsyncParclLabsClient(api_key) as client:
+            df = await client.market_metrics.housing_event_prices.retrieve(parcl_ids=[...])
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str = api_base,
+        limit: int | None = None,
+        num_workers: int | None = None,
+        timeout: tuple[float, float] | float | None = (10, 90),
+        pool_size: int | None = None,
+        max_concurrency: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        compact_dtypes: bool = False,
+        dataframe_backend: str = "pandas",
+        json_decoder: JSONDecoder | None = None,
+        request_compression: str | None = None,
+        response_cache: ResponseCache | None = None,
+        market_index: MarketIndex | None = None,
+        store: LocalStore | None = None,
+        coalesce_requests: bool = False,
+    ) -> None:
+        if httpx is None:
+            raise ImportError(
+                "AsyncParclLabsClient requires httpx. "
+                "Install it with `pip install parcllabs[async]`."
+            )
+
+        super().__init__(
+            api_key=api_key,
+            api_url=api_url,
+            limit=limit,
+            num_workers=num_workers,
+            timeout=timeout,
+            pool_size=pool_size,
+            max_concurrency=max_concurrency,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            compact_dtypes=compact_dtypes,
+            dataframe_backend=dataframe_backend,
+            json_decoder=json_decoder,
+            request_compression=request_compression,
+            response_cache=response_cache,
+            market_index=market_index,
+            store=store,
+            coalesce_requests=coalesce_requests,
+        )
+
+    def _create_session(self, pool_size: int) -> "httpx.AsyncClient":
+        """
+        Create the async HTTP client shared by every service on this client.
+        """
+        if isinstance(self.timeout, tuple):
+            connect, read = self.timeout
+            timeout = httpx.Timeout(read, connect=connect)
+        else:
+            timeout = httpx.Timeout(self.timeout)
+
+        limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        session = httpx.AsyncClient(limits=limits, timeout=timeout)
+        session.headers["Accept-Encoding"] = accept_encoding(session.headers["Accept-Encoding"])
+        return session
+
+    @staticmethod
+    def _create_request_semaphore(max_concurrency: int) -> asyncio.Semaphore:
+        return asyncio.Semaphore(max_concurrency)
+
+    def _add_services_to_group(
+        self, group: ServiceGroup, services: dict[str, dict[str, Any]]
+    ) -> None:
+        for name, config in services.items():
+            service_class = ASYNC_SERVICE_CLASSES[config["service_class"]]
+            group.add_service(name=name, **{**config, "service_class": service_class})
+
+    async def close(self) -> None:
+        """Close the async HTTP client and release its connections."""
+        await self.session.aclose()
+
+    def __enter__(self) -> "AsyncParclLabsClient":
+        raise TypeError("AsyncParclLabsClient must be used with `async with`, not `with`")
+
+    async def __aenter__(self) -> "AsyncParclLabsClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
@@ -0,0 +1,302 @@
+"""Persistent on-disk cache of API responses.
+
+A ``ResponseCache`` is owned by a client and consulted by
+``ParclLabsService._make_request`` (and its async counterpart) before a request
+is sent, so a rerun of a notebook or backfill is answered from disk without
+spending credits:
+
+    from parcllabs import ParclLabsClient, ResponseCache
+
+    cache = ResponseCache("~/.cache/parcllabs", ttls={"/v1/search/markets": 7 * 86400})
+    client = ParclLabsClient(api_key, response_cache=cache)
+
+Caching is opt-in: a client without a ``response_cache`` sends every request.
+Entries are keyed on the method, URL, canonicalized query parameters and JSON
+body, and stored zlib-compressed in a SQLite database in the cache directory.
+They are fresh for ``ttl`` seconds (a day by default, or per URL path prefix
+with ``ttls``), and the least recently used are evicted once the stored bodies
+exceed ``max_bytes`` (1 GiB by default). Expired entries are kept until
+evicted and revalidated: a request for one carries its ``ETag`` and
+``Last-Modified`` validators, and a ``304 Not Modified`` answer is served from
+the stored body.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_BYTES = 1024**3
+DATABASE_NAME = "responses.sqlite3"
+# Response headers kept with a cached body.
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+# Conditional request header sent for each stored validator.
+CONDITIONAL_HEADERS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    body BLOB NOT NULL,
+    headers TEXT NOT NULL,
+    content_hash TEXT,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+class CacheEntry:
+    """A stored response body with its headers.
+
+    ``fresh`` is False once the entry's TTL has passed; it can then only be
+    served after the API confirms it is unchanged.
+    """
+
+    def __init__(
+        self, body: bytes, headers: dict[str, str], fresh: bool, content_hash: str | None
+    ) -> None:
+        self.body = body
+        self.headers = headers
+        self.fresh = fresh
+        self.content_hash = content_hash
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for the entry's ``ETag`` and ``Last-Modified``."""
+        return {
+            CONDITIONAL_HEADERS[name]: value
+            for name, value in self.headers.items()
+            if name in CONDITIONAL_HEADERS
+        }
+
+
+class ResponseCache:
+    """Store successful responses on disk and serve them until they expire.
+
+    Args:
+        path: Cache directory; created if it does not exist.
+        ttl: Seconds a response stays fresh.
+        ttls: Per-endpoint TTLs, keyed by URL path prefix (for example
+            ``"/v1/market_metrics"``). The longest matching prefix wins, and a
+            TTL of 0 disables caching for that endpoint.
+        max_bytes: Cap on the total size of stored (compressed) bodies. The least
+            recently used entries are evicted once it is exceeded.
+        compression_level: zlib level used for stored bodies.
+        hash_content: Store a SHA-256 of each body. For endpoints that send no
+            validators, a refetched body with the same hash is then recorded as
+            unchanged, and only its expiry is updated instead of storing it again.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        ttls: Mapping[str, float] | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        compression_level: int = 6,
+        hash_content: bool = False,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive.")
+
+        self.path = Path(path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.hash_content = hash_content
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.est_credits_saved = 0
+        self.not_modified = 0
+        self.unchanged = 0
+        self.revalidation_bytes_saved = 0
+        self.revalidation_est_credits_saved = 0
+
+        # One connection is shared by the client's worker threads and the async
+        # client's asyncio.to_thread calls; self._lock serializes every use of it.
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path / DATABASE_NAME, check_same_thread=False)
+        self._connection.executescript(SCHEMA)
+
+    @staticmethod
+    def key(
+        method: str,
+        url: str,
+        params: Mapping[str, Any] | None = None,
+        body: Any = None,  # noqa: ANN401
+    ) -> str:
+        """Cache key of a request: the same for equivalent params in any order."""
+        parts = urlsplit(str(url))
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        for name, value in (params or {}).items():
+            if value is None:
+                continue
+            values = value if isinstance(value, list | tuple) else [value]
+            query.extend((name, str(item)) for item in values)
+        canonical_url = urlunsplit(parts._replace(query=urlencode(sorted(query)), fragment=""))
+        canonical_body = "" if body is None else json.dumps(body, sort_keys=True, default=str)
+        material = "\n".join([method.upper(), canonical_url, canonical_body])
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def ttl_for(self, url: str) -> float:
+        """TTL for ``url``: the longest matching ``ttls`` prefix, else ``ttl``."""
+        path = urlsplit(str(url)).path
+        matches = [prefix for prefix in self.ttls if path.startswith(prefix)]
+        if not matches:
+            return self.ttl
+        return self.ttls[max(matches, key=len)]
+
+    def get(self, key: str) -> CacheEntry | None:
+        """The entry stored under ``key``, fresh or not, counting a hit or miss.
+
+        Only fresh entries count as hits: a stale one must be revalidated.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, headers, content_hash, expires_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            fresh = row is not None and row[3] > now
+            if not fresh:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._touch(key, now)
+        if row is None:
+            return None
+        return CacheEntry(zlib.decompress(row[0]), json.loads(row[1]), fresh, row[2])
+
+    def set(
+        self,
+        key: str,
+        url: str,
+        body: bytes,
+        headers: Mapping[str, str],
+        stale: CacheEntry | None = None,
+    ) -> None:
+        """Store a response body, then evict least recently used entries over the cap.
+
+        ``stale`` is the expired entry the response replaces, if any; with
+        ``hash_content``, an identical body only has its expiry renewed.
+        """
+        ttl = self.ttl_for(url)
+        if ttl <= 0:
+            return
+
+        content_hash = hashlib.sha256(body).hexdigest() if self.hash_content else None
+        if content_hash is not None and stale is not None and stale.content_hash == content_hash:
+            with self._lock:
+                self.unchanged += 1
+                self._renew(key, ttl)
+            return
+
+        compressed = zlib.compress(body, self.compression_level)
+        if len(compressed) > self.max_bytes:
+            return
+        kept_headers = {name: headers[name] for name in CACHED_HEADERS if name in headers}
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    str(url),
+                    compressed,
+                    json.dumps(kept_headers),
+                    content_hash,
+                    len(compressed),
+                    now,
+                    now + ttl,
+                    now,
+                ),
+            )
+            self._evict()
+            self._connection.commit()
+
+    def revalidated(self, key: str, url: str, entry: CacheEntry) -> None:
+        """Renew an entry the API answered ``304 Not Modified`` for."""
+        with self._lock:
+            self.not_modified += 1
+            self.revalidation_bytes_saved += len(entry.body)
+            self._renew(key, self.ttl_for(url))
+
+    def record_credits_saved(self, est_credits: float, revalidated: bool = False) -> None:
+        with self._lock:
+            self.est_credits_saved += est_credits
+            if revalidated:
+                self.revalidation_est_credits_saved += est_credits
+
+    def clear(self) -> None:
+        """Delete every stored response."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counts and the number and size of stored entries."""
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": size,
+            "est_credits_saved": self.est_credits_saved,
+            "not_modified": self.not_modified,
+            "unchanged": self.unchanged,
+            "revalidation_bytes_saved": self.revalidation_bytes_saved,
+            "revalidation_est_credits_saved": self.revalidation_est_credits_saved,
+        }
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _touch(self, key: str, now: float) -> None:
+        self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        self._connection.commit()
+
+    def _renew(self, key: str, ttl: float) -> None:
+        now = time.time()
+        self._connection.execute(
+            "UPDATE responses SET expires_at = ?, accessed_at = ? WHERE key = ?",
+            (now + ttl, now, key),
+        )
+        self._connection.commit()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the stored size fits ``max_bytes``."""
+        (size,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if size <= self.max_bytes:
+            return
+
+        rows = self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        evicted = []
+        for key, entry_size in rows:
+            if size <= self.max_bytes:
+                break
+            evicted.append((key,))
+            size -= entry_size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.evictions += len(evicted)
@@ -30,3 +30,4 @@ POST_METHOD = RequestMethods.POST.value
 ZIP_CODE_LENGTH = 5
 PARCL_PROPERTY_IDS_LIMIT = 10000
 PARCL_PROPERTY_IDS = "parcl_property_ids"
+MAX_PARCL_IDS_PER_REQUEST = 1000
@@ -0,0 +1,124 @@
+"""Compressed transfer and transfer byte counts.
+
+Clients advertise their HTTP library's default response encodings plus ``br``
+and ``zstd`` when their decoders are installed, and can
+compress large POST bodies, such as a search for 10,000 ``parcl_property_ids``:
+
+    client = ParclLabsClient(api_key, request_compression="gzip")
+
+Every request's bytes on the wire and decoded bytes are recorded on
+``client.transfer_stats``; the totals are also part of ``client.account()``.
+Install the optional codecs with ``pip install parcllabs[compression]``.
+"""
+
+import gzip
+import threading
+from collections import deque
+from typing import Any
+
+try:
+    import brotli
+except ImportError:  # optional; br is only advertised when it can be decoded
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional; zstd is only advertised when it can be decoded
+    zstandard = None
+
+GZIP = "gzip"
+BROTLI = "br"
+ZSTD = "zstd"
+INSTALLED_ENCODINGS = {GZIP: True, BROTLI: brotli is not None, ZSTD: zstandard is not None}
+# Smaller bodies are sent as-is; compressing them saves less than it costs.
+REQUEST_COMPRESSION_MIN_BYTES = 16 * 1024
+DEFAULT_TRANSFER_HISTORY = 1000
+
+
+def accept_encoding(default: str) -> str:
+    """``Accept-Encoding`` header adding br and zstd to the HTTP library's default.
+
+    ``default`` is the HTTP library's own ``Accept-Encoding``; every encoding it
+    lists is kept, in order, and br and zstd are appended when their optional
+    codecs are installed and the default does not already name them.
+    """
+    encodings = [encoding.strip() for encoding in default.split(",") if encoding.strip()]
+    encodings += [
+        name
+        for name, installed in INSTALLED_ENCODINGS.items()
+        if installed and name not in encodings
+    ]
+    return ", ".join(encodings)
+
+
+def validate_request_compression(encoding: str | None) -> str | None:
+    """Check that request bodies can be compressed with ``encoding``."""
+    if encoding is None:
+        return None
+    if encoding not in INSTALLED_ENCODINGS:
+        raise ValueError(
+            f"request_compression must be one of {', '.join(INSTALLED_ENCODINGS)}, "
+            f"got {encoding!r}."
+        )
+    if not INSTALLED_ENCODINGS[encoding]:
+        raise ImportError(
+            f"Compressing requests with {encoding} requires an optional codec. "
+            "Install it with `pip install parcllabs[compression]`."
+        )
+    return encoding
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a request body with ``encoding`` (``gzip``, ``br`` or ``zstd``)."""
+    if encoding == BROTLI:
+        return brotli.compress(body)
+    if encoding == ZSTD:
+        return zstandard.ZstdCompressor().compress(body)
+    return gzip.compress(body)
+
+
+class TransferStats:
+    """Bytes sent and received by a client's requests, compressed and not.
+
+    ``history`` keeps one entry per request for the most recent requests;
+    ``totals`` sums every request since the client was created. Safe to update
+    from the worker threads of a single client.
+    """
+
+    FIELDS = (
+        "bytes_sent",
+        "bytes_sent_uncompressed",
+        "bytes_received",
+        "bytes_received_uncompressed",
+    )
+
+    def __init__(self, history: int = DEFAULT_TRANSFER_HISTORY) -> None:
+        self.history: deque[dict[str, Any]] = deque(maxlen=history)
+        self._totals = dict.fromkeys(("requests", *self.FIELDS), 0)
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        content_encoding: str | None,
+        **sizes: int,
+    ) -> None:
+        """Add one request. ``sizes`` holds a value for each of ``FIELDS``."""
+        entry = {"method": method, "url": url, "content_encoding": content_encoding}
+        entry.update((field, sizes[field]) for field in self.FIELDS)
+        with self._lock:
+            self.history.append(entry)
+            self._totals["requests"] += 1
+            for field in self.FIELDS:
+                self._totals[field] += sizes[field]
+
+    def totals(self) -> dict[str, Any]:
+        """Sums over every request, with the received compression ratio."""
+        with self._lock:
+            totals = dict(self._totals)
+        received = totals["bytes_received"]
+        totals["compression_ratio"] = (
+            totals["bytes_received_uncompressed"] / received if received else None
+        )
+        return totals
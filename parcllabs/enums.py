@@ -17,6 +17,7 @@ class RequestLimits(Enum):
 
 class ResponseCodes(Enum):
     SUCCESS = 200
+    NOT_MODIFIED = 304
     CLIENT_ERROR = 400
     FORBIDDEN = 403
     NOT_FOUND = 404
@@ -0,0 +1,104 @@
+"""Decoding of API response bodies.
+
+Every response a client receives is decoded by the client's ``JSONDecoder``.
+By default it uses the fastest JSON library installed (``msgspec``, then
+``orjson``), falling back to the standard library:
+
+    from parcllabs import JSONDecoder, ParclLabsClient
+
+    client = ParclLabsClient(api_key, json_decoder=JSONDecoder(library="orjson"))
+
+Install the fast libraries with ``pip install parcllabs[fastjson]``.
+"""
+
+import json
+from collections.abc import Sequence
+from typing import Any
+
+try:
+    import msgspec
+except ImportError:  # optional; JSONDecoder falls back to orjson or json
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # optional; JSONDecoder falls back to json
+    orjson = None
+
+# Raised for a malformed body by whichever library decodes it, so callers can
+# write ``except DecodeError`` without knowing which one is in use.
+DecodeError: tuple[type[Exception], ...] = (
+    (ValueError, msgspec.DecodeError) if msgspec is not None else (ValueError,)
+)
+
+MSGSPEC = "msgspec"
+ORJSON = "orjson"
+STDLIB = "json"
+INSTALLED_LIBRARIES = {
+    MSGSPEC: msgspec is not None,
+    ORJSON: orjson is not None,
+    STDLIB: True,
+}
+
+
+class JSONDecoder:
+    """Decode JSON response bodies, using a fast library when one is installed.
+
+    When ``fields`` is passed to ``decode`` and msgspec is in use, the body is
+    decoded into a struct holding only those top-level fields: the values of
+    every other field are skipped by the parser instead of being built and then
+    dropped. The result is still a plain dict, without the missing fields.
+
+    Args:
+        library: ``"msgspec"``, ``"orjson"`` or ``"json"``. Defaults to the first
+            of these that is installed.
+    """
+
+    def __init__(self, library: str | None = None) -> None:
+        if library is None:
+            library = next(name for name, installed in INSTALLED_LIBRARIES.items() if installed)
+        if library not in INSTALLED_LIBRARIES:
+            raise ValueError(
+                f"library must be one of {', '.join(INSTALLED_LIBRARIES)}, got {library!r}."
+            )
+        if not INSTALLED_LIBRARIES[library]:
+            raise ImportError(
+                f"{library} is not installed. Install it with `pip install parcllabs[fastjson]`."
+            )
+
+        self.library = library
+        self._envelope_decoders: dict[tuple[str, ...], msgspec.json.Decoder] = {}
+        if library == MSGSPEC:
+            self._loads = msgspec.json.Decoder().decode
+        elif library == ORJSON:
+            self._loads = orjson.loads
+        else:
+            self._loads = json.loads
+
+    def decode(self, content: bytes | str, fields: Sequence[str] | None = None) -> Any:  # noqa: ANN401
+        """Decode ``content``, keeping only the top-level ``fields`` if given."""
+        if fields is None or self.library != MSGSPEC:
+            return self._loads(content)
+
+        try:
+            envelope = self._envelope_decoder(tuple(fields)).decode(content)
+        except msgspec.ValidationError:
+            # Not a JSON object; decode it as-is.
+            return self._loads(content)
+        return {
+            name: value
+            for name in envelope.__struct_fields__
+            if (value := getattr(envelope, name)) is not msgspec.UNSET
+        }
+
+    def _envelope_decoder(self, fields: tuple[str, ...]) -> "msgspec.json.Decoder":
+        """A decoder for a struct of ``fields``, left UNSET when absent; cached."""
+        decoder = self._envelope_decoders.get(fields)
+        if decoder is None:
+            envelope = msgspec.defstruct(
+                "Envelope",
+                [(name, Any | msgspec.UnsetType, msgspec.UNSET) for name in fields],
+            )
+            decoder = msgspec.json.Decoder(envelope)
+            self._envelope_decoders[fields] = decoder
+        return decoder
@@ -1,7 +1,19 @@
+import os
+import threading
 from typing import Any
 
+import requests
+from requests.adapters import HTTPAdapter
+
 from parcllabs import api_base
+from parcllabs.cache import ResponseCache
 from parcllabs.common import NO_API_KEY_ERROR
+from parcllabs.compression import TransferStats, accept_encoding, validate_request_compression
+from parcllabs.json_decoder import JSONDecoder
+from parcllabs.rate_limiter import RateLimiter
+from parcllabs.retry import RetryPolicy
+from parcllabs.services.data_utils import validate_dataframe_backend
+from parcllabs.services.market_index import MarketIndex
 from parcllabs.services.metrics.portfolio_size_service import PortfolioSizeService
 from parcllabs.services.metrics.property_type_service import PropertyTypeService
 from parcllabs.services.parcllabs_service import ParclLabsService
@@ -10,6 +22,8 @@ from parcllabs.services.properties.property_events_service import PropertyEvents
 from parcllabs.services.properties.property_search import PropertySearch
 from parcllabs.services.properties.property_v2 import PropertyV2Service
 from parcllabs.services.search import SearchMarkets
+from parcllabs.singleflight import SingleFlight
+from parcllabs.store import LocalStore
 
 
 class ServiceGroup:
@@ -45,6 +59,18 @@ class ParclLabsClient:
         limit: int | None = None,
         num_workers: int | None = None,
         timeout: tuple[float, float] | float | None = (10, 90),
+        pool_size: int | None = None,
+        max_concurrency: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        compact_dtypes: bool = False,
+        dataframe_backend: str = "pandas",
+        json_decoder: JSONDecoder | None = None,
+        request_compression: str | None = None,
+        response_cache: ResponseCache | None = None,
+        market_index: MarketIndex | None = None,
+        store: LocalStore | None = None,
+        coalesce_requests: bool = False,
     ) -> None:
         if not api_key:
             raise ValueError(NO_API_KEY_ERROR)
@@ -55,9 +81,72 @@ class ParclLabsClient:
         self.num_workers = num_workers
         self.limit = limit
         self.timeout = timeout
+        self.pool_size = pool_size or self._default_pool_size(num_workers)
+        self.session = self._create_session(self.pool_size)
+        self.max_concurrency = max_concurrency or self.pool_size
+        self.request_semaphore = self._create_request_semaphore(self.max_concurrency)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.compact_dtypes = compact_dtypes
+        self.dataframe_backend = validate_dataframe_backend(dataframe_backend)
+        self.json_decoder = json_decoder or JSONDecoder()
+        self.request_compression = validate_request_compression(request_compression)
+        self.transfer_stats = TransferStats()
+        self.response_cache = response_cache
+        self.market_index = market_index
+        self.store = store
+        self.single_flight = SingleFlight() if coalesce_requests else None
 
         self._initialize_services()
 
+    @staticmethod
+    def _default_pool_size(num_workers: int | None) -> int:
+        """
+        Match the connection pool to the number of worker threads.
+
+        When ``num_workers`` is None, ThreadPoolExecutor falls back to
+        ``min(32, os.cpu_count() + 4)`` threads, so the pool is sized the same way.
+        """
+        if num_workers:
+            return num_workers
+        return min(32, (os.cpu_count() or 1) + 4)
+
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        """
+        Create the keep-alive session shared by every service on this client.
+
+        Each worker thread can hold its own connection, so the pool is never the
+        bottleneck in the paginated and chunked fan-outs.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Accept-Encoding"] = accept_encoding(session.headers["Accept-Encoding"])
+        return session
+
+    @staticmethod
+    def _create_request_semaphore(max_concurrency: int) -> threading.BoundedSemaphore:
+        """
+        Create the semaphore that caps in-flight requests across the whole client.
+
+        Services fan out at several levels (parcl_id chunks, pages, per-parcl_id
+        GETs); bounding each HTTP request rather than each pool keeps the total at
+        ``max_concurrency`` however those levels nest.
+        """
+        return threading.BoundedSemaphore(max_concurrency)
+
+    def close(self) -> None:
+        """Close the pooled HTTP session and release its connections."""
+        self.session.close()
+
+    def __enter__(self) -> "ParclLabsClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def _initialize_services(self) -> None:
         self.price_feed = self._create_price_feed_services()
         self.investor_metrics = self._create_investor_metrics_services()
@@ -298,4 +387,15 @@ class ParclLabsClient:
         return group
 
     def account(self) -> dict[str, Any]:
-        return self.account_info
+        """Credit usage, plus the bytes transferred so far under ``"transfer"``.
+
+        With a ``response_cache``, its hit/miss stats are under ``"cache"``, and
+        when requests are coalesced, the number shared and the credits they saved
+        are under ``"coalesced"``.
+        """
+        account = {**self.account_info, "transfer": self.transfer_stats.totals()}
+        if self.response_cache is not None:
+            account["cache"] = self.response_cache.stats()
+        if self.single_flight is not None:
+            account["coalesced"] = self.single_flight.stats()
+        return account
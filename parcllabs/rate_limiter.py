@@ -0,0 +1,142 @@
+"""Client-side rate limiting shared by every service on a client.
+
+Rate limiting is opt-in: a ``RateLimiter`` passed to ``ParclLabsClient`` is
+consulted before every request, from any service or worker thread (or
+coroutine, on the async client). Without one, requests are not throttled and a
+429 is only retried after its ``Retry-After`` delay by the ``RetryPolicy``. The
+limiter is a token bucket whose rate adapts to the API's responses:
+
+* every 2xx response raises the rate by ``increase`` requests/second,
+  up to ``max_rate`` (additive increase);
+* a 429 multiplies the rate by ``decrease_factor``, down to ``min_rate``
+  (multiplicative decrease), and empties the bucket so that no request is sent
+  before the ``Retry-After`` delay has passed.
+
+    from parcllabs import ParclLabsClient, RateLimiter
+
+    # a fixed 5 requests/second
+    client = ParclLabsClient(api_key, rate_limiter=RateLimiter(rate=5, max_rate=5))
+"""
+
+import math
+import threading
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+DEFAULT_RATE = 10.0
+DEFAULT_MIN_RATE = 0.5
+DEFAULT_MAX_RATE = 50.0
+DEFAULT_RATE_INCREASE = 0.5
+DEFAULT_RATE_DECREASE_FACTOR = 0.5
+# Used when a 429 carries no usable Retry-After header.
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+class RateLimiter:
+    """Thread-safe adaptive token bucket.
+
+    Args:
+        rate: Initial rate in requests per second.
+        burst: Bucket capacity, i.e. how many requests may be sent back to back
+            after an idle period. Defaults to ``rate`` rounded up.
+        min_rate: Lower bound the rate is never decreased below.
+        max_rate: Upper bound the rate is never increased above.
+        increase: Requests per second added to the rate for every success.
+        decrease_factor: Factor the rate is multiplied by on a 429.
+        clock: Monotonic clock, overridable for tests.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int | None = None,
+        min_rate: float = DEFAULT_MIN_RATE,
+        max_rate: float = DEFAULT_MAX_RATE,
+        increase: float = DEFAULT_RATE_INCREASE,
+        decrease_factor: float = DEFAULT_RATE_DECREASE_FACTOR,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0 or min_rate <= 0 or max_rate < min_rate:
+            raise ValueError("Rates must be positive and max_rate must be >= min_rate.")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1.")
+
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate = min(max(rate, min_rate), max_rate)
+        self.burst = burst or math.ceil(rate)
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Theoretical arrival time of the next request at the current rate: the
+        # bucket is full whenever it lies in the past.
+        self._next_arrival = clock()
+        self._last_decrease = float("-inf")
+
+    def reserve(self) -> float:
+        """Claim a slot for one request.
+
+        Returns:
+            How many seconds the caller must wait before sending it. Reserving
+            does not block, so threads can ``time.sleep`` and coroutines can
+            ``asyncio.sleep`` on the same limiter.
+        """
+        with self._lock:
+            now = self._clock()
+            next_arrival = max(self._next_arrival, now)
+            send_at = max(now, next_arrival - (self.burst - 1) / self.rate)
+            self._next_arrival = next_arrival + 1 / self.rate
+            return send_at - now
+
+    def acquire(self) -> None:
+        """Block the calling thread until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def on_success(self) -> None:
+        """Additively increase the rate after a successful response."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_rate_limited(self, retry_after: float | None = None) -> None:
+        """Back off after a 429 response.
+
+        The rate is decreased at most once per ``retry_after`` window (and at most
+        once a second), so a burst of 429s from requests that were already in
+        flight counts as one signal.
+
+        Args:
+            retry_after: Seconds from the ``Retry-After`` header, if any.
+        """
+        if retry_after is None:
+            retry_after = DEFAULT_RETRY_AFTER_SECONDS
+        with self._lock:
+            now = self._clock()
+            if now - self._last_decrease >= max(retry_after, DEFAULT_RETRY_AFTER_SECONDS):
+                self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+                self._last_decrease = now
+            # Empty the bucket: the next request is sent once Retry-After has
+            # passed, and the ones after it are spaced at the new rate.
+            resume_at = now + retry_after + (self.burst - 1) / self.rate
+            self._next_arrival = max(self._next_arrival, resume_at)
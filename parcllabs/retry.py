@@ -0,0 +1,105 @@
+"""Retry policy applied to every request a client makes.
+
+A single ``RetryPolicy`` is owned by ``ParclLabsClient`` and consulted by
+``ParclLabsService._make_request`` (and its async counterpart), so v1 metric
+requests, pagination, property events batches, parcl_property_id chunks and
+v2 pages all recover from the same transient failures in the same way:
+
+    from parcllabs import ParclLabsClient, RetryPolicy
+
+    client = ParclLabsClient(api_key, retry_policy=RetryPolicy(max_attempts=5, deadline=600))
+"""
+
+import random
+
+from parcllabs.common import GET_METHOD, POST_METHOD
+
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_BACKOFF_SECONDS = 1.0
+DEFAULT_MAX_BACKOFF_SECONDS = 30.0
+DEFAULT_DEADLINE_SECONDS = 300.0
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Every POST endpoint of the Parcl Labs API is a read-only search, so POSTs are
+# as safe to repeat as GETs.
+IDEMPOTENT_METHODS = frozenset({GET_METHOD, POST_METHOD})
+
+
+class RetryPolicy:
+    """When and how long to wait before re-sending a failed request.
+
+    Connection errors, timeouts and responses with a status in ``retry_statuses``
+    are retried; every other error is raised immediately.
+
+    Args:
+        max_attempts: Total attempts per request, including the first.
+        backoff: Base delay in seconds. Attempt ``n`` waits a random time up to
+            ``backoff * 2 ** (n - 1)`` ("full jitter"), so threads that failed
+            together do not retry together.
+        max_backoff: Upper bound on a single delay.
+        deadline: Seconds after the first attempt past which no retry is started,
+            or ``None`` for no limit.
+        retry_statuses: HTTP status codes worth retrying.
+        idempotent_methods: HTTP methods that are safe to send more than once.
+            Requests using any other method are never retried.
+        jitter: Set to False for deterministic delays.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff: float = DEFAULT_BACKOFF_SECONDS,
+        max_backoff: float = DEFAULT_MAX_BACKOFF_SECONDS,
+        deadline: float | None = DEFAULT_DEADLINE_SECONDS,
+        retry_statuses: frozenset[int] = RETRYABLE_STATUS_CODES,
+        idempotent_methods: frozenset[str] = IDEMPOTENT_METHODS,
+        jitter: bool = True,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(idempotent_methods)
+        self.jitter = jitter
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        """A policy that sends every request exactly once."""
+        return cls(max_attempts=1)
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        elapsed: float,
+        retry_after: float | None = None,
+    ) -> float | None:
+        """Decide whether to retry after a failed attempt.
+
+        Args:
+            method: HTTP method of the request.
+            attempt: Number of the attempt that just failed, starting at 1.
+            elapsed: Seconds since the first attempt was sent.
+            retry_after: Delay requested by the API's ``Retry-After`` header.
+
+        Returns:
+            Seconds to wait before the next attempt, or ``None`` to give up.
+        """
+        if method not in self.idempotent_methods or attempt >= self.max_attempts:
+            return None
+
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)  # noqa: S311 (not used for security)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
@@ -0,0 +1,156 @@
+"""Build pyarrow Tables straight from JSON response pages.
+
+Used by ``retrieve_arrow``: records go from the decoded JSON into Arrow arrays
+without a pandas DataFrame in between, and the resulting Table can be handed to
+DuckDB, Polars or a Parquet writer without copying.
+"""
+
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+
+from parcllabs.common import DATE_COLUMNS, ID_COLUMNS
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # only retrieve_arrow needs pyarrow; it raises a clear error
+    pa = None
+    pc = None
+
+ARROW_CAST_ERRORS = () if pa is None else (pa.ArrowInvalid, pa.ArrowTypeError)
+
+
+def require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "Arrow results require pyarrow. Install it with `pip install parcllabs[arrow]`."
+        )
+
+
+class TableBuilder:
+    """Collect batches of records (one batch per page) into a single Table.
+
+    The schema is inferred from the first batch and reused for every later one,
+    so most pages are converted without inference. A batch whose values do not
+    fit the schema (for example a column that was all-null so far) is inferred
+    on its own and the schema is widened to cover both. Keys that are not in
+    the first batch are ignored, as columns missing from some chunks are in the
+    DataFrame results.
+    """
+
+    def __init__(self) -> None:
+        self.schema: pa.Schema | None = None
+        self._tables: list[pa.Table] = []
+
+    def append(self, records: list[dict], constants: Mapping[str, Any] | None = None) -> None:
+        """Add a batch of records, plus columns holding the same value on every row."""
+        if not records:
+            return
+
+        if self.schema is None:
+            table = pa.Table.from_pylist(records)
+            self.schema = table.schema
+        else:
+            try:
+                table = pa.Table.from_pylist(records, schema=self.schema)
+            except ARROW_CAST_ERRORS:
+                inferred = pa.Table.from_pylist(records).schema
+                known = pa.schema([field for field in inferred if field.name in self.schema.names])
+                self.schema = pa.unify_schemas([self.schema, known], promote_options="permissive")
+                table = pa.Table.from_pylist(records, schema=self.schema)
+
+        for name, value in (constants or {}).items():
+            table = table.append_column(name, pa.repeat(value, table.num_rows))
+        self._tables.append(table)
+
+    def finish(self) -> "pa.Table":
+        if not self._tables:
+            return pa.table({})
+        return pa.concat_tables(self._tables, promote_options="permissive")
+
+
+def flatten_table(table: "pa.Table", sep: str = "_") -> "pa.Table":
+    """Flatten struct columns recursively, naming children ``parent{sep}child``."""
+    while any(pa.types.is_struct(field.type) for field in table.schema):
+        table = table.flatten()
+    return table.rename_columns([name.replace(".", sep) for name in table.column_names])
+
+
+def explode_list_column(table: "pa.Table", column: str) -> tuple["pa.Table", "pa.Array"]:
+    """Repeat each row of ``table`` once per element of its list ``column``.
+
+    Returns the table without ``column``, with one row per element (rows whose
+    list is empty or null are kept once), and the elements aligned to those
+    rows, null where a row had no elements.
+    """
+    lists = table.column(column).combine_chunks()
+    table = table.drop_columns([column])
+    counts = pc.fill_null(pc.list_value_length(lists), 0).to_numpy(zero_copy_only=False)
+    rows_per_row = np.maximum(counts, 1)
+
+    parent_rows = np.repeat(np.arange(len(counts)), rows_per_row)
+    element_rows = np.full(len(parent_rows), -1)
+    element_rows[np.repeat(counts > 0, rows_per_row)] = np.arange(counts.sum())
+
+    elements = pc.list_flatten(lists)
+    indices = pa.array(element_rows, mask=element_rows < 0)
+    return table.take(pa.array(parent_rows)), elements.take(indices)
+
+
+def add_flattened_column(table: "pa.Table", name: str, values: "pa.Array") -> "pa.Table":
+    """Append ``values`` as flattened ``{name}_...`` columns.
+
+    Columns of ``table`` with the same names are replaced. Values that are not
+    structs (for example all-null) add nothing.
+    """
+    if not pa.types.is_struct(values.type):
+        return table
+
+    flattened = flatten_table(pa.table({name: values}))
+    table = table.drop_columns([col for col in flattened.column_names if col in table.column_names])
+    for col, column in zip(flattened.column_names, flattened.columns, strict=True):
+        table = table.append_column(col, column)
+    return table
+
+
+def is_arrow_table(value: object) -> bool:
+    return pa is not None and isinstance(value, pa.Table)
+
+
+def count_distinct(column: "pa.ChunkedArray") -> int:
+    """Number of distinct non-null values in ``column``."""
+    return pc.count_distinct(column).as_py()
+
+
+def format_table(table: "pa.Table") -> "pa.Table":
+    """Arrow counterpart of ``safe_concat_and_format_dtypes``'s clean-up.
+
+    Drops columns that are entirely null or entirely blank text, parses date
+    columns and moves the ID and date columns first.
+    """
+    keep = [
+        name
+        for name in table.column_names
+        if not _is_empty_column(table.column(name), table.num_rows)
+    ]
+    table = table.select(keep)
+
+    for col in DATE_COLUMNS:
+        if col in table.column_names and pa.types.is_string(table.schema.field(col).type):
+            dates = pc.strptime(table.column(col), format="%Y-%m-%d", unit="ns", error_is_null=True)
+            table = table.set_column(table.column_names.index(col), col, dates)
+
+    leading = [next((col for col in ID_COLUMNS if col in table.column_names), None)]
+    leading.append(next((col for col in ["date", "event_date"] if col in table.column_names), None))
+    leading = [col for col in leading if col is not None]
+    return table.select(leading + [col for col in table.column_names if col not in leading])
+
+
+def _is_empty_column(column: "pa.ChunkedArray", num_rows: int) -> bool:
+    if column.null_count == num_rows:
+        return True
+    if not pa.types.is_string(column.type) or column.null_count:
+        return False
+    return bool(pc.all(pc.equal(pc.utf8_trim_whitespace(column), "")).as_py())
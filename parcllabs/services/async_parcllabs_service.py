@@ -0,0 +1,494 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
+from functools import partial
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+from requests.exceptions import RequestException
+
+from parcllabs.common import GET_METHOD, POST_METHOD
+from parcllabs.enums import ResponseCodes
+from parcllabs.exceptions import NotFoundError
+from parcllabs.services.arrow_utils import require_pyarrow
+from parcllabs.services.parcllabs_service import ParclLabsService
+
+try:
+    import httpx
+except ImportError:  # only AsyncParclLabsClient needs httpx; it raises a clear error
+    httpx = None
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from parcllabs.store import LocalStore
+
+
+class AsyncParclLabsService(ParclLabsService):
+    """
+    Asyncio counterpart of ParclLabsService.
+
+    Request preparation, validation and DataFrame construction are inherited from
+    ParclLabsService; only the I/O methods are overridden with coroutines. Requests
+    are sent through the client's ``httpx.AsyncClient`` and bounded by the client's
+    request semaphore, so chunks, pages and per-parcl_id requests can all be
+    gathered without exceeding ``max_concurrency`` in-flight requests.
+
+    Subclasses of the synchronous services inherit this behaviour by listing their
+    synchronous class first, e.g. ``class AsyncPropertyTypeService(PropertyTypeService,
+    AsyncParclLabsService)``: the synchronous ``retrieve`` prepares parameters and
+    then returns the coroutine produced by the async method it delegates to.
+
+    The client's ``response_cache`` and ``store`` are SQLite or DuckDB files, so
+    their reads and writes run in a worker thread (``asyncio.to_thread``) rather
+    than blocking the event loop.
+    """
+
+    _body_argument = "content"
+
+    async def _make_request(self, method: str, url: str, **kwargs: dict) -> "httpx.Response":
+        """
+        Generic coroutine to make HTTP requests and handle errors.
+
+        Args:
+            method (str): The HTTP method ('GET' or 'POST').
+            url (str): The URL endpoint to request.
+            **kwargs: Additional arguments to pass to the request method.
+
+        Returns:
+            httpx.Response: The response object.
+
+        Raises:
+            RequestException: If the request fails or an unexpected error occurs.
+        """
+        single_flight = self.client.single_flight
+        if single_flight is None:
+            return await self._send_with_retries(method, url, **kwargs)
+
+        response, shared = await single_flight.do_async(
+            self._flight_key(method, url, kwargs),
+            partial(self._send_with_retries, method, url, **kwargs),
+        )
+        return self._shared_response(method, url, response) if shared else response
+
+    async def _send_with_retries(self, method: str, url: str, **kwargs: dict) -> "httpx.Response":
+        # httpx replaces a URL's query string with ``params`` instead of merging
+        # them as requests does; merge explicitly so pagination links keep their
+        # offset.
+        cache_key, cached = await self._cache_io(self._cache_lookup, method, url, kwargs)
+        if cached is not None and cached.fresh:
+            return self._cached_response(method, url, cached)
+        params = kwargs.pop("params", None)
+        if params:
+            url = httpx.URL(url).copy_merge_params(params)
+        kwargs, uncompressed_body_size = self._compress_body(kwargs)
+        kwargs = self._with_validators(kwargs, cached)
+
+        retry_policy = self.client.retry_policy
+        started = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                response = await self._send(method, url, **kwargs)
+            except httpx.TransportError as err:
+                delay = retry_policy.retry_delay(method, attempt, time.monotonic() - started)
+                if delay is None:
+                    raise RequestException(f"Request failed: {err!s}") from err
+            except httpx.HTTPError as err:
+                raise RequestException(f"Request failed: {err!s}") from err
+            else:
+                delay = self._response_retry_delay(method, response, attempt, started)
+                if delay is None:
+                    return await self._cache_io(
+                        self._final_response,
+                        method,
+                        url,
+                        response,
+                        uncompressed_body_size,
+                        cache_key,
+                        cached,
+                    )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _cache_io(self, func: Callable[..., Any], *args: object) -> Any:  # noqa: ANN401
+        """Call ``func``, in a worker thread when it may read or write the response cache."""
+        if self.client.response_cache is None:
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+
+    def _record_page_credits(self, pages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Record the credits of ``pages`` and return the pages without ``account``.
+
+        Frames built from the returned pages in a worker thread then leave the
+        client's credit count, which is updated without a lock, alone.
+        """
+        for page in pages:
+            if page is not None:
+                self._update_account_info(page.get("account"))
+        return [
+            None if page is None else {k: v for k, v in page.items() if k != "account"}
+            for page in pages
+        ]
+
+    @staticmethod
+    def _build_response(
+        method: str, url: str, body: bytes, headers: dict[str, str]
+    ) -> "httpx.Response":
+        return httpx.Response(
+            ResponseCodes.SUCCESS.value,
+            headers=headers,
+            content=body,
+            request=httpx.Request(method, url),
+        )
+
+    @staticmethod
+    def _wire_sizes(response: "httpx.Response") -> tuple[int, int]:
+        return len(response.request.content), response.num_bytes_downloaded
+
+    async def _send(self, method: str, url: str, **kwargs: dict) -> "httpx.Response":
+        if self.client.rate_limiter is not None:
+            await asyncio.sleep(self.client.rate_limiter.reserve())
+        async with self.client.request_semaphore:
+            headers = {**self.headers, **kwargs.pop("headers", {})}
+            return await self.client.session.request(method, url, headers=headers, **kwargs)
+
+    def _raise_for_status(self, response: "httpx.Response") -> None:
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError:
+            self.error_handling(response)
+
+    async def _post(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+    ) -> "httpx.Response":
+        return await self._make_request(POST_METHOD, url, params=params, json=data)
+
+    async def _get(self, url: str, params: dict[str, Any] | None = None) -> "httpx.Response":
+        return await self._make_request(GET_METHOD, url, params=params)
+
+    async def _fetch(
+        self,
+        parcl_ids: list[int],
+        params: Mapping[str, Any] | None,
+        auto_paginate: bool = False,
+    ) -> object:
+        params = self._prepare_fetch_params(params)
+
+        if self.full_post_url:
+            params, data = self._build_post_request(parcl_ids, params)
+            return await self._fetch_post(params, data, auto_paginate)
+        if params.get("limit"):
+            params["limit"] = self._validate_limit(GET_METHOD, params["limit"])
+
+        if len(parcl_ids) == 1:
+            url = self.full_url.format(parcl_id=parcl_ids[0])
+            return await self._fetch_get(url, params, auto_paginate)
+        return await self._fetch_get_many_parcl_ids(parcl_ids, params, auto_paginate)
+
+    async def _fetch_get_many_parcl_ids(
+        self, parcl_ids: list[int], params: dict[str, Any], auto_paginate: bool
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch every parcl_id concurrently, skipping parcl_ids with no data.
+
+        Results are returned in the order of the input parcl_ids.
+        """
+
+        async def fetch_one(parcl_id: int) -> dict[str, Any] | None:
+            try:
+                url = self.full_url.format(parcl_id=parcl_id)
+                return await self._fetch_get(url, params, auto_paginate)
+            except NotFoundError:
+                return None
+
+        results = await asyncio.gather(*(fetch_one(parcl_id) for parcl_id in parcl_ids))
+        return [result for result in results if result is not None]
+
+    async def _fetch_post(
+        self,
+        params: dict[str, Any],
+        data: dict[str, Any],
+        auto_paginate: bool,
+    ) -> object:
+        response = await self._post(self.full_post_url, params=params, data=data)
+        return await self._process_and_paginate_response(
+            response,
+            auto_paginate,
+            original_params=params,
+            data=data,
+            referring_method="post",
+        )
+
+    async def _fetch_get(self, url: str, params: dict[str, Any], auto_paginate: bool) -> object:
+        response = await self._get(url, params=params)
+        return await self._process_and_paginate_response(
+            response, auto_paginate, original_params=params, referring_method="get"
+        )
+
+    async def _process_and_paginate_response(
+        self,
+        response: "httpx.Response",
+        auto_paginate: bool,
+        original_params: dict[str, Any],
+        data: dict[str, Any] | None = None,
+        referring_method: str = "get",
+    ) -> object:
+        if response.status_code == ResponseCodes.NOT_FOUND.value:
+            return None
+        result = response.json()
+
+        if auto_paginate and "links" in result and result["links"].get("next") is not None:
+            page_urls = self._plan_page_urls(result)
+            if page_urls is None:
+                return await self._follow_next_links(
+                    result, original_params, data, referring_method
+                )
+
+            async def fetch_page(page_url: str) -> dict[str, Any]:
+                return await self._fetch_page_url(page_url, original_params, data, referring_method)
+
+            all_items = result["items"]
+            for page in await asyncio.gather(*(fetch_page(url) for url in page_urls)):
+                all_items.extend(page["items"])
+                result = page
+            result["items"] = all_items
+
+        return result
+
+    async def _follow_next_links(
+        self,
+        result: dict[str, Any],
+        original_params: dict[str, Any],
+        data: dict[str, Any] | None,
+        referring_method: str,
+    ) -> dict[str, Any]:
+        all_items = result["items"]
+        while result["links"].get("next") is not None:
+            next_url = result["links"]["next"]
+            result = await self._fetch_page_url(next_url, original_params, data, referring_method)
+            all_items.extend(result["items"])
+        result["items"] = all_items
+        return result
+
+    async def _fetch_page_url(
+        self,
+        url: str,
+        original_params: dict[str, Any],
+        data: dict[str, Any] | None,
+        referring_method: str,
+    ) -> dict[str, Any]:
+        if referring_method == "post":
+            response = await self._post(url, data=data, params=original_params)
+        else:
+            response = await self._get(url, params=original_params)
+        return response.json()
+
+    async def iter_pages(
+        self,
+        parcl_ids: list[int],
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int | None = None,
+        params: Mapping[str, Any] | None = None,
+        auto_paginate: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Asynchronous generator counterpart of ``ParclLabsService.iter_pages``; use
+        with ``async for``. At most ``max_concurrency`` pages are fetched ahead.
+        """
+        params = self._prepare_retrieve_params(start_date, end_date, limit, params)
+        for chunk in self._chunk_parcl_ids(parcl_ids):
+            async for page in self._iter_chunk_pages(chunk, params, auto_paginate):
+                yield page
+
+    async def iter_frames(
+        self,
+        parcl_ids: list[int],
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int | None = None,
+        params: Mapping[str, Any] | None = None,
+        auto_paginate: bool = False,
+    ) -> AsyncIterator[pd.DataFrame]:
+        async for page in self.iter_pages(
+            parcl_ids, start_date, end_date, limit, params, auto_paginate=auto_paginate
+        ):
+            frame = self._as_pd_dataframe([page])
+            if len(frame):
+                yield frame
+
+    async def _iter_chunk_pages(
+        self, parcl_ids: list[int], params: Mapping[str, Any], auto_paginate: bool
+    ) -> AsyncIterator[dict[str, Any]]:
+        params = self._prepare_fetch_params(params)
+        if self.full_post_url:
+            params, data = self._build_post_request(parcl_ids, params)
+            page_requests = [(self.full_post_url, params, data, "post")]
+        else:
+            if params.get("limit"):
+                params["limit"] = self._validate_limit(GET_METHOD, params["limit"])
+            page_requests = [
+                (self.full_url.format(parcl_id=parcl_id), params, None, "get")
+                for parcl_id in parcl_ids
+            ]
+
+        async def fetch_first_page(page_request: tuple) -> dict[str, Any] | None:
+            try:
+                return await self._fetch_page_url(*page_request)
+            except NotFoundError:
+                return None
+
+        first_pages = self._imap(fetch_first_page, page_requests)
+        for _, request_params, data, method in page_requests:
+            first_page = await anext(first_pages)
+            if first_page is not None:
+                async for page in self._iter_request_pages(
+                    first_page, request_params, data, method, auto_paginate
+                ):
+                    yield page
+
+    async def _iter_request_pages(
+        self,
+        first_page: dict[str, Any],
+        original_params: dict[str, Any],
+        data: dict[str, Any] | None,
+        referring_method: str,
+        auto_paginate: bool,
+    ) -> AsyncIterator[dict[str, Any]]:
+        yield first_page
+        if not auto_paginate or (first_page.get("links") or {}).get("next") is None:
+            return
+
+        page_urls = self._plan_page_urls(first_page)
+        if page_urls is None:
+            page = first_page
+            while page["links"].get("next") is not None:
+                page = await self._fetch_page_url(
+                    page["links"]["next"], original_params, data, referring_method
+                )
+                yield page
+            return
+
+        async def fetch_page(page_url: str) -> dict[str, Any]:
+            return await self._fetch_page_url(page_url, original_params, data, referring_method)
+
+        async for page in self._imap(fetch_page, page_urls):
+            yield page
+
+    async def _imap(
+        self, func: Callable[[Any], Awaitable[Any]], items: Iterable[Any]
+    ) -> AsyncIterator[Any]:
+        """
+        Yield ``func(item)`` for each item in order, keeping at most
+        ``max_concurrency`` calls in flight or waiting to be consumed.
+        """
+        items = iter(items)
+        window = self.client.max_concurrency
+        pending = deque(asyncio.ensure_future(func(item)) for item in islice(items, window))
+        try:
+            while pending:
+                result = await pending.popleft()
+                pending.extend(asyncio.ensure_future(func(item)) for item in islice(items, 1))
+                yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def retrieve(
+        self,
+        parcl_ids: list[int],
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int | None = None,
+        params: Mapping[str, Any] | None = None,
+        auto_paginate: bool = False,
+    ) -> pd.DataFrame:
+        store = self.client.store
+        if store is None:
+            return self._as_pd_dataframe(
+                await self._retrieve_pages(
+                    parcl_ids, start_date, end_date, limit, params, auto_paginate
+                )
+            )
+
+        query = await asyncio.to_thread(
+            self._stored_query, store, parcl_ids, start_date, end_date, limit, params, auto_paginate
+        )
+        pages = []
+        if query["missing"]:
+            pages = await self._retrieve_pages(
+                query["missing"], start_date, end_date, limit, params, auto_paginate
+            )
+        return await asyncio.to_thread(
+            self._answer_from_store, store, query, parcl_ids, self._record_page_credits(pages)
+        )
+
+    async def retrieve_arrow(
+        self,
+        parcl_ids: list[int],
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int | None = None,
+        params: Mapping[str, Any] | None = None,
+        auto_paginate: bool = False,
+    ) -> "pa.Table":
+        require_pyarrow()
+        return self._as_arrow_table(
+            await self._retrieve_pages(
+                parcl_ids, start_date, end_date, limit, params, auto_paginate
+            )
+        )
+
+    async def retrieve_incremental(
+        self,
+        parcl_ids: list[int],
+        store: "LocalStore",
+        start_date: str | None = None,
+        end_date: str | None = None,
+        params: Mapping[str, Any] | None = None,
+        table: str | None = None,
+    ) -> pd.DataFrame:
+        table = table or self.store_table
+        dimensions = self._store_dimensions(params)
+        plan = await asyncio.to_thread(
+            self._plan_incremental, parcl_ids, store, table, dimensions, start_date, end_date
+        )
+        results = await asyncio.gather(
+            *(
+                self._retrieve_pages(chunk, start, end_date, None, params, True)
+                for start, chunk in plan
+            )
+        )
+        pages = [page for group in results for page in group]
+        frame = self._as_pd_dataframe(pages)
+        return await asyncio.to_thread(self._store_incremental, store, table, dimensions, frame)
+
+    async def _retrieve_pages(
+        self,
+        parcl_ids: list[int],
+        start_date: str | None,
+        end_date: str | None,
+        limit: int | None,
+        params: Mapping[str, Any] | None,
+        auto_paginate: bool,
+    ) -> list[dict[str, Any]]:
+        params = self._prepare_retrieve_params(start_date, end_date, limit, params)
+
+        async def fetch_chunk(chunk: list[int]) -> list:
+            try:
+                results = await self._fetch(chunk, dict(params), auto_paginate=auto_paginate)
+            except NotFoundError:
+                # sparse parcl_ids can result in no data found for a whole chunk
+                return []
+            return results if isinstance(results, list) else [results]
+
+        chunk_results = await asyncio.gather(
+            *(fetch_chunk(chunk) for chunk in self._chunk_parcl_ids(parcl_ids))
+        )
+        return [result for results in chunk_results for result in results]
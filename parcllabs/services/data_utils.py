@@ -1,29 +1,258 @@
+from collections.abc import Iterable, Mapping
+from typing import Any
+
 import numpy as np
 import pandas as pd
 
 from parcllabs.common import DATE_COLUMNS, ID_COLUMNS
+from parcllabs.enums import (
+    EntityNames,
+    EventTypes,
+    LocationTypes,
+    PortfolioSizes,
+    PropertyTypes,
+    PropertyTypesUnit,
+    USRegions,
+    USStateAbbreviations,
+    USStateFIPSCodes,
+    get_enum_values,
+)
+
+try:
+    import polars as pl
+except ImportError:  # only the polars backend needs polars; the client raises a clear error
+    pl = None
+
+# Types pandas infers for object columns that cannot hold nested records.
+SCALAR_INFERRED_TYPES = frozenset({"string", "bytes", "date", "datetime", "decimal", "empty"})
 
+# Text columns backed by an enum. compact_dtypes makes them categoricals whose
+# categories start with the enum's values, so frames from separate calls share a
+# dtype and concatenate without falling back to object.
+ENUM_COLUMNS = {
+    "property_type": list(
+        dict.fromkeys([*get_enum_values(PropertyTypes), *get_enum_values(PropertyTypesUnit)])
+    ),
+    "event_type": get_enum_values(EventTypes),
+    "location_type": get_enum_values(LocationTypes),
+    "region": get_enum_values(USRegions),
+    "state_abbreviation": get_enum_values(USStateAbbreviations),
+    "state_fips_code": get_enum_values(USStateFIPSCodes),
+    "portfolio_size": get_enum_values(PortfolioSizes),
+    "entity_owner_name": get_enum_values(EntityNames),
+}
+# Text columns with few distinct values but no enum of their own.
+CATEGORICAL_COLUMNS = frozenset({"event_name"})
+COMPACT_DTYPES_BYTES_SAVED = "compact_dtypes_bytes_saved"
+# Integers are not downcast below int32: counts and prices summed or multiplied
+# in int8/int16 would silently overflow.
+MIN_COMPACT_INTEGER = np.iinfo(np.int32)
 
-def _process_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    """Process a single DataFrame to handle empty values and columns."""
-    # Select only common columns
-    processed_df = df.copy()
+PANDAS_BACKEND = "pandas"
+POLARS_BACKEND = "polars"
+DATAFRAME_BACKENDS = (PANDAS_BACKEND, POLARS_BACKEND)
 
-    # Remove columns that are entirely NA
-    processed_df = processed_df.dropna(axis=1, how="all")
 
-    # For columns that are all empty strings, replace with NaN
-    for col in processed_df.columns:
+def flatten_records(records: list[dict], sep: str = "_") -> pd.DataFrame:
+    """Flatten a list of (possibly nested) dicts into a DataFrame.
+
+    Produces the same columns as ``pd.json_normalize(records, sep=sep)`` (a nested
+    ``{"a": {"b": 1}}`` becomes column ``a_b``), but builds the frame column-wise:
+    records are loaded with the DataFrame constructor and only the object columns
+    that actually hold dicts are expanded, recursively.
+    """
+    frame = pd.DataFrame(records)
+    flattened = []
+    expanded = []
+    for column in frame.columns:
+        values = frame[column]
         if (
-            processed_df[col].dtype == object
-            and processed_df[col].astype(str).str.strip().eq("").all()
+            values.dtype != object
+            or pd.api.types.infer_dtype(values, skipna=True) in SCALAR_INFERRED_TYPES
+        ):
+            flattened.append(values)
+            continue
+
+        is_nested = values.map(lambda value: isinstance(value, dict)).to_numpy(dtype=bool)
+        if not is_nested.any():
+            flattened.append(values)
+            continue
+
+        # Like json_normalize, keep the plain column when some record holds a
+        # non-dict value for it, including an explicit None (a missing key is NaN).
+        if any(
+            not nested and (value is None or not _is_missing(value))
+            for value, nested in zip(values, is_nested, strict=True)
         ):
-            processed_df[col] = np.nan
+            remainder = values.mask(is_nested)
+            flattened.append(remainder.astype(float) if remainder.isna().all() else remainder)
+
+        nested = flatten_records(
+            [value if nested else {} for value, nested in zip(values, is_nested, strict=True)], sep
+        )
+        expanded.extend(nested[name].rename(f"{column}{sep}{name}") for name in nested.columns)
+
+    columns = flattened + expanded
+    if not columns:
+        return pd.DataFrame(index=frame.index)
+    flat = pd.concat(columns, axis=1)
+    if not expanded:
+        return flat
+    return flat[_first_seen_order(records, flat.columns, sep)]
+
+
+def _is_missing(value: object) -> bool:
+    return isinstance(value, float) and np.isnan(value)
+
+
+def _flattened_keys(record: Mapping[str, Any], sep: str, prefix: str = "") -> Iterable[str]:
+    # Like json_normalize, a record's nested keys follow its plain ones.
+    nested = []
+    for key, value in record.items():
+        if isinstance(value, dict):
+            nested.append((key, value))
+        else:
+            yield f"{prefix}{key}"
+    for key, value in nested:
+        yield from _flattened_keys(value, sep, f"{prefix}{key}{sep}")
+
+
+def _first_seen_order(records: list[dict], columns: Iterable[str], sep: str) -> list[str]:
+    """``columns`` in the order ``json_normalize`` gives them, first seen across ``records``.
+
+    Records are scanned only until every column has been seen, which for API
+    records that always carry the same keys is the first one.
+    """
+    remaining = set(columns)
+    order = []
+    for record in records:
+        if not remaining:
+            break
+        for name in _flattened_keys(record, sep):
+            if name in remaining:
+                remaining.discard(name)
+                order.append(name)
+    return order + [name for name in columns if name in remaining]
+
+
+def compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Return ``df`` with smaller dtypes.
+
+    * enum-backed text columns (see ``ENUM_COLUMNS``, also matched as a suffix,
+      e.g. ``event_event_type``) and ``CATEGORICAL_COLUMNS`` become categoricals;
+    * ``parcl_id`` and ``parcl_property_id`` become nullable ``Int64``, so missing
+      values no longer turn them into floats;
+    * other integers are downcast to int32 when they fit (never smaller, so
+      arithmetic on them does not overflow), and floats to float32 when that
+      loses no precision.
+
+    The number of bytes saved is stored in
+    ``df.attrs["compact_dtypes_bytes_saved"]``.
+    """
+    before = df.memory_usage(deep=True).sum()
+    compacted = pd.DataFrame(
+        {column: _compact_column(column, df[column]) for column in df.columns}, index=df.index
+    )
+    compacted.attrs = {
+        **df.attrs,
+        COMPACT_DTYPES_BYTES_SAVED: int(before - compacted.memory_usage(deep=True).sum()),
+    }
+    return compacted
+
+
+def _categories_for(column: str) -> list[str] | None:
+    """Known categories of a text column, [] if unknown, None if not categorical."""
+    for name, values in ENUM_COLUMNS.items():
+        if column == name or column.endswith(f"_{name}"):
+            return values
+    if any(column == name or column.endswith(f"_{name}") for name in CATEGORICAL_COLUMNS):
+        return []
+    return None
 
-    # Remove columns that became all NaN after replacing empty strings
-    processed_df = processed_df.dropna(axis=1, how="all")
 
-    return processed_df
+def _compact_column(column: str, values: pd.Series) -> pd.Series:
+    if column in ID_COLUMNS:
+        return _compact_id(values)
+    if _is_text(values):
+        return _compact_text(column, values)
+    if pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values):
+        return _compact_number(values)
+    return values
+
+
+def _compact_id(values: pd.Series) -> pd.Series:
+    """Nullable Int64 for integral IDs, including IDs held as objects."""
+    numbers = values
+    if not pd.api.types.is_numeric_dtype(values.dtype):
+        numbers = pd.to_numeric(values, errors="coerce")
+        if numbers.isna().sum() != values.isna().sum():
+            return values
+    if pd.api.types.is_numeric_dtype(numbers.dtype) and _is_integral(numbers):
+        return numbers.astype("Int64")
+    return values
+
+
+def _compact_text(column: str, values: pd.Series) -> pd.Series:
+    """Categorical for known enum-backed and repeated text columns."""
+    categories = _categories_for(column)
+    if categories is None:
+        return values
+    known = set(categories)
+    observed = sorted((value for value in values.dropna().unique() if value not in known), key=str)
+    return values.astype(pd.CategoricalDtype([*categories, *observed]))
+
+
+def _compact_number(values: pd.Series) -> pd.Series:
+    """int32 for integers that fit, or float32 when it loses no precision."""
+    if pd.api.types.is_integer_dtype(values.dtype):
+        if values.dtype.itemsize <= MIN_COMPACT_INTEGER.bits // 8 or not _fits_int32(
+            values.min(), values.max()
+        ):
+            return values
+        nullable = isinstance(values.dtype, pd.api.extensions.ExtensionDtype)
+        return values.astype("Int32" if nullable else np.int32)
+    if pd.api.types.is_float_dtype(values.dtype) and values.dtype != np.float32:
+        downcast = values.astype(np.float32)
+        if np.array_equal(
+            downcast.to_numpy(np.float64), values.to_numpy(np.float64), equal_nan=True
+        ):
+            return downcast
+    return values
+
+
+def _fits_int32(low: object, high: object) -> bool:
+    """True if integers from ``low`` to ``high`` fit in int32 (False when all missing)."""
+    if pd.isna(low) or pd.isna(high):
+        return False
+    return MIN_COMPACT_INTEGER.min <= low and high <= MIN_COMPACT_INTEGER.max
+
+
+def _is_text(values: pd.Series) -> bool:
+    return values.dtype == object or pd.api.types.is_string_dtype(values.dtype)
+
+
+def _is_integral(values: pd.Series) -> bool:
+    present = values.dropna()
+    return bool((present == np.floor(present)).all())
+
+
+def _is_blank_column(values: pd.Series) -> bool:
+    """True if every value is a whitespace-only string."""
+    return all(isinstance(value, str) and not value.strip() for value in values)
+
+
+def _is_empty_column(values: pd.Series) -> bool:
+    """True if a column holds no data: every value is missing, or blank text.
+
+    Almost every real column is decided by its first value, so text columns are
+    never cast to ``str`` as a whole and populated columns are never scanned.
+    """
+    first = values.iloc[0]
+    if isinstance(first, str):
+        return not first.strip() and _is_blank_column(values)
+    if pd.api.types.is_scalar(first) and not pd.isna(first):
+        return False
+    return bool(values.isna().all())
 
 
 def _reorder_columns(output: pd.DataFrame, original_columns: list) -> pd.DataFrame:
@@ -48,10 +277,19 @@ def _reorder_columns(output: pd.DataFrame, original_columns: list) -> pd.DataFra
         if col in output.columns and col not in final_columns:
             final_columns.append(col)
 
+    if list(output.columns) == final_columns:
+        return output
     return output[final_columns]
 
 
 def safe_concat_and_format_dtypes(data_container: list) -> pd.DataFrame:
+    """Concatenate chunk DataFrames into one, dropping columns that hold no data.
+
+    Only columns present in every non-empty chunk are kept. Within each chunk, a
+    column that is entirely missing or entirely blank text is treated as absent,
+    so its rows come out as NaN, and a column that is absent from every chunk is
+    dropped. Chunks are selected without copying and concatenated once.
+    """
     # Filter out empty DataFrames
     non_empty_dfs = [df for df in data_container if not df.empty]
 
@@ -62,22 +300,24 @@ def safe_concat_and_format_dtypes(data_container: list) -> pd.DataFrame:
     # Get the column order from the first non-empty DataFrame
     original_columns = non_empty_dfs[0].columns.tolist()
 
-    # Find common columns across all non-empty DataFrames
-    common_columns = list(set.intersection(*[set(df.columns) for df in non_empty_dfs]))
+    # Find common columns across all non-empty DataFrames, in the original order
+    other_columns = [set(df.columns) for df in non_empty_dfs[1:]]
+    common_columns = [
+        col for col in original_columns if all(col in columns for columns in other_columns)
+    ]
 
-    # Process each DataFrame
-    processed_dfs = []
+    # Keep each chunk's columns that hold data, without copying the chunk
+    chunks = []
     for df in non_empty_dfs:
-        common_cols_df = df[common_columns].copy()
-        processed_df = _process_dataframe(common_cols_df)
-        if not processed_df.empty:
-            processed_dfs.append(processed_df)
+        kept_columns = [col for col in common_columns if not _is_empty_column(df[col])]
+        if not kept_columns:
+            continue
+        chunks.append(df if df.columns.tolist() == kept_columns else df[kept_columns])
 
-    # Concatenate the processed DataFrames
-    if not processed_dfs:
-        return pd.DataFrame()  # Return an empty DataFrame if all processed DataFrames are empty
+    if not chunks:
+        return pd.DataFrame()  # Return an empty DataFrame if every chunk held no data
 
-    output = pd.concat(processed_dfs, axis=0, ignore_index=True)
+    output = pd.concat(chunks, axis=0, ignore_index=True)
 
     # Cast date columns to datetime
     for col in DATE_COLUMNS:
@@ -86,3 +326,238 @@ def safe_concat_and_format_dtypes(data_container: list) -> pd.DataFrame:
 
     # Reorder columns
     return _reorder_columns(output, original_columns)
+
+
+def validate_dataframe_backend(backend: str) -> str:
+    """Check that ``backend`` is a known DataFrame backend and is installed."""
+    if backend not in DATAFRAME_BACKENDS:
+        raise ValueError(
+            f"dataframe_backend must be one of {', '.join(DATAFRAME_BACKENDS)}, got {backend!r}."
+        )
+    if backend == POLARS_BACKEND and pl is None:
+        raise ImportError(
+            "The polars backend requires polars. Install it with `pip install parcllabs[polars]`."
+        )
+    return backend
+
+
+def get_frame_backend(backend: str) -> "PandasBackend | PolarsBackend":
+    """The backend object that builds frames for a ``dataframe_backend`` name."""
+    return POLARS if backend == POLARS_BACKEND else PANDAS
+
+
+def count_unique(values: "pd.Series | pl.Series") -> int:
+    """Number of distinct non-missing values in a pandas or Polars column."""
+    if isinstance(values, pd.Series):
+        return values.nunique()
+    return values.drop_nulls().n_unique()
+
+
+class PandasBackend:
+    """Builds the pandas DataFrames services return.
+
+    Services build their results through a backend object (see
+    ``get_frame_backend``), so the same code produces pandas or Polars frames.
+    ``PolarsBackend`` implements the same methods.
+    """
+
+    name = PANDAS_BACKEND
+
+    @staticmethod
+    def empty() -> pd.DataFrame:
+        return pd.DataFrame()
+
+    @staticmethod
+    def flatten_records(records: list[dict], sep: str = "_") -> pd.DataFrame:
+        return flatten_records(records, sep)
+
+    @staticmethod
+    def normalize_page(page: Mapping[str, Any]) -> pd.DataFrame:
+        """One row per entry of ``page["items"]``, plus the page's other fields."""
+        meta_fields = [k for k in page.keys() if k != "items"]
+        normalized_df = pd.json_normalize(page, record_path="items", meta=meta_fields)
+        normalized_df.columns = [c.replace(".", "_") for c in normalized_df.columns.tolist()]
+        return normalized_df
+
+    @staticmethod
+    def concat_and_format(frames: Iterable[pd.DataFrame]) -> pd.DataFrame:
+        return safe_concat_and_format_dtypes(frames)
+
+    @staticmethod
+    def take_rows(frame: pd.DataFrame, rows: np.ndarray) -> pd.DataFrame:
+        """Rows of ``frame`` by position, with -1 giving an all-missing row."""
+        if len(rows) and rows.min() < 0:
+            return frame.reindex(rows).reset_index(drop=True)
+        return frame.take(rows).reset_index(drop=True)
+
+    @staticmethod
+    def rename_columns(frame: pd.DataFrame, names: list[str]) -> pd.DataFrame:
+        frame.columns = names
+        return frame
+
+    @staticmethod
+    def concat_columns(left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
+        """Columns of ``left`` then ``right``; ``right`` wins on duplicate names."""
+        left = left.drop(columns=right.columns, errors="ignore")
+        return pd.concat([left, right], axis=1)
+
+    @staticmethod
+    def insert_first(frame: pd.DataFrame, name: str, values: np.ndarray) -> pd.DataFrame:
+        """Put ``values`` first as column ``name``, replacing any column of that name."""
+        frame = frame.drop(columns=name, errors="ignore")
+        frame.insert(0, name, values)
+        return frame
+
+    @staticmethod
+    def from_pandas(df: pd.DataFrame) -> pd.DataFrame:
+        return df
+
+    @staticmethod
+    def compact(df: pd.DataFrame) -> pd.DataFrame:
+        return compact_dtypes(df)
+
+
+class PolarsBackend:
+    """Builds Polars DataFrames natively, with the columns the pandas backend produces."""
+
+    name = POLARS_BACKEND
+
+    @staticmethod
+    def empty() -> "pl.DataFrame":
+        return pl.DataFrame()
+
+    @staticmethod
+    def flatten_records(records: list[dict], sep: str = "_") -> "pl.DataFrame":
+        """Polars counterpart of ``flatten_records``.
+
+        Struct columns are unnested recursively into ``parent{sep}child``
+        columns, in the first-seen order ``json_normalize`` gives them.
+        """
+        if not records:
+            return pl.DataFrame()
+        frame = pl.from_dicts(records, infer_schema_length=None, strict=False)
+        structs = [name for name, dtype in frame.schema.items() if dtype == pl.Struct]
+        if not structs:
+            return frame
+        while structs:
+            frame = frame.unnest(structs, separator=sep)
+            structs = [name for name, dtype in frame.schema.items() if dtype == pl.Struct]
+        return frame.select(_first_seen_order(records, frame.columns, sep))
+
+    @classmethod
+    def normalize_page(cls, page: Mapping[str, Any]) -> "pl.DataFrame":
+        items = page.get("items") or []
+        if not items:
+            return pl.DataFrame()
+        frame = cls.flatten_records(items)
+        # A one-value Series infers dtypes as a column does (int -> Int64).
+        return frame.with_columns(
+            pl.lit(pl.Series(key, [value])).first() for key, value in page.items() if key != "items"
+        )
+
+    @staticmethod
+    def concat_and_format(frames: Iterable["pl.DataFrame"]) -> "pl.DataFrame":
+        """Polars counterpart of ``safe_concat_and_format_dtypes``."""
+        non_empty_dfs = [df for df in frames if df.height]
+        if not non_empty_dfs:
+            return pl.DataFrame()
+
+        original_columns = non_empty_dfs[0].columns
+        other_columns = [set(df.columns) for df in non_empty_dfs[1:]]
+        common_columns = [
+            col for col in original_columns if all(col in columns for columns in other_columns)
+        ]
+
+        chunks = []
+        for df in non_empty_dfs:
+            kept_columns = [col for col in common_columns if not _is_empty_polars(df[col])]
+            if kept_columns:
+                chunks.append(df.select(kept_columns))
+        if not chunks:
+            return pl.DataFrame()
+
+        output = pl.concat(chunks, how="diagonal_relaxed")
+        output = output.with_columns(
+            pl.col(col).str.to_datetime(time_unit="ns", strict=False)
+            for col in DATE_COLUMNS
+            if col in output.columns and output.schema[col] == pl.String
+        )
+        return _reorder_columns(output, original_columns)
+
+    @staticmethod
+    def take_rows(frame: "pl.DataFrame", rows: np.ndarray) -> "pl.DataFrame":
+        indices = pl.Series(rows).set(pl.Series(rows < 0), None)
+        return frame.select(pl.all().gather(indices))
+
+    @staticmethod
+    def rename_columns(frame: "pl.DataFrame", names: list[str]) -> "pl.DataFrame":
+        return frame.rename(dict(zip(frame.columns, names, strict=True)))
+
+    @staticmethod
+    def concat_columns(left: "pl.DataFrame", right: "pl.DataFrame") -> "pl.DataFrame":
+        left = left.drop(right.columns, strict=False)
+        return pl.concat([left, right], how="horizontal")
+
+    @staticmethod
+    def insert_first(frame: "pl.DataFrame", name: str, values: np.ndarray) -> "pl.DataFrame":
+        frame = frame.drop(name, strict=False)
+        return frame.insert_column(0, pl.Series(name, values))
+
+    @staticmethod
+    def from_pandas(df: pd.DataFrame) -> "pl.DataFrame":
+        """Convert frames that services still build with pandas."""
+        return pl.from_pandas(df) if isinstance(df, pd.DataFrame) else df
+
+    @staticmethod
+    def compact(df: "pl.DataFrame") -> "pl.DataFrame":
+        """Polars counterpart of ``compact_dtypes``.
+
+        Enum-backed text columns become ``pl.Enum`` and ``CATEGORICAL_COLUMNS``
+        ``pl.Categorical``; integers other than IDs and floats are shrunk as in
+        ``compact_dtypes``. Polars frames have no ``attrs``, so the bytes saved
+        are not reported.
+        """
+        return df.with_columns(_compact_polars_column(column, df[column]) for column in df.columns)
+
+
+PANDAS = PandasBackend()
+POLARS = PolarsBackend()
+
+
+def _compact_polars_column(column: str, values: "pl.Series") -> "pl.Series":
+    if values.dtype == pl.String:
+        return _compact_polars_text(column, values)
+    if column in ID_COLUMNS:
+        return values
+    if values.dtype.is_integer():
+        if values.dtype in (pl.Int64, pl.UInt64, pl.UInt32) and _fits_int32(
+            values.min(), values.max()
+        ):
+            return values.cast(pl.Int32)
+        return values
+    if values.dtype == pl.Float64:
+        downcast = values.cast(pl.Float32)
+        if downcast.cast(pl.Float64).equals(values):
+            return downcast
+    return values
+
+
+def _compact_polars_text(column: str, values: "pl.Series") -> "pl.Series":
+    """``pl.Enum`` for enum-backed columns, ``pl.Categorical`` for other repeated text."""
+    categories = _categories_for(column)
+    if categories is None:
+        return values
+    if not categories:
+        return values.cast(pl.Categorical)
+    known = set(categories)
+    observed = sorted(value for value in values.drop_nulls().unique() if value not in known)
+    return values.cast(pl.Enum([*categories, *observed]))
+
+
+def _is_empty_polars(values: "pl.Series") -> bool:
+    """Polars counterpart of ``_is_empty_column``."""
+    if values.null_count() == values.len():
+        return True
+    if values.dtype != pl.String or values.null_count():
+        return False
+    return bool(values.str.strip_chars().eq("").all())
@@ -0,0 +1,209 @@
+"""Local index of every market returned by ``/v1/search/markets``.
+
+The market universe (~70k rows) rarely changes, so with a ``MarketIndex`` on
+the client ``search.markets.retrieve`` downloads the full table once, keeps it
+on disk, and answers later searches from in-memory indexes without a request:
+
+    from parcllabs import MarketIndex, ParclLabsClient
+
+    index = MarketIndex("~/.cache/parcllabs/markets.json.gz", refresh_interval=7 * 86400)
+    client = ParclLabsClient(api_key, market_index=index)
+    client.search.markets.retrieve(query="Austin", location_type="CITY")
+"""
+
+import gzip
+import json
+import os
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from parcllabs.enums import RequestLimits, SortByParams, SortOrder
+
+DEFAULT_REFRESH_INTERVAL_SECONDS = 7 * 24 * 60 * 60
+# Filters matched exactly against a market field; "ALL" matches every market.
+CATEGORY_FIELDS = ("location_type", "region", "state_abbreviation", "state_fips_code")
+TRIGRAM_LENGTH = 3
+# Market field each API ``sort_by`` value orders on, and the API's default order.
+SORT_FIELDS = {sort_by.value: sort_by.value.lower() for sort_by in SortByParams}
+DEFAULT_SORT_ORDER = SortOrder.DESC.value
+
+
+class MarketIndex:
+    """Every market, indexed for the filters ``SearchMarkets.retrieve`` accepts.
+
+    Markets are indexed by ``parcl_id``, ``geoid``, each of ``CATEGORY_FIELDS``,
+    and their name: a sorted list of name words answers queries shorter than
+    three characters by prefix, and a trigram index answers longer ones by
+    substring. Query results that are not sorted list markets whose name starts
+    with the query first.
+
+    Args:
+        path: File the downloaded markets are kept in (gzipped JSON), so a new
+            process can load them instead of downloading. None keeps them in
+            memory only.
+        refresh_interval: Seconds after which the markets are downloaded again.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike | None = None,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL_SECONDS,
+    ) -> None:
+        self.path = Path(path).expanduser() if path is not None else None
+        self.refresh_interval = refresh_interval
+        self.downloaded_at: float | None = None
+        self.markets: list[dict[str, Any]] = []
+        self._by_parcl_id: dict[int, int] = {}
+        self._by_geoid: dict[str, list[int]] = {}
+        self._by_field: dict[str, dict[str, set[int]]] = {}
+        self._words: list[tuple[str, int]] = []
+        self._trigrams: dict[str, set[int]] = {}
+        self._names: list[str] = []
+        self._rankings: dict[tuple[str, bool], list[int]] = {}
+
+    def needs_refresh(self) -> bool:
+        """Whether the markets must be downloaded, after loading them from ``path``."""
+        if self.downloaded_at is None and self.path is not None and self.path.exists():
+            with gzip.open(self.path, "rt") as file:
+                saved = json.load(file)
+            self._build(saved["items"], saved["downloaded_at"])
+        if self.downloaded_at is None:
+            return True
+        return time.time() - self.downloaded_at >= self.refresh_interval
+
+    def update(self, markets: list[dict[str, Any]]) -> None:
+        """Replace the indexed markets with a fresh download, saving it to ``path``."""
+        self._build(markets, time.time())
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(self.path, "wt") as file:
+                json.dump({"downloaded_at": self.downloaded_at, "items": markets}, file)
+
+    def search(self, params: Mapping[str, Any], auto_paginate: bool = False) -> list[dict]:
+        """Markets matching ``SearchMarkets`` request ``params``, as the API orders them.
+
+        ``sort_by`` takes the API's ``SortByParams`` values (in any case) and
+        orders on the market field of the same name in lowercase, e.g.
+        ``TOTAL_POPULATION`` on ``total_population``; markets without a value come
+        last and ties keep table order. ``sort_order`` defaults to ``DESC``, as in
+        the API. Other ``sort_by`` or ``sort_order`` values raise ValueError, where
+        the API would reject the request. ``query`` matches names by word prefix
+        when it is shorter than three characters and by substring otherwise, so
+        relevance may differ from the API's. ``limit`` applies as the API's page
+        size does, defaulting to ``RequestLimits.DEFAULT``: without
+        ``auto_paginate`` only the first page is returned.
+        """
+        limit = None if auto_paginate else params.get("limit", RequestLimits.DEFAULT.value)
+        matches = self._filter(params)
+        sort_by = params.get("sort_by")
+        if sort_by:
+            field, descending = self._sort(sort_by, params.get("sort_order"))
+            ranking = self._ranking(field, descending)
+            rows = ranking if matches is None else (row for row in ranking if row in matches)
+            rows = list(islice(rows, limit))
+        else:
+            rows = list(range(len(self.markets))) if matches is None else sorted(matches)
+            query = str(params.get("query") or "").lower()
+            if query:
+                rows.sort(key=lambda row: not self._names[row].startswith(query))
+            rows = rows[:limit]
+        return [self.markets[row] for row in rows]
+
+    @staticmethod
+    def _sort(sort_by: str, sort_order: str | None) -> tuple[str, bool]:
+        """The market field and direction of an API ``sort_by``/``sort_order``."""
+        field = SORT_FIELDS.get(str(sort_by).upper())
+        if field is None:
+            raise ValueError(f"sort_by must be one of {', '.join(SORT_FIELDS)}, got {sort_by!r}.")
+        sort_order = str(sort_order or DEFAULT_SORT_ORDER).upper()
+        if sort_order not in {order.value for order in SortOrder}:
+            raise ValueError(f"sort_order must be ASC or DESC, got {sort_order!r}.")
+        return field, sort_order == SortOrder.DESC.value
+
+    def _filter(self, params: Mapping[str, Any]) -> set[int] | None:
+        """Rows matching every filter in ``params``, or None when there are none."""
+        candidates: list[set[int]] = []
+        if params.get("parcl_id"):
+            row = self._by_parcl_id.get(int(params["parcl_id"]))
+            candidates.append(set() if row is None else {row})
+        if params.get("geoid"):
+            candidates.append(set(self._by_geoid.get(str(params["geoid"]), ())))
+        for field in CATEGORY_FIELDS:
+            value = params.get(field)
+            if value and value != "ALL":
+                candidates.append(self._by_field[field].get(str(value).upper(), set()))
+        if params.get("query"):
+            candidates.append(self._match_name(str(params["query"]).lower()))
+
+        if not candidates:
+            return None
+        candidates.sort(key=len)
+        return set.intersection(*candidates)
+
+    def _match_name(self, query: str) -> set[int]:
+        if len(query) < TRIGRAM_LENGTH:
+            start = bisect_left(self._words, (query,))
+            rows = set()
+            for word, row in self._words[start:]:
+                if not word.startswith(query):
+                    break
+                rows.add(row)
+            return rows
+
+        postings = [self._trigrams.get(trigram, set()) for trigram in _trigrams(query)]
+        postings.sort(key=len)
+        return {row for row in set.intersection(*postings) if query in self._names[row]}
+
+    def _ranking(self, field: str, descending: bool) -> list[int]:
+        """All rows ordered by ``field``, markets without a value last; cached."""
+        ranking = self._rankings.get((field, descending))
+        if ranking is None:
+            present = [
+                row for row, market in enumerate(self.markets) if market.get(field) is not None
+            ]
+            present.sort(key=lambda row: self.markets[row][field], reverse=descending)
+            missing = [row for row, market in enumerate(self.markets) if market.get(field) is None]
+            ranking = present + missing
+            self._rankings[(field, descending)] = ranking
+        return ranking
+
+    def _build(self, markets: list[dict[str, Any]], downloaded_at: float) -> None:
+        by_geoid = defaultdict(list)
+        by_field = {field: defaultdict(set) for field in CATEGORY_FIELDS}
+        trigrams = defaultdict(set)
+        words = []
+        names = []
+        for row, market in enumerate(markets):
+            by_geoid[str(market.get("geoid"))].append(row)
+            for field in CATEGORY_FIELDS:
+                if market.get(field) is not None:
+                    by_field[field][str(market[field]).upper()].add(row)
+            name = str(market.get("name") or "").lower()
+            names.append(name)
+            words.extend((word, row) for word in _words(name))
+            for trigram in _trigrams(name):
+                trigrams[trigram].add(row)
+
+        self.markets = markets
+        self.downloaded_at = downloaded_at
+        self._by_parcl_id = {market["parcl_id"]: row for row, market in enumerate(markets)}
+        self._by_geoid = dict(by_geoid)
+        self._by_field = {field: dict(index) for field, index in by_field.items()}
+        self._words = sorted(words)
+        self._trigrams = dict(trigrams)
+        self._names = names
+        self._rankings = {}
+
+
+def _words(name: str) -> Iterable[str]:
+    """Words of a lowercase name, split on anything that is not a letter or digit."""
+    return "".join(char if char.isalnum() else " " for char in name).split()
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + TRIGRAM_LENGTH] for i in range(len(text) - TRIGRAM_LENGTH + 1)}
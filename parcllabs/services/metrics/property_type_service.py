@@ -1,9 +1,15 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 
+from parcllabs.services.async_parcllabs_service import AsyncParclLabsService
 from parcllabs.services.parcllabs_service import ParclLabsService
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from parcllabs.store import LocalStore
+
 
 class PropertyTypeService(ParclLabsService):
     def retrieve(
@@ -19,17 +25,73 @@ class PropertyTypeService(ParclLabsService):
         """
         Retrieve property type metrics for given parameters.
         """
-        if params is None:
-            params = {}
-
-        if property_type:
-            params["property_type"] = property_type.upper()
-
         return super().retrieve(
             parcl_ids=parcl_ids,
             start_date=start_date,
             end_date=end_date,
             limit=limit,
-            params=params,
+            params=self._with_property_type(params, property_type),
             auto_paginate=auto_paginate,
         )
+
+    def retrieve_arrow(
+        self,
+        parcl_ids: list[int],
+        start_date: str | None = None,
+        end_date: str | None = None,
+        property_type: str | None = None,
+        limit: int | None = None,
+        params: dict[str, Any] | None = None,
+        auto_paginate: bool = False,
+    ) -> "pa.Table":
+        """
+        Retrieve property type metrics as a ``pyarrow.Table``.
+        """
+        return super().retrieve_arrow(
+            parcl_ids=parcl_ids,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            params=self._with_property_type(params, property_type),
+            auto_paginate=auto_paginate,
+        )
+
+    def retrieve_incremental(
+        self,
+        parcl_ids: list[int],
+        store: "LocalStore",
+        start_date: str | None = None,
+        end_date: str | None = None,
+        property_type: str | None = None,
+        params: dict[str, Any] | None = None,
+        table: str | None = None,
+    ) -> pd.DataFrame:
+        """
+        Retrieve property type metrics newer than those already in ``store``, and store them.
+        """
+        return super().retrieve_incremental(
+            parcl_ids=parcl_ids,
+            store=store,
+            start_date=start_date,
+            end_date=end_date,
+            params=self._with_property_type(params, property_type),
+            table=table,
+        )
+
+    @staticmethod
+    def _with_property_type(
+        params: dict[str, Any] | None, property_type: str | None
+    ) -> dict[str, Any]:
+        if params is None:
+            params = {}
+
+        if property_type:
+            params["property_type"] = property_type.upper()
+        return params
+
+
+class AsyncPropertyTypeService(PropertyTypeService, AsyncParclLabsService):
+    """
+    Asyncio counterpart of PropertyTypeService; ``retrieve``, ``retrieve_arrow`` and
+    ``retrieve_incremental`` return coroutines.
+    """
@@ -1,19 +1,52 @@
 import json
 import platform
+import time
 from collections import deque
-from collections.abc import Mapping
-from typing import Any
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import pandas as pd
 import requests
 from requests.exceptions import RequestException
+from requests.structures import CaseInsensitiveDict
+from urllib3.response import BaseHTTPResponse
 
 from parcllabs.__version__ import VERSION
-from parcllabs.common import DELETE_FROM_OUTPUT, GET_METHOD, POST_METHOD
+from parcllabs.cache import CacheEntry, ResponseCache
+from parcllabs.common import (
+    DATE_COLUMNS,
+    DELETE_FROM_OUTPUT,
+    GET_METHOD,
+    MAX_PARCL_IDS_PER_REQUEST,
+    POST_METHOD,
+)
+from parcllabs.compression import REQUEST_COMPRESSION_MIN_BYTES, compress
 from parcllabs.enums import RequestLimits, RequestMethods, ResponseCodes
 from parcllabs.exceptions import NotFoundError
-from parcllabs.services.data_utils import safe_concat_and_format_dtypes
+from parcllabs.rate_limiter import parse_retry_after
+from parcllabs.services.arrow_utils import (
+    TableBuilder,
+    flatten_table,
+    format_table,
+    require_pyarrow,
+)
+from parcllabs.services.data_utils import PandasBackend, PolarsBackend, get_frame_backend
 from parcllabs.services.validators import Validators
+from parcllabs.store import DATE_FORMAT, METRIC_KEY
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from parcllabs.store import LocalStore
+
+# Request parameters that select rows rather than distinguish them.
+INCREMENTAL_REQUEST_PARAMS = frozenset({"start_date", "end_date", "limit", "offset"})
+
+SUCCESS_STATUS_CODES = range(200, 300)
 
 
 class ParclLabsService:
@@ -21,6 +54,11 @@ class ParclLabsService:
     Base class for working with data from the Parcl Labs API.
     """
 
+    # Top-level response fields the service reads; None decodes the whole body.
+    response_fields: tuple[str, ...] | None = None
+    # Request argument carrying a raw (compressed) body.
+    _body_argument = "data"
+
     def __init__(self, url: str, client: object, post_url: str | None = None) -> None:
         self.url = url
         self.post_url = post_url
@@ -79,6 +117,17 @@ class ParclLabsService:
         """
         Generic method to make HTTP requests and handle errors.
 
+        Requests are sent through the client's pooled session, so every service on
+        a client reuses the same keep-alive connections, and hold the client's
+        request semaphore so at most ``max_concurrency`` are in flight at once.
+        Each attempt first waits for the client's rate limiter, if it has one.
+        Connection errors, timeouts and retryable statuses are re-sent according
+        to the client's retry policy. When the client has a ``response_cache``, a fresh cached
+        response is returned without sending anything, a stale one is revalidated
+        with a conditional request, and successful responses are stored in it.
+        When the client coalesces requests, a request identical to one already in
+        flight waits for that one and shares its response instead of being sent.
+
         Args:
             method (str): The HTTP method ('GET' or 'POST').
             url (str): The URL endpoint to request.
@@ -90,26 +139,268 @@ class ParclLabsService:
         Raises:
             RequestException: If the request fails or an unexpected error occurs.
         """
-        try:
-            if method == GET_METHOD:
-                params = kwargs.get("params", {})
-                kwargs["params"] = params
-            response = requests.request(
+        if method == GET_METHOD:
+            params = kwargs.get("params", {})
+            kwargs["params"] = params
+        single_flight = self.client.single_flight
+        if single_flight is None:
+            return self._send_with_retries(method, url, **kwargs)
+
+        response, shared = single_flight.do(
+            self._flight_key(method, url, kwargs),
+            partial(self._send_with_retries, method, url, **kwargs),
+        )
+        return self._shared_response(method, url, response) if shared else response
+
+    def _send_with_retries(self, method: str, url: str, **kwargs: dict) -> requests.Response:
+        """Send a request, or serve it from the response cache; see ``_make_request``."""
+        cache_key, cached = self._cache_lookup(method, url, kwargs)
+        if cached is not None and cached.fresh:
+            return self._cached_response(method, url, cached)
+        kwargs, uncompressed_body_size = self._compress_body(kwargs)
+        kwargs = self._with_validators(kwargs, cached)
+
+        retry_policy = self.client.retry_policy
+        started = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                response = self._send(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as err:
+                delay = retry_policy.retry_delay(method, attempt, time.monotonic() - started)
+                if delay is None:
+                    raise RequestException(f"Request failed: {err!s}") from err
+            except requests.exceptions.RequestException as err:
+                raise RequestException(f"Request failed: {err!s}") from err
+            except Exception as e:
+                raise RequestException(f"An unexpected error occurred: {e!s}") from e
+            else:
+                delay = self._response_retry_delay(method, response, attempt, started)
+                if delay is None:
+                    return self._final_response(
+                        method, url, response, uncompressed_body_size, cache_key, cached
+                    )
+            time.sleep(delay)
+            attempt += 1
+
+    def _final_response(
+        self,
+        method: str,
+        url: str,
+        response: requests.Response,
+        uncompressed_body_size: int | None,
+        cache_key: str | None,
+        cached: CacheEntry | None,
+    ) -> requests.Response:
+        """Check, record and cache the response that ends a request's retries.
+
+        A ``304 Not Modified`` answer to a revalidation is replaced by the cached
+        response it confirms.
+        """
+        if cached is not None and response.status_code == ResponseCodes.NOT_MODIFIED.value:
+            self._record_transfer(method, url, response, uncompressed_body_size)
+            return self._revalidated_response(method, url, cache_key, cached)
+
+        self._raise_for_status(response)
+        self._record_transfer(method, url, response, uncompressed_body_size)
+        self._store_response(cache_key, url, response, cached)
+        self._use_json_decoder(response)
+        return response
+
+    def _send(self, method: str, url: str, **kwargs: dict) -> requests.Response:
+        """
+        Send a single attempt once the rate limiter, if any, and request semaphore allow it.
+        """
+        if self.client.rate_limiter is not None:
+            self.client.rate_limiter.acquire()
+        with self.client.request_semaphore:
+            return self.client.session.request(
                 method,
                 url,
-                headers=self.headers,
+                headers={**self.headers, **kwargs.pop("headers", {})},
                 timeout=self.client.timeout,
                 **kwargs,
             )
+
+    def _response_retry_delay(
+        self, method: str, response: requests.Response, attempt: int, started: float
+    ) -> float | None:
+        """
+        Feed a response back to the rate limiter and decide whether to re-send it.
+
+        Returns:
+            Seconds to wait before the next attempt, or None if the response is final.
+        """
+        status_code = response.status_code
+        retry_policy = self.client.retry_policy
+        rate_limiter = self.client.rate_limiter
+        if not retry_policy.is_retryable_status(status_code):
+            # Only a 2xx shows the rate is sustainable; a 4xx says nothing about it.
+            if rate_limiter is not None and status_code in SUCCESS_STATUS_CODES:
+                rate_limiter.on_success()
+            return None
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if rate_limiter is not None and status_code == ResponseCodes.RATE_LIMIT_EXCEEDED.value:
+            rate_limiter.on_rate_limited(retry_after)
+        return retry_policy.retry_delay(
+            method, attempt, time.monotonic() - started, retry_after=retry_after
+        )
+
+    def _compress_body(self, kwargs: dict[str, Any]) -> tuple[dict[str, Any], int | None]:
+        """Compress a large JSON body with the client's ``request_compression``.
+
+        Returns the request arguments to send and the uncompressed body size, or
+        the arguments unchanged and None when the body is sent as-is.
+        """
+        encoding = self.client.request_compression
+        if not encoding or kwargs.get("json") is None:
+            return kwargs, None
+
+        body = json.dumps(kwargs["json"]).encode()
+        if len(body) < REQUEST_COMPRESSION_MIN_BYTES:
+            return kwargs, None
+
+        kwargs = {key: value for key, value in kwargs.items() if key != "json"}
+        kwargs[self._body_argument] = compress(body, encoding)
+        kwargs["headers"] = {"Content-Encoding": encoding}
+        return kwargs, len(body)
+
+    def _record_transfer(
+        self, method: str, url: str, response: requests.Response, uncompressed_body_size: int | None
+    ) -> None:
+        """Add a response's wire and decoded sizes to the client's ``transfer_stats``."""
+        bytes_sent, bytes_received = self._wire_sizes(response)
+        self.client.transfer_stats.record(
+            method,
+            str(url),
+            response.headers.get("Content-Encoding"),
+            bytes_sent=bytes_sent,
+            bytes_sent_uncompressed=uncompressed_body_size or bytes_sent,
+            bytes_received=bytes_received,
+            bytes_received_uncompressed=len(response.content),
+        )
+
+    @staticmethod
+    def _wire_sizes(response: requests.Response) -> tuple[int, int]:
+        """Bytes of request body sent and of (possibly compressed) body received."""
+        body = response.request.body
+        bytes_sent = len(body) if isinstance(body, bytes | str) else 0
+        # urllib3 counts the bytes it read from the socket, before decoding.
+        raw = response.raw
+        if isinstance(raw, BaseHTTPResponse):
+            return bytes_sent, raw.tell()
+        return bytes_sent, len(response.content)
+
+    def _cache_lookup(
+        self, method: str, url: str, kwargs: dict[str, Any]
+    ) -> tuple[str | None, CacheEntry | None]:
+        """Look a request up in the client's ``response_cache``.
+
+        Returns the request's cache key (None without a cache) and the stored
+        entry, fresh or stale, or None on a miss.
+        """
+        cache = self.client.response_cache
+        if cache is None:
+            return None, None
+
+        key = cache.key(method, str(url), kwargs.get("params"), kwargs.get("json"))
+        return key, cache.get(key)
+
+    @staticmethod
+    def _with_validators(kwargs: dict[str, Any], cached: CacheEntry | None) -> dict[str, Any]:
+        """Make the request conditional on a stale entry's validators, if any."""
+        if cached is None:
+            return kwargs
+        return {**kwargs, "headers": {**kwargs.get("headers", {}), **cached.validators()}}
+
+    def _cached_response(
+        self, method: str, url: str, entry: CacheEntry, revalidated: bool = False
+    ) -> requests.Response:
+        response = self._build_response(method, url, entry.body, entry.headers)
+        record_credits_saved = partial(
+            self.client.response_cache.record_credits_saved, revalidated=revalidated
+        )
+        response.json = partial(self._decode_free, response.content, record_credits_saved)
+        return response
+
+    @staticmethod
+    def _flight_key(method: str, url: str, kwargs: dict[str, Any]) -> str:
+        """Key under which identical in-flight requests are coalesced."""
+        return ResponseCache.key(method, str(url), kwargs.get("params"), kwargs.get("json"))
+
+    def _shared_response(
+        self, method: str, url: str, response: requests.Response
+    ) -> requests.Response:
+        """A copy of another caller's response to an identical in-flight request."""
+        shared = self._build_response(method, url, response.content, dict(response.headers))
+        shared.json = partial(
+            self._decode_free, shared.content, self.client.single_flight.record_credits_saved
+        )
+        return shared
+
+    def _revalidated_response(
+        self, method: str, url: str, cache_key: str, entry: CacheEntry
+    ) -> requests.Response:
+        """Serve a stale entry the API answered ``304 Not Modified`` for."""
+        self.client.response_cache.revalidated(cache_key, str(url), entry)
+        return self._cached_response(method, url, entry, revalidated=True)
+
+    @staticmethod
+    def _build_response(
+        method: str, url: str, body: bytes, headers: dict[str, str]
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = ResponseCodes.SUCCESS.value
+        response.url = str(url)
+        response.request = requests.Request(method, url).prepare()
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = body
+        return response
+
+    def _decode_free(self, content: bytes, record_credits_saved: Callable[[float], None]) -> Any:  # noqa: ANN401
+        """Decode a body that cost this caller no credits, without its credit usage.
+
+        A cached response, or one shared with an identical in-flight request, costs
+        no credits, so its ``account`` (or ``account_info``) block is removed
+        before the service adds it to the client's usage, and its estimate is
+        passed to ``record_credits_saved`` instead.
+        """
+        page = self.client.json_decoder.decode(content, self.response_fields)
+        if isinstance(page, dict):
+            for field in ("account", "account_info"):
+                account = page.pop(field, None)
+                if account:
+                    record_credits_saved(account.get("est_credits_used") or 0)
+        return page
+
+    def _store_response(
+        self,
+        cache_key: str | None,
+        url: str,
+        response: requests.Response,
+        stale: CacheEntry | None,
+    ) -> None:
+        if cache_key is not None:
+            self.client.response_cache.set(
+                cache_key, str(url), response.content, response.headers, stale
+            )
+
+    def _use_json_decoder(self, response: requests.Response) -> None:
+        """Make ``response.json()`` decode the body with the client's JSONDecoder.
+
+        Only the top-level ``response_fields`` are decoded when the service sets
+        them.
+        """
+        response.json = partial(
+            self.client.json_decoder.decode, response.content, self.response_fields
+        )
+
+    def _raise_for_status(self, response: requests.Response) -> None:
+        try:
             response.raise_for_status()
         except requests.exceptions.HTTPError:
             self.error_handling(response)
-        except requests.exceptions.RequestException as err:
-            raise RequestException(f"Request failed: {err!s}") from err
-        except Exception as e:
-            raise RequestException(f"An unexpected error occurred: {e!s}") from e
-        else:
-            return response
 
     def _post(
         self,
@@ -165,21 +456,10 @@ class ParclLabsService:
             specific fetch method called (_fetch_post, _fetch_get, or
             _fetch_get_many_parcl_ids).
         """
-        params = self._clean_params(params) if params else {}
-
-        # Use client's default limit if no limit specified in params
-        if "limit" not in params or params["limit"] is None:
-            params["limit"] = self.client.limit
+        params = self._prepare_fetch_params(params)
 
         if self.full_post_url:
-            # convert the list of parcl_ids into post body params, formatted
-            # as strings
-            if params.get("limit"):
-                params["limit"] = self._validate_limit(POST_METHOD, params["limit"])
-
-            data = {"parcl_id": [str(pid) for pid in parcl_ids], **params}
-            params = {"limit": params["limit"]} if params.get("limit") else {}
-
+            params, data = self._build_post_request(parcl_ids, params)
             return self._fetch_post(params, data, auto_paginate)
         if params.get("limit"):
             params["limit"] = self._validate_limit(GET_METHOD, params["limit"])
@@ -189,15 +469,47 @@ class ParclLabsService:
             return self._fetch_get(url, params, auto_paginate)
         return self._fetch_get_many_parcl_ids(parcl_ids, params, auto_paginate)
 
+    def _prepare_fetch_params(self, params: Mapping[str, Any] | None) -> dict[str, Any]:
+        """
+        Clean the request parameters and fall back to the client's default limit.
+        """
+        params = self._clean_params(params) if params else {}
+
+        # Use client's default limit if no limit specified in params
+        if "limit" not in params or params["limit"] is None:
+            params["limit"] = self.client.limit
+
+        return params
+
+    def _build_post_request(
+        self, parcl_ids: list[int], params: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Split prepared parameters into POST query params and a POST body.
+
+        The list of parcl_ids is converted into post body params, formatted as
+        strings. Only the limit stays in the query string.
+
+        Returns:
+            Tuple[Dict[str, Any], Dict[str, Any]]: The query params and the body.
+        """
+        if params.get("limit"):
+            params["limit"] = self._validate_limit(POST_METHOD, params["limit"])
+
+        data = {"parcl_id": [str(pid) for pid in parcl_ids], **params}
+        params = {"limit": params["limit"]} if params.get("limit") else {}
+        return params, data
+
     def _fetch_get_many_parcl_ids(
         self, parcl_ids: list[int], params: dict[str, Any], auto_paginate: bool
     ) -> list[dict[str, Any]]:
         """
         Fetch data for multiple Parcl IDs using individual GET requests.
 
-        This method iterates through a list of Parcl IDs, making a separate GET request
-        for each ID. It's used when multiple Parcl IDs need to be fetched and the API
-        doesn't support bulk fetching in a single request.
+        This method makes a separate GET request for each ID, running them on a
+        worker pool sized by the client's ``num_workers``. It's used when multiple
+        Parcl IDs need to be fetched and the API doesn't support bulk fetching in a
+        single request. Parcl IDs with no data (404) are skipped.
 
         Args:
             parcl_ids (List[int]): A list of Parcl IDs to fetch data for.
@@ -211,17 +523,17 @@ class ParclLabsService:
             the data fetched for a single Parcl ID. The order of the results corresponds
             to the order of the input parcl_ids.
         """
-        results = []
 
-        for parcl_id in parcl_ids:
+        def fetch_one(parcl_id: int) -> dict[str, Any] | None:
             try:
                 url = self.full_url.format(parcl_id=parcl_id)
-                result = self._fetch_get(url, params, auto_paginate)
-                results.append(result)
+                return self._fetch_get(url, params, auto_paginate)
             except NotFoundError:
-                continue
+                return None
 
-        return results
+        with ThreadPoolExecutor(max_workers=self.client.num_workers) as executor:
+            results = executor.map(fetch_one, parcl_ids)
+            return [result for result in results if result is not None]
 
     def _fetch_post(
         self,
@@ -258,20 +570,85 @@ class ParclLabsService:
         result = response.json()
 
         if auto_paginate and "links" in result and result["links"].get("next") is not None:
+            page_urls = self._plan_page_urls(result)
+            if page_urls is None:
+                return self._follow_next_links(result, original_params, data, referring_method)
+
+            def fetch_page(page_url: str) -> dict[str, Any]:
+                return self._fetch_page_url(page_url, original_params, data, referring_method)
+
             all_items = result["items"]
-            while result["links"].get("next") is not None:
-                next_url = result["links"]["next"]
-                if referring_method == "post":
-                    next_response = self._post(next_url, data=data, params=original_params)
-                else:
-                    next_response = self._get(next_url, params=original_params)
-                next_response.raise_for_status()
-                result = next_response.json()
-                all_items.extend(result["items"])
+            with ThreadPoolExecutor(max_workers=self.client.num_workers) as executor:
+                for page in executor.map(fetch_page, page_urls):
+                    all_items.extend(page["items"])
+                    result = page
             result["items"] = all_items
 
         return result
 
+    def _follow_next_links(
+        self,
+        result: dict[str, Any],
+        original_params: dict[str, Any],
+        data: dict[str, Any] | None,
+        referring_method: str,
+    ) -> dict[str, Any]:
+        """
+        Follow ``links.next`` one page at a time, for responses without page totals.
+        """
+        all_items = result["items"]
+        while result["links"].get("next") is not None:
+            next_url = result["links"]["next"]
+            result = self._fetch_page_url(next_url, original_params, data, referring_method)
+            all_items.extend(result["items"])
+        result["items"] = all_items
+        return result
+
+    def _fetch_page_url(
+        self,
+        url: str,
+        original_params: dict[str, Any],
+        data: dict[str, Any] | None,
+        referring_method: str,
+    ) -> dict[str, Any]:
+        """
+        Fetch one page with the same method, params and body as the first page.
+        """
+        if referring_method == "post":
+            response = self._post(url, data=data, params=original_params)
+        else:
+            response = self._get(url, params=original_params)
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _plan_page_urls(first_page: dict[str, Any]) -> list[str] | None:
+        """
+        Build the URLs of every page after the first from its ``total``, ``limit``
+        and ``offset``, so the remaining pages can be fetched concurrently.
+
+        The ``offset`` query parameter of ``links.next`` is rewritten for each
+        page, keeping every other parameter the API put in the link.
+
+        Returns:
+            The remaining page URLs in order, or ``None`` when the first page does
+            not report its totals and ``links.next`` has to be followed instead.
+        """
+        total = first_page.get("total")
+        limit = first_page.get("limit")
+        offset = first_page.get("offset")
+        if not isinstance(total, int) or not isinstance(limit, int) or limit <= 0:
+            return None
+        if not isinstance(offset, int):
+            return None
+
+        next_url = urlsplit(first_page["links"]["next"])
+        query = [(k, v) for k, v in parse_qsl(next_url.query) if k != "offset"]
+        return [
+            urlunsplit(next_url._replace(query=urlencode([*query, ("offset", page_offset)])))
+            for page_offset in range(offset + limit, total, limit)
+        ]
+
     def retrieve(
         self,
         parcl_ids: list[int],
@@ -281,34 +658,449 @@ class ParclLabsService:
         params: Mapping[str, Any] | None = None,
         auto_paginate: bool = False,
     ) -> pd.DataFrame:
-        start_date = Validators.validate_date(start_date)
-        end_date = Validators.validate_date(end_date)
+        """
+        Retrieve the pages for ``parcl_ids`` as one DataFrame.
 
-        params = self._clean_params(
-            {
-                "start_date": start_date,
-                "end_date": end_date,
-                "limit": limit if limit else None,
-                **(params or {}),
-            }
+        With a client ``store``, parcl_ids this exact query was answered for
+        within the store's ``max_age`` are read from the store, and only the
+        others are requested (see ``_answer_from_store``).
+        """
+        store = self.client.store
+        if store is None:
+            return self._as_pd_dataframe(
+                self._retrieve_pages(parcl_ids, start_date, end_date, limit, params, auto_paginate)
+            )
+
+        query = self._stored_query(
+            store, parcl_ids, start_date, end_date, limit, params, auto_paginate
         )
+        pages = []
+        if query["missing"]:
+            pages = self._retrieve_pages(
+                query["missing"], start_date, end_date, limit, params, auto_paginate
+            )
+        return self._answer_from_store(store, query, parcl_ids, pages)
 
-        data_container = []
-        max_parcl_ids = 1000
-        for i in range(0, len(parcl_ids), max_parcl_ids):
+    def retrieve_arrow(
+        self,
+        parcl_ids: list[int],
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int | None = None,
+        params: Mapping[str, Any] | None = None,
+        auto_paginate: bool = False,
+    ) -> "pa.Table":
+        """
+        Like ``retrieve``, but return a ``pyarrow.Table`` built directly from the
+        JSON pages, without constructing a pandas DataFrame. Columns and their
+        order match ``retrieve``. Endpoint-specific filters such as
+        ``property_type`` go in ``params``. Requires ``pyarrow``.
+        """
+        require_pyarrow()
+        return self._as_arrow_table(
+            self._retrieve_pages(parcl_ids, start_date, end_date, limit, params, auto_paginate)
+        )
+
+    def _retrieve_pages(
+        self,
+        parcl_ids: list[int],
+        start_date: str | None,
+        end_date: str | None,
+        limit: int | None,
+        params: Mapping[str, Any] | None,
+        auto_paginate: bool,
+    ) -> list[dict[str, Any]]:
+        """Fetch every response page for ``retrieve``, in chunk order."""
+        params = self._prepare_retrieve_params(start_date, end_date, limit, params)
+
+        def fetch_chunk(chunk: list[int]) -> list:
             try:
-                chunk = parcl_ids[i : i + max_parcl_ids]
                 results = self._fetch(chunk, params, auto_paginate=auto_paginate)
-                data_container.extend(results if isinstance(results, list) else [results])
             except NotFoundError:
                 # we don't want to kill the entire process if one of the chunks fails
                 # due to no data. sparse parcl_ids can result in no data found.
                 # The post request can handle all 10k in one request, however the get
                 # request is one by one. get handles this direclty per parcl_id, while
                 # post handles all at once.
-                continue
+                return []
+            return results if isinstance(results, list) else [results]
+
+        # Chunks are dispatched concurrently; in-flight requests are capped by the
+        # client's request semaphore. map() keeps results in chunk order, so the
+        # combined DataFrame is deterministic.
+        data_container = []
+        with ThreadPoolExecutor(max_workers=self.client.num_workers) as executor:
+            for results in executor.map(fetch_chunk, self._chunk_parcl_ids(parcl_ids)):
+                data_container.extend(results)
+
+        return data_container
+
+    def retrieve_incremental(
+        self,
+        parcl_ids: list[int],
+        store: "LocalStore",
+        start_date: str | None = None,
+        end_date: str | None = None,
+        params: Mapping[str, Any] | None = None,
+        table: str | None = None,
+    ) -> pd.DataFrame:
+        """
+        Retrieve only the dates newer than those already in ``store``, and store them.
+
+        Each parcl_id is requested from the day after its latest ``date`` in the
+        store's ``table`` (``store_table`` by default), or from ``start_date`` if it
+        has no rows or ``start_date`` is later. parcl_ids that resume from the
+        same date are requested together, as one POST per 1,000. The new rows are
+        upserted into the table, keyed on ``parcl_id``, ``date`` and any
+        endpoint-specific filters in ``params``, and returned.
+        """
+        table = table or self.store_table
+        dimensions = self._store_dimensions(params)
+        pages = []
+        for start, chunk in self._plan_incremental(
+            parcl_ids, store, table, dimensions, start_date, end_date
+        ):
+            pages.extend(self._retrieve_pages(chunk, start, end_date, None, params, True))
+        return self._store_incremental(store, table, dimensions, self._as_pd_dataframe(pages))
+
+    @property
+    def store_table(self) -> str:
+        """Default store table for this service, e.g. ``market_metrics_housing_event_prices``."""
+        path = self.post_url or self.url
+        return "_".join(part for part in path.strip("/").split("/")[1:] if "{" not in part)
+
+    @staticmethod
+    def _store_dimensions(params: Mapping[str, Any] | None) -> dict[str, Any]:
+        """Request filters that distinguish stored rows beyond parcl_id and date."""
+        return {
+            name: value
+            for name, value in (params or {}).items()
+            if name not in INCREMENTAL_REQUEST_PARAMS and value is not None
+        }
+
+    @staticmethod
+    def _plan_incremental(
+        parcl_ids: list[int],
+        store: "LocalStore",
+        table: str,
+        dimensions: Mapping[str, Any],
+        start_date: str | None,
+        end_date: str | None,
+    ) -> list[tuple[str | None, list[int]]]:
+        """parcl_ids grouped by the start date each must be requested from."""
+        start_date = Validators.validate_date(start_date)
+        end_date = Validators.validate_date(end_date)
+        watermarks = store.watermarks(table, parcl_ids, where=dimensions)
+
+        groups: dict[str | None, list[int]] = {}
+        for parcl_id in dict.fromkeys(parcl_ids):
+            start = start_date
+            if parcl_id in watermarks:
+                resume = (pd.Timestamp(watermarks[parcl_id]) + pd.Timedelta(days=1)).strftime(
+                    "%Y-%m-%d"
+                )
+                start = max(resume, start_date or resume)
+            if end_date is None or start is None or start <= end_date:
+                groups.setdefault(start, []).append(parcl_id)
+        return list(groups.items())
+
+    @staticmethod
+    def _store_incremental(
+        store: "LocalStore", table: str, dimensions: Mapping[str, Any], frame: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Upsert newly retrieved rows, tagged with the request's dimensions."""
+        rows = frame if isinstance(frame, pd.DataFrame) else frame.to_pandas()
+        store.upsert(table, rows.assign(**dimensions), key=[*METRIC_KEY, *sorted(dimensions)])
+        return frame
 
-        return self._as_pd_dataframe(data_container)
+    def _stored_query(
+        self,
+        store: "LocalStore",
+        parcl_ids: list[int],
+        start_date: str | None,
+        end_date: str | None,
+        limit: int | None,
+        params: Mapping[str, Any] | None,
+        auto_paginate: bool,
+    ) -> dict[str, Any]:
+        """Identify a ``retrieve`` query in the store, and the parcl_ids it has not answered."""
+        request_params = self._prepare_retrieve_params(start_date, end_date, limit, params)
+        table = self.store_table
+        name = f"{table}:" + ResponseCache.key(
+            GET_METHOD, table, {**request_params, "auto_paginate": auto_paginate}
+        )
+        answered = store.query_bounds(name, parcl_ids)
+        return {
+            "table": table,
+            "name": name,
+            "dimensions": self._store_dimensions(params),
+            "missing": [
+                parcl_id for parcl_id in dict.fromkeys(parcl_ids) if parcl_id not in answered
+            ],
+        }
+
+    def _answer_from_store(
+        self,
+        store: "LocalStore",
+        query: dict[str, Any],
+        parcl_ids: list[int],
+        pages: list[dict[str, Any]],
+    ) -> pd.DataFrame:
+        """
+        Combine the pages retrieved for a query's missing parcl_ids with the
+        stored answers for the others, and store the new rows.
+
+        When nothing was answered from the store, the frame is the one
+        ``retrieve`` returns without a store. Stored answers are turned back into
+        pages of items holding each parcl_id's rows between the first and last
+        date the query returned, newest first, with the columns it returned, so
+        they go through the same DataFrame construction as the API's pages.
+        Rows are upserted as ``retrieve_incremental`` stores them, unless they
+        cannot be stored in the table (rows without ``parcl_id`` and ``date``, or
+        a table keyed on other dimensions).
+        """
+        parcl_ids = list(dict.fromkeys(parcl_ids))
+        missing = set(query["missing"])
+        answered = [parcl_id for parcl_id in parcl_ids if parcl_id not in missing]
+        if answered:
+            pages = self._order_pages(
+                [*self._stored_pages(store, query, answered), *pages], parcl_ids
+            )
+        frame = self._as_pd_dataframe(pages)
+
+        rows = frame if isinstance(frame, pd.DataFrame) else frame.to_pandas()
+        if missing and self._can_store(store, query, rows):
+            rows = rows[rows["parcl_id"].isin(missing)] if len(rows) else rows
+            self._store_incremental(store, query["table"], query["dimensions"], rows)
+            store.set_query_bounds(
+                query["name"], self._date_bounds(query["missing"], rows), list(frame.columns)
+            )
+        if not answered:
+            return frame
+        columns = store.query_columns(query["name"], answered)
+        return frame[
+            [col for col in columns if col in frame.columns]
+            + [col for col in frame.columns if col not in columns]
+        ]
+
+    @staticmethod
+    def _can_store(store: "LocalStore", query: dict[str, Any], rows: pd.DataFrame) -> bool:
+        """Whether ``rows`` can be upserted into the query's table."""
+        stored_key = store.key(query["table"])
+        if stored_key and stored_key != [*METRIC_KEY, *sorted(query["dimensions"])]:
+            return False
+        return not len(rows) or set(METRIC_KEY).issubset(rows.columns)
+
+    @staticmethod
+    def _stored_pages(
+        store: "LocalStore", query: dict[str, Any], parcl_ids: list[int]
+    ) -> list[dict[str, Any]]:
+        """One page of stored items per parcl_id the query was answered for."""
+        bounds = store.query_bounds(query["name"], parcl_ids)
+        columns = store.query_columns(query["name"], parcl_ids)
+        stored = store.read(query["table"], parcl_ids=list(bounds), where=query["dimensions"])
+        if stored.empty:
+            return []
+        first = pd.to_datetime(stored["parcl_id"].map(lambda parcl_id: bounds[parcl_id][0]))
+        last = pd.to_datetime(stored["parcl_id"].map(lambda parcl_id: bounds[parcl_id][1]))
+        stored = stored[stored["date"].between(first, last)].sort_values(
+            "date", ascending=False, kind="stable"
+        )
+        stored = stored[[col for col in columns if col in stored.columns]]
+        stored = stored.assign(
+            **{
+                col: stored[col].dt.strftime(DATE_FORMAT)
+                for col in DATE_COLUMNS
+                if col in stored.columns
+            }
+        )
+        items = stored.astype(object).where(stored.notna(), None)
+        return [
+            {"items": group.to_dict("records")}
+            for _, group in items.groupby("parcl_id", sort=False)
+        ]
+
+    @staticmethod
+    def _order_pages(pages: list[dict[str, Any]], parcl_ids: list[int]) -> list[dict[str, Any]]:
+        """Pages sorted by the request position of the parcl_id they start with."""
+        position = {parcl_id: i for i, parcl_id in enumerate(parcl_ids)}
+
+        def first_parcl_id(page: dict[str, Any]) -> int:
+            items = page.get("items") or [{}]
+            parcl_id = page.get("parcl_id", items[0].get("parcl_id"))
+            return position.get(parcl_id, len(position))
+
+        return sorted(pages, key=first_parcl_id)
+
+    @staticmethod
+    def _date_bounds(
+        parcl_ids: list[int], rows: pd.DataFrame
+    ) -> dict[int, tuple[str | None, str | None]]:
+        """First and last ``date`` of each parcl_id's rows; ``(None, None)`` if it has none."""
+        bounds = dict.fromkeys(parcl_ids, (None, None))
+        if len(rows):
+            dates = pd.to_datetime(rows["date"]).groupby(rows["parcl_id"]).agg(["min", "max"])
+            for parcl_id, first, last in dates.itertuples():
+                bounds[int(parcl_id)] = (first.strftime("%Y-%m-%d"), last.strftime("%Y-%m-%d"))
+        return bounds
+
+    def iter_pages(
+        self,
+        parcl_ids: list[int],
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int | None = None,
+        params: Mapping[str, Any] | None = None,
+        auto_paginate: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield raw response pages one at a time, as soon as each has been fetched.
+
+        Takes the same arguments as ``retrieve``, but never holds more than a
+        window of ``num_workers`` pages in memory: pages are yielded in the same
+        order ``retrieve`` would combine them, and parcl_ids or chunks with no data
+        are skipped. Endpoint-specific filters such as ``property_type`` go in
+        ``params``.
+        """
+        params = self._prepare_retrieve_params(start_date, end_date, limit, params)
+        for chunk in self._chunk_parcl_ids(parcl_ids):
+            yield from self._iter_chunk_pages(chunk, params, auto_paginate)
+
+    def iter_frames(
+        self,
+        parcl_ids: list[int],
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int | None = None,
+        params: Mapping[str, Any] | None = None,
+        auto_paginate: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Like ``iter_pages``, but yields each page normalized into a DataFrame with
+        the same columns ``retrieve`` returns. Empty pages are skipped.
+        """
+        for page in self.iter_pages(
+            parcl_ids, start_date, end_date, limit, params, auto_paginate=auto_paginate
+        ):
+            frame = self._as_pd_dataframe([page])
+            if len(frame):
+                yield frame
+
+    def _iter_chunk_pages(
+        self, parcl_ids: list[int], params: Mapping[str, Any], auto_paginate: bool
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield every page for one chunk of parcl_ids: a single POST, or one GET per
+        parcl_id, each followed by its pagination pages.
+        """
+        params = self._prepare_fetch_params(params)
+        if self.full_post_url:
+            params, data = self._build_post_request(parcl_ids, params)
+            page_requests = [(self.full_post_url, params, data, "post")]
+        else:
+            if params.get("limit"):
+                params["limit"] = self._validate_limit(GET_METHOD, params["limit"])
+            page_requests = [
+                (self.full_url.format(parcl_id=parcl_id), params, None, "get")
+                for parcl_id in parcl_ids
+            ]
+
+        def fetch_first_page(page_request: tuple) -> dict[str, Any] | None:
+            try:
+                return self._fetch_page_url(*page_request)
+            except NotFoundError:
+                return None
+
+        first_pages = self._imap(fetch_first_page, page_requests)
+        for (_, request_params, data, method), first_page in zip(
+            page_requests, first_pages, strict=True
+        ):
+            if first_page is not None:
+                yield from self._iter_request_pages(
+                    first_page, request_params, data, method, auto_paginate
+                )
+
+    def _iter_request_pages(
+        self,
+        first_page: dict[str, Any],
+        original_params: dict[str, Any],
+        data: dict[str, Any] | None,
+        referring_method: str,
+        auto_paginate: bool,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield the first page of a request, then its remaining pages in order.
+        """
+        yield first_page
+        if not auto_paginate or (first_page.get("links") or {}).get("next") is None:
+            return
+
+        page_urls = self._plan_page_urls(first_page)
+        if page_urls is None:
+            page = first_page
+            while page["links"].get("next") is not None:
+                page = self._fetch_page_url(
+                    page["links"]["next"], original_params, data, referring_method
+                )
+                yield page
+            return
+
+        def fetch_page(page_url: str) -> dict[str, Any]:
+            return self._fetch_page_url(page_url, original_params, data, referring_method)
+
+        yield from self._imap(fetch_page, page_urls)
+
+    def _imap(self, func: Callable[[Any], Any], items: Iterable[Any]) -> Iterator[Any]:
+        """
+        Ordered, bounded counterpart of ``executor.map`` for the streaming API.
+
+        At most ``num_workers`` calls are in flight or waiting to be consumed at a
+        time, so a slow consumer applies back-pressure instead of letting fetched
+        pages pile up in memory.
+        """
+        max_workers = self.client.num_workers or self.client.pool_size
+        items = iter(items)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            pending = deque(executor.submit(func, item) for item in islice(items, max_workers))
+            while pending:
+                result = pending.popleft().result()
+                pending.extend(executor.submit(func, item) for item in islice(items, 1))
+                yield result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _prepare_retrieve_params(
+        self,
+        start_date: str | None,
+        end_date: str | None,
+        limit: int | None,
+        params: Mapping[str, Any] | None,
+    ) -> dict[str, Any]:
+        """
+        Validate the date range and merge it with the caller's parameters.
+        """
+        start_date = Validators.validate_date(start_date)
+        end_date = Validators.validate_date(end_date)
+
+        return self._clean_params(
+            {
+                "start_date": start_date,
+                "end_date": end_date,
+                "limit": limit if limit else None,
+                **(params or {}),
+            }
+        )
+
+    @staticmethod
+    def _chunk_parcl_ids(parcl_ids: list[int]) -> list[list[int]]:
+        """
+        Split parcl_ids into chunks of at most MAX_PARCL_IDS_PER_REQUEST.
+        """
+        return [
+            parcl_ids[i : i + MAX_PARCL_IDS_PER_REQUEST]
+            for i in range(0, len(parcl_ids), MAX_PARCL_IDS_PER_REQUEST)
+        ]
 
     def _update_account_info(self, account_info: dict) -> None:
         """
@@ -330,22 +1122,47 @@ class ParclLabsService:
         return {k: v for k, v in data.items() if k not in DELETE_FROM_OUTPUT}
 
     def _as_pd_dataframe(self, data: list[Mapping[str, Any]]) -> pd.DataFrame:
+        backend = self._frame_backend
         data_container = deque()
         for results in data:
             if results is None:
                 continue
             account_info = results.get("account")
-            sanitized_results = self.sanitize_output(results)
-            meta_fields = [k for k in sanitized_results.keys() if k != "items"]
-            normalized_df = pd.json_normalize(
-                sanitized_results, record_path="items", meta=meta_fields
-            )
-            updated_cols_names = [c.replace(".", "_") for c in normalized_df.columns.tolist()]
-            normalized_df.columns = updated_cols_names
-            data_container.append(normalized_df)
+            data_container.append(backend.normalize_page(self.sanitize_output(results)))
             self._update_account_info(account_info)
 
-        return safe_concat_and_format_dtypes(data_container)
+        return self._format_output(backend.concat_and_format(data_container))
+
+    def _as_arrow_table(self, data: list[Mapping[str, Any]]) -> "pa.Table":
+        """Arrow counterpart of ``_as_pd_dataframe``: one row per item, with each
+        page's other fields repeated on its rows."""
+        builder = TableBuilder()
+        for results in data:
+            if results is None:
+                continue
+            sanitized_results = self.sanitize_output(results)
+            meta_fields = {k: v for k, v in sanitized_results.items() if k != "items"}
+            builder.append(sanitized_results.get("items") or [], meta_fields)
+            self._update_account_info(results.get("account"))
+
+        return format_table(flatten_table(builder.finish()))
+
+    @property
+    def _frame_backend(self) -> PandasBackend | PolarsBackend:
+        """Builds frames for the client's ``dataframe_backend`` (see data_utils)."""
+        return get_frame_backend(self.client.dataframe_backend)
+
+    def _format_output(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply client-wide output options to a DataFrame returned to the caller.
+
+        Frames a service built with pandas are converted to the client's
+        ``dataframe_backend`` here.
+        """
+        backend = self._frame_backend
+        df = backend.from_pandas(df)
+        if self.client.compact_dtypes:
+            return backend.compact(df)
+        return df
 
     @staticmethod
     def error_handling(response: requests.Response) -> None:
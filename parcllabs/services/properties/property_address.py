@@ -1,6 +1,7 @@
 import pandas as pd
 
 from parcllabs.common import VALID_US_STATE_ABBREV
+from parcllabs.services.async_parcllabs_service import AsyncParclLabsService
 from parcllabs.services.parcllabs_service import ParclLabsService
 from parcllabs.services.validators import Validators
 
@@ -46,8 +47,24 @@ class PropertyAddressSearch(ParclLabsService):
             )
             Validators.validate_us_zip_code(zip_code=address.get("zip_code"))
 
+        return self._search_addresses(addresses)
+
+    def _search_addresses(self, addresses: list[dict]) -> pd.DataFrame:
+        """Send the validated addresses and build the result DataFrame."""
         response = self._post(url=self.full_url, data=addresses)
-        results = response.json()
+        return self._addresses_as_pd_dataframe(response.json())
+
+    def _addresses_as_pd_dataframe(self, results: dict) -> pd.DataFrame:
         data = pd.DataFrame(results.get("items"))
         self._update_account_info(results.get("account"))
-        return data
+        return self._format_output(data)
+
+
+class AsyncPropertyAddressSearch(PropertyAddressSearch, AsyncParclLabsService):
+    """
+    Asyncio counterpart of PropertyAddressSearch; ``retrieve`` returns a coroutine.
+    """
+
+    async def _search_addresses(self, addresses: list[dict]) -> pd.DataFrame:
+        response = await self._post(url=self.full_url, data=addresses)
+        return self._addresses_as_pd_dataframe(response.json())
@@ -1,3 +1,4 @@
+import asyncio
 from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
@@ -8,6 +9,7 @@ from parcllabs.enums import RequestLimits
 from parcllabs.exceptions import (
     NotFoundError,
 )
+from parcllabs.services.async_parcllabs_service import AsyncParclLabsService
 from parcllabs.services.data_utils import (
     safe_concat_and_format_dtypes,
 )
@@ -83,8 +85,20 @@ class PropertyEventsService(ParclLabsService):
             record_updated_date_end=record_updated_date_end,
         )
 
+        return self._retrieve_events(parcl_property_ids, params)
+
+    @staticmethod
+    def _batch_property_ids(parcl_property_ids: list[int]) -> list[list[str]]:
+        """Split parcl_property_ids into POST-sized batches of strings."""
         parcl_property_ids = [str(i) for i in parcl_property_ids]
-        total_properties = len(parcl_property_ids)
+        max_post_limit = RequestLimits.MAX_POST.value
+        return [
+            parcl_property_ids[i : i + max_post_limit]
+            for i in range(0, len(parcl_property_ids), max_post_limit)
+        ]
+
+    def _retrieve_events(self, parcl_property_ids: list[int], params: dict) -> pd.DataFrame:
+        """Fetch every batch of property events concurrently and combine them."""
 
         def process_batch(batch_ids: list[str]) -> list[dict] | None:
             local_params = params.copy()
@@ -102,12 +116,9 @@ class PropertyEventsService(ParclLabsService):
 
         all_data = deque()
         with ThreadPoolExecutor(max_workers=self.client.num_workers) as executor:
-            max_post_limit = RequestLimits.MAX_POST.value
             futures = {
-                executor.submit(process_batch, parcl_property_ids[i : i + max_post_limit]): len(
-                    parcl_property_ids[i : i + max_post_limit]
-                )
-                for i in range(0, total_properties, max_post_limit)
+                executor.submit(process_batch, batch): len(batch)
+                for batch in self._batch_property_ids(parcl_property_ids)
             }
 
             for future in as_completed(futures):
@@ -116,4 +127,35 @@ class PropertyEventsService(ParclLabsService):
                     batch_df = pd.DataFrame(batch_result)
                     all_data.append(batch_df)
 
-        return safe_concat_and_format_dtypes(all_data)
+        return self._format_output(safe_concat_and_format_dtypes(all_data))
+
+
+class AsyncPropertyEventsService(PropertyEventsService, AsyncParclLabsService):
+    """
+    Asyncio counterpart of PropertyEventsService; ``retrieve`` returns a coroutine.
+    """
+
+    async def _retrieve_events(self, parcl_property_ids: list[int], params: dict) -> pd.DataFrame:
+        """Fetch every batch of property events concurrently and combine them."""
+
+        async def process_batch(batch_ids: list[str]) -> list[dict] | None:
+            local_params = params.copy()
+            local_params["parcl_property_id"] = batch_ids
+            try:
+                response = await self._post(url=self.full_post_url, data=local_params)
+                data = response.json()
+                self._update_account_info(data.get("account"))
+                return data.get("items")  # Return data as json
+            except NotFoundError:
+                return None
+            except Exception as e:
+                print(f"Error processing batch {batch_ids}: {e!s}")
+                return None
+
+        batch_results = await asyncio.gather(
+            *(process_batch(batch) for batch in self._batch_property_ids(parcl_property_ids))
+        )
+        all_data = deque(
+            pd.DataFrame(batch_result) for batch_result in batch_results if batch_result
+        )
+        return self._format_output(safe_concat_and_format_dtypes(all_data))
@@ -1,8 +1,12 @@
+import asyncio
 from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import pandas as pd
 
 from parcllabs.exceptions import NotFoundError
+from parcllabs.services.async_parcllabs_service import AsyncParclLabsService
 from parcllabs.services.parcllabs_service import ParclLabsService
 from parcllabs.services.validators import Validators
 
@@ -214,25 +218,63 @@ class PropertySearch(ParclLabsService):
             has_pool=has_pool,
         )
 
+        return self._search_markets(parcl_ids, params)
+
+    def _search_markets(self, parcl_ids: list[int], params: dict) -> pd.DataFrame:
+        """
+        Run the property search for each market concurrently and combine the results.
+
+        Markets are searched on a worker pool sized by the client's ``num_workers``
+        (``num_workers=1`` searches them one at a time). Workers only fetch; credits
+        are recorded on the calling thread as each response arrives. Each market's
+        frame is appended to the result as soon as every market before it in
+        ``parcl_ids`` has completed, so the combined result keeps their order.
+        """
         output_data = deque()
         markets_with_no_data = []
+        completed: dict[int, dict | None] = {}
+        next_index = 0
 
-        for parcl_id in parcl_ids:
-            try:
-                params["parcl_id"] = parcl_id
-                response = self._get(url=self.full_url, params=params)
-                data = response.json()
-                df_container = pd.DataFrame(data.get("items"))
-                self._update_account_info(data.get("account"))
-                output_data.append(df_container)
-            except NotFoundError:
-                # Track markets with no data
-                markets_with_no_data.append(parcl_id)
-                continue
-            except Exception:
-                # For other exceptions, simply re-raise without specifying
-                raise
+        def search_market(parcl_id: int) -> dict:
+            # Each request gets its own params; the shared dict is never mutated.
+            return self._get(url=self.full_url, params={**params, "parcl_id": parcl_id}).json()
 
+        with ThreadPoolExecutor(max_workers=self.client.num_workers) as executor:
+            future_to_index = {
+                executor.submit(search_market, parcl_id): index
+                for index, parcl_id in enumerate(parcl_ids)
+            }
+            for future in as_completed(future_to_index):
+                index = future_to_index[future]
+                try:
+                    data = future.result()
+                except NotFoundError:
+                    # Track markets with no data
+                    data = None
+                else:
+                    self._update_account_info(data.get("account"))
+                completed[index] = data
+
+                while next_index in completed:
+                    data = completed.pop(next_index)
+                    if data is None:
+                        markets_with_no_data.append(parcl_ids[next_index])
+                    else:
+                        output_data.append(self._market_as_pd_dataframe(data))
+                    next_index += 1
+
+        return self._format_output(self._combine_markets(output_data, markets_with_no_data))
+
+    @staticmethod
+    def _market_as_pd_dataframe(data: dict) -> pd.DataFrame:
+        return pd.DataFrame(data.get("items"))
+
+    @staticmethod
+    def _combine_markets(
+        output_data: Iterable[pd.DataFrame], markets_with_no_data: list[int]
+    ) -> pd.DataFrame:
+        """Concatenate per-market results and report markets that had no data."""
+        output_data = list(output_data)
         if not output_data:
             # If no data was found for any market, return empty DataFrame
             return pd.DataFrame()
@@ -247,3 +289,33 @@ class PropertySearch(ParclLabsService):
             )
 
         return results
+
+
+class AsyncPropertySearch(PropertySearch, AsyncParclLabsService):
+    """
+    Asyncio counterpart of PropertySearch; ``retrieve`` returns a coroutine.
+    """
+
+    async def _search_markets(self, parcl_ids: list[int], params: dict) -> pd.DataFrame:
+        """Search every market concurrently, keeping results in input order."""
+
+        async def search_market(parcl_id: int) -> pd.DataFrame | None:
+            try:
+                response = await self._get(
+                    url=self.full_url, params={**params, "parcl_id": parcl_id}
+                )
+            except NotFoundError:
+                return None
+            data = response.json()
+            self._update_account_info(data.get("account"))
+            return self._market_as_pd_dataframe(data)
+
+        frames = await asyncio.gather(*(search_market(parcl_id) for parcl_id in parcl_ids))
+        markets_with_no_data = [
+            parcl_id for parcl_id, frame in zip(parcl_ids, frames, strict=True) if frame is None
+        ]
+        return self._format_output(
+            self._combine_markets(
+                (frame for frame in frames if frame is not None), markets_with_no_data
+            )
+        )
@@ -1,28 +1,59 @@
+import asyncio
 import copy
-import time
-from collections.abc import Mapping
+import os
+from collections.abc import AsyncIterator, Iterator, Mapping
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pandas as pd
 
+from parcllabs.cache import ResponseCache
 from parcllabs.common import PARCL_PROPERTY_IDS, PARCL_PROPERTY_IDS_LIMIT
 from parcllabs.enums import RequestLimits
+from parcllabs.json_decoder import DecodeError
 from parcllabs.schemas.schemas import PropertyV2RetrieveParamCategories, PropertyV2RetrieveParams
+from parcllabs.services.arrow_utils import (
+    TableBuilder,
+    add_flattened_column,
+    count_distinct,
+    explode_list_column,
+    flatten_table,
+    is_arrow_table,
+    require_pyarrow,
+)
+from parcllabs.services.async_parcllabs_service import AsyncParclLabsService
+from parcllabs.services.data_utils import count_unique
 from parcllabs.services.parcllabs_service import ParclLabsService
 from parcllabs.services.validators import Validators
+from parcllabs.sinks import ParquetSink
+from parcllabs.store import EVENT_KEY, MISSING_KEY_TEXT, PROPERTY_KEY
 from parcllabs.warnings import (
     warn_incomplete_pages,
     warn_integrity_mismatch,
     warn_truncation,
 )
 
-# Transient page failures are retried before a page is abandoned.
-PAGE_FETCH_ATTEMPTS = 3
-PAGE_FETCH_BACKOFF_SECONDS = 1.0
+if TYPE_CHECKING:
+    import polars as pl
+    import pyarrow as pa
+
+    from parcllabs.store import LocalStore
+
+# Pagination warnings are raised from helpers below `retrieve`; point them at the
+# caller's line rather than at SDK internals.
+WARNING_STACKLEVEL = 6
+
+# ``retrieve`` arguments a sync cannot honour: a cap or an upper bound on
+# updates would advance the watermark past rows that were never retrieved.
+SYNC_UNSUPPORTED_KWARGS = frozenset({"limit", "max_record_updated_date", "sink", "split_events"})
 
 
 class PropertyV2Service(ParclLabsService):
+    # Other top-level fields of a page are skipped while decoding.
+    response_fields = ("data", "metadata", "pagination", "account_info")
+
     def __init__(self, *args: object, **kwargs: object) -> None:
         super().__init__(*args, **kwargs)
         self.simple_bool_validator = Validators.validate_input_bool_param_simple
@@ -43,23 +74,15 @@ class PropertyV2Service(ParclLabsService):
         offset: int,
         limit: int,
     ) -> dict:
-        """Fetch a single page, retrying transient failures with exponential backoff.
+        """Fetch a single page.
 
-        Raises the last exception if every attempt fails.
+        Transient failures are retried by the client's retry policy; raises if the
+        page still cannot be fetched.
         """
         page_params = dict(params)
         page_params["limit"] = limit
         page_params["offset"] = offset
-
-        last_exc: Exception | None = None
-        for attempt in range(PAGE_FETCH_ATTEMPTS):
-            try:
-                return self._post(url=self.full_post_url, data=data, params=page_params).json()
-            except Exception as exc:  # retried below, then re-raised
-                last_exc = exc
-                if attempt < PAGE_FETCH_ATTEMPTS - 1:
-                    time.sleep(PAGE_FETCH_BACKOFF_SECONDS * (2**attempt))
-        raise last_exc  # type: ignore[misc]
+        return self._post(url=self.full_post_url, data=data, params=page_params).json()
 
     def _fetch_post(
         self,
@@ -81,11 +104,44 @@ class PropertyV2Service(ParclLabsService):
         """
         params = dict(params)
         response = self._post(url=self.full_post_url, data=data, params=params)
-        result = response.json()
-        all_data = [result]
+        all_data = [response.json()]
+
+        pages, target, total_available = self._plan_pages(all_data[0], params, max_results)
+        if not pages:
+            return all_data
+
+        failed_offsets: list[int] = []
+        with ThreadPoolExecutor(max_workers=self.client.num_workers) as executor:
+            future_to_offset = {
+                executor.submit(
+                    self._fetch_page, data, params, page_offset, page_limit
+                ): page_offset
+                for page_offset, page_limit in pages
+            }
+            for future in as_completed(future_to_offset):
+                page_offset = future_to_offset[future]
+                try:
+                    all_data.append(future.result())
+                except Exception:  # surfaced as a warning below
+                    failed_offsets.append(page_offset)
 
-        pagination = result.get("pagination") or {}
-        results_meta = (result.get("metadata") or {}).get("results") or {}
+        return self._finalize_pages(all_data, failed_offsets, target, total_available)
+
+    def _plan_pages(
+        self,
+        first_page: dict,
+        params: dict[str, Any],
+        max_results: int | None,
+        stacklevel: int = WARNING_STACKLEVEL,
+    ) -> tuple[list[tuple[int, int]], int, int]:
+        """Plan the ``(offset, limit)`` pages still needed after the first page.
+
+        Returns:
+            ``(pages, target, total_available)``. ``pages`` is empty when the first
+            page already satisfies the request.
+        """
+        pagination = first_page.get("pagination") or {}
+        results_meta = (first_page.get("metadata") or {}).get("results") or {}
         total_available = results_meta.get("total_available", 0)
         retrieved = results_meta.get("returned_count", 0)
 
@@ -99,8 +155,8 @@ class PropertyV2Service(ParclLabsService):
             # blaming `limit` for a shortfall it did not cause -- and burning the
             # once-per-session budget on advice the caller cannot act on.
             if target < total_available:
-                warn_truncation(retrieved, total_available)
-            return all_data
+                warn_truncation(retrieved, total_available, stacklevel=stacklevel)
+            return [], target, total_available
 
         page_size = pagination.get("limit") or params.get("limit") or retrieved
         offset = pagination.get("offset", 0)
@@ -116,38 +172,56 @@ class PropertyV2Service(ParclLabsService):
             current_offset += this_limit
             remaining -= this_limit
 
-        failed_offsets: list[int] = []
-        with ThreadPoolExecutor(max_workers=self.client.num_workers) as executor:
-            future_to_offset = {
-                executor.submit(
-                    self._fetch_page, data, params, page_offset, page_limit
-                ): page_offset
-                for page_offset, page_limit in pages
-            }
-            for future in as_completed(future_to_offset):
-                page_offset = future_to_offset[future]
-                try:
-                    all_data.append(future.result())
-                except Exception:  # surfaced as a warning below
-                    failed_offsets.append(page_offset)
+        return pages, target, total_available
 
+    def _finalize_pages(
+        self,
+        all_data: list[dict],
+        failed_offsets: list[int],
+        target: int,
+        total_available: int,
+    ) -> list[dict]:
+        """Report failed or truncated pagination on the assembled pages."""
         actually_retrieved = self._total_returned(all_data)
 
+        failed_offsets.sort()
+        self._warn_pagination_outcome(
+            failed_offsets,
+            target,
+            actually_retrieved,
+            total_available,
+            stacklevel=WARNING_STACKLEVEL + 1,
+        )
+        if failed_offsets:
+            all_data[0].setdefault("_parcllabs", {})["incomplete_pages"] = failed_offsets
+        return all_data
+
+    @staticmethod
+    def _warn_pagination_outcome(
+        failed_offsets: list[int],
+        target: int,
+        actually_retrieved: int,
+        total_available: int,
+        stacklevel: int,
+    ) -> None:
+        """Warn if pages failed, or if a cap withheld matching data."""
         if failed_offsets:
             # Report the shortfall and stop. Deliberately no truncation warning here:
             # we did NOT return `target`, so claiming we did would contradict this
             # warning, and the truncation notice is once-per-session -- burning it on a
             # misleading message would suppress a legitimate one later in the run.
             # `total_available` is included so capping information is not lost.
-            failed_offsets.sort()
-            warn_incomplete_pages(failed_offsets, target, actually_retrieved, total_available)
-            all_data[0].setdefault("_parcllabs", {})["incomplete_pages"] = failed_offsets
-            return all_data
+            warn_incomplete_pages(
+                sorted(failed_offsets),
+                target,
+                actually_retrieved,
+                total_available,
+                stacklevel=stacklevel,
+            )
+            return
 
         if target < total_available:
-            warn_truncation(actually_retrieved, total_available)
-
-        return all_data
+            warn_truncation(actually_retrieved, total_available, stacklevel=stacklevel)
 
     @staticmethod
     def _total_returned(pages: list[dict]) -> int:
@@ -177,16 +251,14 @@ class PropertyV2Service(ParclLabsService):
             return self._fetch_post(params=params, data=data)
 
         # If we exceed PARCL_PROPERTY_IDS_LIMIT, chunk the request
-        parcl_property_ids_chunks = [
-            parcl_property_ids[i : i + PARCL_PROPERTY_IDS_LIMIT]
-            for i in range(0, num_ids, PARCL_PROPERTY_IDS_LIMIT)
-        ]
+        parcl_property_ids_chunks = self._split_parcl_property_ids(parcl_property_ids)
         num_chunks = len(parcl_property_ids_chunks)
 
         print(f"Fetching {num_chunks} chunks...")
 
         all_data = []
-        with ThreadPoolExecutor(max_workers=3) as executor:
+        # Throttling is left to the client's rate limiter, shared by every thread.
+        with ThreadPoolExecutor(max_workers=self.client.num_workers) as executor:
             # Create a copy of data for each chunk to avoid race conditions
             future_to_chunk = {}
             for idx, chunk in enumerate(parcl_property_ids_chunks):
@@ -203,120 +275,160 @@ class PropertyV2Service(ParclLabsService):
                 )
                 future_to_chunk[future] = idx + 1
 
-                # Small delay between submissions to avoid rate limiting
-                if idx < len(parcl_property_ids_chunks) - 1:  # Don't delay after the last one
-                    time.sleep(0.1)
-
             # Collect results as they complete
             for future in as_completed(future_to_chunk):
                 chunk_num = future_to_chunk[future]
                 try:
-                    result = future.result()
-
-                    # Check HTTP status code
-                    if result.status_code != 200:
-                        response_preview = (
-                            result.text[:200] if result.text else "No response content"
-                        )
-                        self._raise_http_error(chunk_num, result.status_code, response_preview)
-
-                    # Check if response has content
-                    if not result.text.strip():
-                        self._raise_empty_response_error(chunk_num)
-
-                    # Try to parse JSON
-                    try:
-                        response = result.json()
-                        all_data.append(response)
-                        print(f"Completed chunk {chunk_num} of {num_chunks}")
-                    except ValueError as json_exc:
-                        response_preview = (
-                            result.text[:200] if result.text else "No response content"
-                        )
-                        raise RuntimeError(
-                            f"Chunk {chunk_num} failed: Invalid JSON - {json_exc}\n"
-                            f"Response content: {response_preview}..."
-                        ) from json_exc
-
+                    all_data.append(self._parse_chunk_response(chunk_num, future.result()))
+                    print(f"Completed chunk {chunk_num} of {num_chunks}")
                 except Exception as exc:
-                    # If it's already a RuntimeError from above, re-raise it
-                    if isinstance(exc, RuntimeError):
-                        raise
-
-                    # For any other unexpected errors, wrap and raise
-                    raise RuntimeError(
-                        f"Chunk {chunk_num} failed with unexpected error: {exc} "
-                        f"(Exception type: {type(exc).__name__})"
-                    ) from exc
+                    self._raise_chunk_error(chunk_num, exc)
 
         print(f"All {num_chunks} chunks completed successfully.")
         return all_data
 
-    def _as_pd_dataframe(self, data: list[Mapping[str, Any]]) -> pd.DataFrame:
-        """
-        Convert API response data to a pandas DataFrame with events as rows
-        using json_normalize.
+    @staticmethod
+    def _split_parcl_property_ids(parcl_property_ids: list[int]) -> list[list[int]]:
+        """Split parcl_property_ids into request-sized chunks."""
+        return [
+            parcl_property_ids[i : i + PARCL_PROPERTY_IDS_LIMIT]
+            for i in range(0, len(parcl_property_ids), PARCL_PROPERTY_IDS_LIMIT)
+        ]
+
+    def _parse_chunk_response(self, chunk_num: int, result: object) -> dict:
+        """Validate a chunk response and decode its JSON payload."""
+        # Check HTTP status code
+        if result.status_code != 200:
+            response_preview = result.text[:200] if result.text else "No response content"
+            self._raise_http_error(chunk_num, result.status_code, response_preview)
+
+        # Check if response has content
+        if not result.text.strip():
+            self._raise_empty_response_error(chunk_num)
+
+        # Try to parse JSON
+        try:
+            return result.json()
+        except DecodeError as json_exc:
+            response_preview = result.text[:200] if result.text else "No response content"
+            raise RuntimeError(
+                f"Chunk {chunk_num} failed: Invalid JSON - {json_exc}\n"
+                f"Response content: {response_preview}..."
+            ) from json_exc
+
+    @staticmethod
+    def _raise_chunk_error(chunk_num: int, exc: Exception) -> None:
+        # If it's already a RuntimeError from above, re-raise it
+        if isinstance(exc, RuntimeError):
+            raise exc
+
+        # For any other unexpected errors, wrap and raise
+        raise RuntimeError(
+            f"Chunk {chunk_num} failed with unexpected error: {exc} "
+            f"(Exception type: {type(exc).__name__})"
+        ) from exc
+
+    def _collect_records(
+        self, data: list[Mapping[str, Any]]
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]], np.ndarray]:
+        """Split response pages into property records and their events.
+
+        Returns the property records (without ``events``), every event in
+        property order, and how many events each property contributed.
         """
-        # First, extract all properties with their events
-        properties_with_events = []
+        property_records = []
+        events = []
+        event_counts = []
 
         for results in data:
             if results is None or not results.get("data"):
                 continue
 
-            account_info = results.get("account_info")
-            query_data = results.get("data")
-
-            # Process each property
-            for property_data in query_data:
-                events = property_data.get("events", [])
+            for property_data in results["data"]:
+                property_events = property_data.get("events") or []
+                property_records.append({k: v for k, v in property_data.items() if k != "events"})
+                events.extend(property_events)
+                event_counts.append(len(property_events))
 
-                # Create a property record without events
-                property_record = {k: v for k, v in property_data.items() if k != "events"}
+            self._update_account_info(results.get("account_info"))
 
-                if not events:
-                    # If no events, add the property as is
-                    properties_with_events.append(property_record)
-                else:
-                    # For each event, create a record with property data and this event
-                    for event in events:
-                        combined_record = property_record.copy()
-                        combined_record["event"] = event
-                        properties_with_events.append(combined_record)
+        return property_records, events, np.asarray(event_counts, dtype=np.int64)
 
-            self._update_account_info(account_info)
+    def _as_pd_dataframe(self, data: list[Mapping[str, Any]]) -> pd.DataFrame:
+        """
+        Convert API response data to a pandas DataFrame with events as rows.
 
-        if not properties_with_events:
-            return pd.DataFrame()
+        Properties and their events are flattened into two separate tables, then
+        joined once: each event row takes the columns of the property it belongs
+        to, with the event's own columns prefixed ``event_``. A property without
+        events keeps a single row with empty event columns.
+        """
+        backend = self._frame_backend
+        property_records, events, event_counts = self._collect_records(data)
+        if not property_records:
+            return backend.empty()
+
+        # Row i of the result belongs to property property_rows[i]; properties
+        # without events still take one row.
+        rows_per_property = np.maximum(event_counts, 1)
+        property_rows = np.repeat(np.arange(len(property_records)), rows_per_property)
+        all_data_df = backend.take_rows(backend.flatten_records(property_records), property_rows)
+
+        if not events:
+            return self._format_output(all_data_df)
+
+        event_df = backend.flatten_records(events)
+        event_df = backend.rename_columns(event_df, ["event_" + col for col in event_df.columns])
+        if len(event_df) != len(all_data_df):
+            # Leave the rows of properties without events empty.
+            event_rows = np.full(len(all_data_df), -1)
+            event_rows[np.repeat(event_counts > 0, rows_per_property)] = np.arange(len(events))
+            event_df = backend.take_rows(event_df, event_rows)
+
+        return self._format_output(backend.concat_columns(all_data_df, event_df))
+
+    def _as_pd_tables(self, data: list[Mapping[str, Any]]) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Convert API response data to a properties table and an events table.
 
-        # Use json_normalize to flatten the nested structure
-        all_data_df = pd.json_normalize(
-            properties_with_events,
-            sep="_",  # Use underscore as separator for nested fields
+        The properties table has one row per property. The events table has one
+        row per event, with its own (unprefixed) columns and a
+        ``parcl_property_id`` column referring back to the property.
+        """
+        backend = self._frame_backend
+        property_records, events, event_counts = self._collect_records(data)
+        properties_df = backend.flatten_records(property_records)
+
+        property_ids = [record.get("parcl_property_id") for record in property_records]
+        events_df = backend.insert_first(
+            backend.flatten_records(events),
+            "parcl_property_id",
+            np.repeat(property_ids, event_counts),
         )
 
-        # If we have event data, normalize it
-        if "event" in all_data_df.columns:
-            # Get indices of rows with events
-            event_indices = all_data_df["event"].notna()
-
-            if event_indices.any():
-                # Normalize the event data
-                event_df = pd.json_normalize(
-                    all_data_df.loc[event_indices, "event"].tolist(), sep="_"
-                )
+        return self._format_output(properties_df), self._format_output(events_df)
 
-                # Add event_ prefix to all columns
-                event_df.columns = ["event_" + col for col in event_df.columns]
+    def _as_arrow_table(self, data: list[Mapping[str, Any]]) -> "pa.Table":
+        """
+        Arrow counterpart of ``_as_pd_dataframe``, with the same rows and columns.
 
-                # Add the event data back to the main dataframe
-                for col in event_df.columns:
-                    all_data_df.loc[event_indices, col] = event_df[col].to_numpy()
+        Pages are converted with the schema inferred from the first one, then the
+        ``events`` list column is exploded to one row per event and flattened
+        into ``event_`` columns.
+        """
+        builder = TableBuilder()
+        for results in data:
+            if results is None or not results.get("data"):
+                continue
+            builder.append(results["data"])
+            self._update_account_info(results.get("account_info"))
 
-                # Drop the original event column
-                all_data_df = all_data_df.drop("event", axis=1)
+        table = builder.finish()
+        if "events" not in table.column_names:
+            return flatten_table(table)
 
-        return all_data_df
+        table, events = explode_list_column(table, "events")
+        return add_flattened_column(flatten_table(table), "event", events)
 
     def _get_metadata(self, results: list[Mapping[str, Any]]) -> dict[str, Any]:
         """Get metadata from results with accurate returned_count."""
@@ -594,7 +706,13 @@ class PropertyV2Service(ParclLabsService):
         include_full_event_history: bool | None = None,
         limit: int | None = None,
         params: Mapping[str, Any] | None = None,
-    ) -> tuple[pd.DataFrame, dict[str, Any]]:
+        sink: ParquetSink | str | os.PathLike | None = None,
+        split_events: bool = False,
+    ) -> (
+        tuple[pd.DataFrame, dict[str, Any]]
+        | tuple[pd.DataFrame, pd.DataFrame, dict[str, Any]]
+        | dict[str, Any]
+    ):
         """
         Retrieve property data based on search criteria and filters.
 
@@ -648,9 +766,24 @@ class PropertyV2Service(ParclLabsService):
                 ParclLabsTruncationWarning is emitted and
                 ``metadata["results"]`` reports both counts.
             params: Additional parameters to pass to the request.
+            sink: A ParquetSink, or a dataset directory to create one for. When
+                given, each page is written to the sink as a row group as soon as
+                it arrives instead of being collected in memory, and only the
+                metadata dictionary is returned. Requires ``pyarrow``.
+            split_events: Return properties and events as two DataFrames instead of
+                one event-level DataFrame. The properties DataFrame has one row per
+                property; the events DataFrame has one row per event and a
+                ``parcl_property_id`` column to join on. Property attributes are not
+                repeated for every event, which keeps long histories much smaller.
         Returns:
-            A tuple containing (pandas DataFrame, metadata dictionary).
+            A tuple containing (pandas DataFrame, metadata dictionary); a tuple
+            containing (properties DataFrame, events DataFrame, metadata dictionary)
+            when ``split_events`` is True; or only the metadata dictionary when
+            ``sink`` is given.
         """
+        if sink is not None and split_events:
+            raise ValueError("split_events cannot be combined with sink.")
+
         print("Processing property search request...")
 
         # Validate and process input parameters using Pydantic schema
@@ -696,6 +829,232 @@ class PropertyV2Service(ParclLabsService):
             params=params or {},
         )
 
+        data = self._build_request_body(input_params)
+
+        if sink is not None:
+            return self._execute_search_to_sink(data, input_params, ParquetSink.coerce(sink))
+        return self._execute_search(data, input_params, split_events=split_events)
+
+    def retrieve_arrow(self, **kwargs: Any) -> tuple["pa.Table", dict[str, Any]]:  # noqa: ANN401
+        """
+        Like ``retrieve``, but return the event-level result as a ``pyarrow.Table``
+        built directly from the JSON pages, without constructing a pandas DataFrame.
+
+        Accepts the same keyword arguments as ``retrieve`` except ``sink`` and
+        ``split_events``. The schema is inferred from the first page and reused,
+        so fields that first appear on a later page are not included. Requires
+        ``pyarrow``.
+
+        Returns:
+            A tuple of (pyarrow.Table, metadata dictionary).
+        """
+        require_pyarrow()
+        data, input_params = self._validate_retrieve_kwargs(kwargs)
+        return self._execute_search(data, input_params, as_arrow=True)
+
+    def iter_pages(self, **kwargs: Any) -> Iterator[dict[str, Any]]:  # noqa: ANN401
+        """
+        Yield raw response pages one at a time, as soon as each has been fetched.
+
+        Accepts the same keyword arguments as ``retrieve``; ``limit`` still caps
+        the total number of properties. Pages are yielded in offset order and at
+        most a window of ``num_workers`` pages is held in memory, so very large
+        searches can be processed or persisted page by page. Truncation and
+        incomplete-result warnings are emitted as in ``retrieve``, once the last
+        page has been yielded.
+        """
+        yield from self._iter_search_pages(*self._validate_retrieve_kwargs(kwargs))
+
+    def iter_frames(self, **kwargs: Any) -> Iterator[pd.DataFrame]:  # noqa: ANN401
+        """
+        Like ``iter_pages``, but yields each page flattened into the event-level
+        DataFrame ``retrieve`` builds. Empty pages are skipped.
+        """
+        for page in self._iter_search_pages(*self._validate_retrieve_kwargs(kwargs)):
+            frame = self._as_pd_dataframe([page])
+            if len(frame):
+                yield frame
+
+    def sync(
+        self,
+        store: "LocalStore",
+        table: str = "property_v2",
+        **kwargs: Any,  # noqa: ANN401
+    ) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, Any]]:
+        """
+        Retrieve only the properties and events updated since the last sync of the
+        same search, and upsert them into ``store``.
+
+        Accepts the search filters of ``retrieve``, except ``limit``,
+        ``max_record_updated_date``, ``sink`` and ``split_events``. Each distinct
+        search keeps a watermark in the store: the UTC date its last complete sync
+        started. The next sync requests records updated on or after that date (or
+        after ``min_record_updated_date``, if later), so the previous run's day is
+        re-read rather than missed; the upserts make the overlap harmless. The
+        first sync of a search retrieves everything it matches.
+
+        Properties are upserted into ``{table}_properties`` keyed on
+        ``parcl_property_id``, and events into ``{table}_events`` keyed on
+        ``parcl_property_id``, ``event_date``, ``event_type`` and ``event_name``.
+        The watermark is not advanced if any page failed.
+
+        Returns:
+            A tuple of (properties DataFrame, events DataFrame, metadata dictionary)
+            with the rows this sync retrieved, as ``retrieve`` returns them with
+            ``split_events=True``. ``metadata["sync"]`` holds the
+            ``min_record_updated_date`` requested and the new watermark.
+        """
+        data, input_params, sync = self._plan_sync(store, table, kwargs)
+        result = self._execute_search(data, input_params, split_events=True)
+        return self._store_sync(store, sync, result)
+
+    def _plan_sync(
+        self, store: "LocalStore", table: str, retrieve_kwargs: dict[str, Any]
+    ) -> tuple[dict[str, Any], PropertyV2RetrieveParams, dict[str, Any]]:
+        """Build the request body of a sync, resuming from the search's watermark."""
+        unsupported = sorted(SYNC_UNSUPPORTED_KWARGS.intersection(retrieve_kwargs))
+        if unsupported:
+            raise ValueError(f"sync does not accept {unsupported}.")
+
+        retrieve_kwargs = dict(retrieve_kwargs)
+        min_record_updated_date = retrieve_kwargs.pop("min_record_updated_date", None)
+        search, input_params = self._validate_retrieve_kwargs(retrieve_kwargs)
+        name = f"{table}:" + ResponseCache.key("POST", self.url, input_params.params, search)
+        since = max(
+            filter(None, [store.sync_watermark(name), min_record_updated_date]), default=None
+        )
+        sync = {
+            "table": table,
+            "name": name,
+            "min_record_updated_date": since,
+            "watermark": datetime.now(UTC).strftime("%Y-%m-%d"),
+        }
+        data, input_params = self._validate_retrieve_kwargs(
+            {**retrieve_kwargs, "min_record_updated_date": since}
+        )
+        return data, input_params, sync
+
+    @staticmethod
+    def _store_sync(
+        store: "LocalStore",
+        sync: dict[str, Any],
+        result: tuple[pd.DataFrame, pd.DataFrame, dict[str, Any]],
+    ) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, Any]]:
+        """Upsert a sync's properties and events, then advance its watermark.
+
+        Events without an ``event_type`` or ``event_name`` are stored with
+        ``MISSING_KEY_TEXT`` in its place; the returned frames are unchanged.
+        """
+        properties_df, events_df, metadata = result
+        store.upsert(f"{sync['table']}_properties", properties_df, key=list(PROPERTY_KEY))
+        events = events_df if isinstance(events_df, pd.DataFrame) else events_df.to_pandas()
+        text_key = [col for col in ("event_type", "event_name") if col in events.columns]
+        events = events.astype(dict.fromkeys(text_key, object)).fillna(
+            dict.fromkeys(text_key, MISSING_KEY_TEXT)
+        )
+        store.upsert(f"{sync['table']}_events", events, key=list(EVENT_KEY))
+        if not metadata.get("incomplete_pages"):
+            store.set_sync_watermark(sync["name"], sync["watermark"])
+        metadata["sync"] = sync
+        return result
+
+    def _validate_retrieve_kwargs(
+        self, retrieve_kwargs: dict[str, Any]
+    ) -> tuple[dict[str, Any], PropertyV2RetrieveParams]:
+        """Validate ``retrieve`` keyword arguments and build the request body."""
+        input_params = PropertyV2RetrieveParams(
+            **{**retrieve_kwargs, "params": retrieve_kwargs.get("params") or {}}
+        )
+        return self._build_request_body(input_params), input_params
+
+    def _iter_search_pages(
+        self,
+        data: dict[str, Any],
+        input_params: PropertyV2RetrieveParams,
+        stacklevel: int = WARNING_STACKLEVEL,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield every page of the search described by a built request body.
+
+        ``stacklevel`` is forwarded to the pagination warnings so they point at the
+        caller's line whether pages are consumed directly or through a sink.
+        """
+        request_params, max_results = self._resolve_request_params(data, input_params)
+
+        parcl_property_ids = data.get(PARCL_PROPERTY_IDS)
+        if parcl_property_ids and len(parcl_property_ids) > PARCL_PROPERTY_IDS_LIMIT:
+            yield from self._iter_parcl_property_id_chunks(request_params, data)
+        else:
+            yield from self._iter_post_pages(request_params, data, max_results, stacklevel)
+
+    def _iter_post_pages(
+        self,
+        params: dict[str, Any],
+        data: dict[str, Any],
+        max_results: int | None = None,
+        stacklevel: int = WARNING_STACKLEVEL,
+    ) -> Iterator[dict]:
+        """Streaming counterpart of ``_fetch_post``: yield pages in offset order.
+
+        Failed offsets are recorded on the first page, as ``_fetch_post`` does,
+        once the last page has been yielded.
+        """
+        params = dict(params)
+        first_page = self._post(url=self.full_post_url, data=data, params=params).json()
+        pages, target, total_available = self._plan_pages(
+            first_page, params, max_results, stacklevel
+        )
+        yield first_page
+        if not pages:
+            return
+
+        def fetch_page(page: tuple[int, int]) -> dict | None:
+            page_offset, page_limit = page
+            try:
+                return self._fetch_page(data, params, page_offset, page_limit)
+            except Exception:  # surfaced as a warning below
+                return None
+
+        actually_retrieved = self._total_returned([first_page])
+        failed_offsets: list[int] = []
+        for (page_offset, _), page in zip(pages, self._imap(fetch_page, pages), strict=True):
+            if page is None:
+                failed_offsets.append(page_offset)
+                continue
+            actually_retrieved += self._total_returned([page])
+            yield page
+
+        if failed_offsets:
+            first_page.setdefault("_parcllabs", {})["incomplete_pages"] = sorted(failed_offsets)
+        self._warn_pagination_outcome(
+            failed_offsets,
+            target,
+            actually_retrieved,
+            total_available,
+            stacklevel=stacklevel,
+        )
+
+    def _iter_parcl_property_id_chunks(
+        self, params: dict[str, Any], data: dict[str, Any]
+    ) -> Iterator[dict]:
+        """Streaming counterpart of ``_fetch_post_parcl_property_ids`` for more than
+        PARCL_PROPERTY_IDS_LIMIT ids: yield one page per chunk, in order."""
+        parcl_property_ids = data.get(PARCL_PROPERTY_IDS)
+
+        def fetch_chunk(numbered_chunk: tuple[int, list[int]]) -> dict:
+            chunk_num, chunk = numbered_chunk
+            chunk_data = data.copy()
+            chunk_data[PARCL_PROPERTY_IDS] = chunk
+            try:
+                result = self._post(url=self.full_post_url, data=chunk_data, params=params)
+                return self._parse_chunk_response(chunk_num, result)
+            except Exception as exc:
+                self._raise_chunk_error(chunk_num, exc)
+
+        chunks = self._split_parcl_property_ids(parcl_property_ids)
+        yield from self._imap(fetch_chunk, enumerate(chunks, start=1))
+
+    def _build_request_body(self, input_params: PropertyV2RetrieveParams) -> dict[str, Any]:
+        """Build the POST body (search criteria and filters) from validated params."""
         # Build search criteria
         data = self._build_search_criteria(
             parcl_ids=input_params.parcl_ids,
@@ -710,27 +1069,89 @@ class PropertyV2Service(ParclLabsService):
 
         # Update data with categories
         data.update(param_categories.model_dump(exclude_none=True))
+        return data
+
+    def _execute_search(
+        self,
+        data: dict[str, Any],
+        input_params: PropertyV2RetrieveParams,
+        split_events: bool = False,
+        as_arrow: bool = False,
+    ) -> tuple[pd.DataFrame, dict[str, Any]] | tuple[pd.DataFrame, pd.DataFrame, dict[str, Any]]:
+        """Fetch every page for a built request body and assemble the result."""
+        request_params, max_results = self._resolve_request_params(data, input_params)
+
+        # Make request with params
+        if data.get(PARCL_PROPERTY_IDS):
+            results = self._fetch_post_parcl_property_ids(params=request_params, data=data)
+        else:
+            results = self._fetch_post(params=request_params, data=data, max_results=max_results)
+
+        return self._assemble_results(results, split_events, as_arrow)
 
+    def _execute_search_to_sink(
+        self,
+        data: dict[str, Any],
+        input_params: PropertyV2RetrieveParams,
+        sink: ParquetSink,
+    ) -> dict[str, Any]:
+        """Write every page of a search to ``sink`` and return its metadata."""
+        written_pages = []
+        with sink:
+            for page in self._iter_search_pages(data, input_params, WARNING_STACKLEVEL + 1):
+                written_pages.append(self._write_page(sink, page))
+        return self._get_metadata(written_pages)
+
+    def _write_page(self, sink: ParquetSink, page: dict[str, Any]) -> dict[str, Any]:
+        """Write one page's rows to ``sink``, then drop them from the page.
+
+        The page is kept without its rows so metadata can still be assembled.
+        """
+        sink.write(self._as_pd_dataframe([page]))
+        page.pop("data", None)
+        return page
+
+    def _resolve_request_params(
+        self, data: dict[str, Any], input_params: PropertyV2RetrieveParams
+    ) -> tuple[dict[str, Any], int | None]:
+        """Resolve the query params and total cap for a built request body.
+
+        Returns:
+            ``(request_params, max_results)``.
+        """
         # Set limit. `auto_paginate` is deliberately NOT placed in request_params --
         # it is an internal concern and was previously leaking into the query string.
         request_params = input_params.params.copy()
 
-        # Make request with params
         if data.get(PARCL_PROPERTY_IDS):
             # Querying by explicit property IDs: the ID list bounds the result, so a
             # single page of PARCL_PROPERTY_IDS_LIMIT can always hold it, and >that
             # many IDs are chunked in _fetch_post_parcl_property_ids. The caller's
             # `limit` is not honoured on this path (breaking change -> DAT-122).
             request_params["limit"] = PARCL_PROPERTY_IDS_LIMIT
-            results = self._fetch_post_parcl_property_ids(params=request_params, data=data)
-        else:
-            page_size, max_results = self._set_limit_pagination(input_params.limit)
-            request_params["limit"] = page_size
-            results = self._fetch_post(params=request_params, data=data, max_results=max_results)
+            return request_params, None
 
+        page_size, max_results = self._set_limit_pagination(input_params.limit)
+        request_params["limit"] = page_size
+        return request_params, max_results
+
+    def _assemble_results(
+        self, results: list[dict], split_events: bool = False, as_arrow: bool = False
+    ) -> tuple[pd.DataFrame, dict[str, Any]] | tuple[pd.DataFrame, pd.DataFrame, dict[str, Any]]:
+        """Build the DataFrame(s), or Arrow table, and metadata from raw page payloads."""
         # Get metadata from results
         metadata = self._get_metadata(results)
 
+        if as_arrow:
+            table = self._as_arrow_table(results)
+            self._check_pagination_integrity(table, metadata)
+            return table, metadata
+
+        if split_events:
+            properties_df, events_df = self._as_pd_tables(results)
+            self._check_pagination_integrity(properties_df, metadata)
+            return properties_df, events_df, metadata
+
         # Process results
         final_df = self._as_pd_dataframe(results)
 
@@ -739,14 +1160,19 @@ class PropertyV2Service(ParclLabsService):
         return final_df, metadata
 
     @staticmethod
-    def _check_pagination_integrity(final_df: pd.DataFrame, metadata: dict[str, Any]) -> None:
+    def _check_pagination_integrity(
+        final_df: "pd.DataFrame | pl.DataFrame | pa.Table", metadata: dict[str, Any]
+    ) -> None:
         """Warn if assembled pages did not yield the expected property count.
 
         Offset pagination is only safe while the server applies a stable sort. This
         is a cheap guard so an upstream ordering change surfaces here rather than as
-        silently duplicated or missing rows in a customer's dataset.
+        silently duplicated or missing rows in a customer's dataset. ``final_df``
+        may also be a Polars frame or the ``pyarrow.Table`` built by ``retrieve_arrow``.
         """
-        if final_df.empty or "parcl_property_id" not in final_df.columns:
+        is_table = is_arrow_table(final_df)
+        columns = final_df.column_names if is_table else final_df.columns
+        if len(final_df) == 0 or "parcl_property_id" not in columns:
             return
         # Pages that failed outright are already reported; don't double-warn.
         if metadata.get("incomplete_pages"):
@@ -756,6 +1182,223 @@ class PropertyV2Service(ParclLabsService):
         if not expected:
             return
 
-        unique_properties = final_df["parcl_property_id"].nunique()
+        if is_table:
+            unique_properties = count_distinct(final_df["parcl_property_id"])
+        else:
+            unique_properties = count_unique(final_df["parcl_property_id"])
         if unique_properties != expected:
             warn_integrity_mismatch(unique_properties, expected)
+
+
+class AsyncPropertyV2Service(PropertyV2Service, AsyncParclLabsService):
+    """Asyncio counterpart of PropertyV2Service; ``retrieve``, ``retrieve_arrow`` and
+    ``sync`` return coroutines.
+
+    Pages and parcl_property_id chunks are gathered concurrently, bounded by the
+    client's ``max_concurrency``.
+    """
+
+    async def _fetch_page(
+        self,
+        data: dict[str, Any],
+        params: dict[str, Any],
+        offset: int,
+        limit: int,
+    ) -> dict:
+        page_params = dict(params)
+        page_params["limit"] = limit
+        page_params["offset"] = offset
+        response = await self._post(url=self.full_post_url, data=data, params=page_params)
+        return response.json()
+
+    async def _fetch_post(
+        self,
+        params: dict[str, Any],
+        data: dict[str, Any],
+        max_results: int | None = None,
+    ) -> list[dict]:
+        """Fetch data using POST, gathering the remaining pages concurrently."""
+        params = dict(params)
+        response = await self._post(url=self.full_post_url, data=data, params=params)
+        all_data = [response.json()]
+
+        pages, target, total_available = self._plan_pages(all_data[0], params, max_results)
+        if not pages:
+            return all_data
+
+        page_results = await asyncio.gather(
+            *(
+                self._fetch_page(data, params, page_offset, page_limit)
+                for page_offset, page_limit in pages
+            ),
+            return_exceptions=True,
+        )
+
+        failed_offsets: list[int] = []
+        for (page_offset, _), page_result in zip(pages, page_results, strict=True):
+            if isinstance(page_result, Exception):  # surfaced as a warning below
+                failed_offsets.append(page_offset)
+            else:
+                all_data.append(page_result)
+
+        return self._finalize_pages(all_data, failed_offsets, target, total_available)
+
+    async def _fetch_post_parcl_property_ids(
+        self,
+        params: dict[str, Any],
+        data: dict[str, Any],
+    ) -> list[dict]:
+        """Fetch data for parcl_property_ids, gathering chunks concurrently."""
+        parcl_property_ids = data.get(PARCL_PROPERTY_IDS)
+        if len(parcl_property_ids) <= PARCL_PROPERTY_IDS_LIMIT:
+            return await self._fetch_post(params=params, data=data)
+
+        chunks = self._split_parcl_property_ids(parcl_property_ids)
+        print(f"Fetching {len(chunks)} chunks...")
+
+        async def fetch_chunk(chunk_num: int, chunk: list[int]) -> dict:
+            chunk_data = data.copy()
+            chunk_data[PARCL_PROPERTY_IDS] = chunk
+            try:
+                result = await self._post(url=self.full_post_url, data=chunk_data, params=params)
+                return self._parse_chunk_response(chunk_num, result)
+            except Exception as exc:
+                self._raise_chunk_error(chunk_num, exc)
+
+        all_data = await asyncio.gather(
+            *(fetch_chunk(idx + 1, chunk) for idx, chunk in enumerate(chunks))
+        )
+        print(f"All {len(chunks)} chunks completed successfully.")
+        return list(all_data)
+
+    async def _execute_search(
+        self,
+        data: dict[str, Any],
+        input_params: PropertyV2RetrieveParams,
+        split_events: bool = False,
+        as_arrow: bool = False,
+    ) -> tuple[pd.DataFrame, dict[str, Any]] | tuple[pd.DataFrame, pd.DataFrame, dict[str, Any]]:
+        request_params, max_results = self._resolve_request_params(data, input_params)
+
+        if data.get(PARCL_PROPERTY_IDS):
+            results = await self._fetch_post_parcl_property_ids(params=request_params, data=data)
+        else:
+            results = await self._fetch_post(
+                params=request_params, data=data, max_results=max_results
+            )
+
+        return self._assemble_results(results, split_events, as_arrow)
+
+    async def sync(
+        self,
+        store: "LocalStore",
+        table: str = "property_v2",
+        **kwargs: Any,  # noqa: ANN401
+    ) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, Any]]:
+        data, input_params, sync = await asyncio.to_thread(self._plan_sync, store, table, kwargs)
+        result = await self._execute_search(data, input_params, split_events=True)
+        return await asyncio.to_thread(self._store_sync, store, sync, result)
+
+    async def _execute_search_to_sink(
+        self,
+        data: dict[str, Any],
+        input_params: PropertyV2RetrieveParams,
+        sink: ParquetSink,
+    ) -> dict[str, Any]:
+        """Write every page to ``sink`` off the event loop and return the metadata."""
+        written_pages = []
+        with sink:
+            async for page in self._iter_search_pages(data, input_params):
+                written_pages.append(await asyncio.to_thread(self._write_page, sink, page))
+        return self._get_metadata(written_pages)
+
+    async def iter_pages(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:  # noqa: ANN401
+        """Asynchronous generator counterpart of ``PropertyV2Service.iter_pages``."""
+        async for page in self._iter_search_pages(*self._validate_retrieve_kwargs(kwargs)):
+            yield page
+
+    async def iter_frames(self, **kwargs: Any) -> AsyncIterator[pd.DataFrame]:  # noqa: ANN401
+        async for page in self._iter_search_pages(*self._validate_retrieve_kwargs(kwargs)):
+            frame = self._as_pd_dataframe([page])
+            if len(frame):
+                yield frame
+
+    async def _iter_search_pages(
+        self,
+        data: dict[str, Any],
+        input_params: PropertyV2RetrieveParams,
+        stacklevel: int = WARNING_STACKLEVEL,
+    ) -> AsyncIterator[dict[str, Any]]:
+        request_params, max_results = self._resolve_request_params(data, input_params)
+
+        parcl_property_ids = data.get(PARCL_PROPERTY_IDS)
+        if parcl_property_ids and len(parcl_property_ids) > PARCL_PROPERTY_IDS_LIMIT:
+            pages = self._iter_parcl_property_id_chunks(request_params, data)
+        else:
+            pages = self._iter_post_pages(request_params, data, max_results, stacklevel)
+        async for page in pages:
+            yield page
+
+    async def _iter_post_pages(
+        self,
+        params: dict[str, Any],
+        data: dict[str, Any],
+        max_results: int | None = None,
+        stacklevel: int = WARNING_STACKLEVEL,
+    ) -> AsyncIterator[dict]:
+        params = dict(params)
+        response = await self._post(url=self.full_post_url, data=data, params=params)
+        first_page = response.json()
+        pages, target, total_available = self._plan_pages(
+            first_page, params, max_results, stacklevel
+        )
+        yield first_page
+        if not pages:
+            return
+
+        async def fetch_page(page: tuple[int, int]) -> dict | None:
+            page_offset, page_limit = page
+            try:
+                return await self._fetch_page(data, params, page_offset, page_limit)
+            except Exception:  # surfaced as a warning below
+                return None
+
+        actually_retrieved = self._total_returned([first_page])
+        failed_offsets: list[int] = []
+        fetched_pages = self._imap(fetch_page, pages)
+        for page_offset, _ in pages:
+            page = await anext(fetched_pages)
+            if page is None:
+                failed_offsets.append(page_offset)
+                continue
+            actually_retrieved += self._total_returned([page])
+            yield page
+
+        if failed_offsets:
+            first_page.setdefault("_parcllabs", {})["incomplete_pages"] = sorted(failed_offsets)
+        self._warn_pagination_outcome(
+            failed_offsets,
+            target,
+            actually_retrieved,
+            total_available,
+            stacklevel=stacklevel,
+        )
+
+    async def _iter_parcl_property_id_chunks(
+        self, params: dict[str, Any], data: dict[str, Any]
+    ) -> AsyncIterator[dict]:
+        parcl_property_ids = data.get(PARCL_PROPERTY_IDS)
+
+        async def fetch_chunk(numbered_chunk: tuple[int, list[int]]) -> dict:
+            chunk_num, chunk = numbered_chunk
+            chunk_data = data.copy()
+            chunk_data[PARCL_PROPERTY_IDS] = chunk
+            try:
+                result = await self._post(url=self.full_post_url, data=chunk_data, params=params)
+                return self._parse_chunk_response(chunk_num, result)
+            except Exception as exc:
+                self._raise_chunk_error(chunk_num, exc)
+
+        chunks = self._split_parcl_property_ids(parcl_property_ids)
+        async for page in self._imap(fetch_chunk, enumerate(chunks, start=1)):
+            yield page
@@ -6,6 +6,8 @@ import pandas as pd
 from parcllabs.common import (
     GET_METHOD,
 )
+from parcllabs.enums import RequestLimits
+from parcllabs.services.async_parcllabs_service import AsyncParclLabsService
 from parcllabs.services.parcllabs_service import ParclLabsService
 
 
@@ -23,7 +25,7 @@ class SearchMarkets(ParclLabsService):
         for col in final_df.columns:
             if final_df[col].dtype in ["int64", "int32", "int16", "int8"]:
                 final_df[col] = final_df[col].astype(int)
-        return final_df
+        return self._format_output(final_df)
 
     def _prepare_params(
         self,
@@ -121,8 +123,57 @@ class SearchMarkets(ParclLabsService):
             params,
         )
 
-        results = self._fetch_get(url=self.full_url, params=params, auto_paginate=auto_paginate)
+        return self._search(params, auto_paginate)
+
+    def _search(self, params: dict[str, Any], auto_paginate: bool) -> pd.DataFrame:
+        """Fetch matching markets and keep the latest result on ``self.markets``.
+
+        With a client ``market_index``, the full market table is downloaded when
+        the index is missing or stale and the search is answered from it.
+        """
+        index = self.client.market_index
+        if index is None:
+            results = self._fetch_get(url=self.full_url, params=params, auto_paginate=auto_paginate)
+            return self._markets_as_pd_dataframe(results)
+
+        if index.needs_refresh():
+            results = self._fetch_get(
+                url=self.full_url, params=self._market_index_params(), auto_paginate=True
+            )
+            self._update_market_index(results)
+        return self._markets_as_pd_dataframe({"items": index.search(params, auto_paginate)})
+
+    def _market_index_params(self) -> dict[str, Any]:
+        """Request for every market, in pages as large as the endpoint allows."""
+        return {"location_type": "ALL", "limit": RequestLimits.DEFAULT_SMALL.value}
+
+    def _update_market_index(self, results: Mapping[str, Any]) -> None:
+        self.client.market_index.update(results.get("items"))
+        self._update_account_info(results.get("account"))
+
+    def _markets_as_pd_dataframe(self, results: Mapping[str, Any]) -> pd.DataFrame:
         data = self._as_pd_dataframe(results.get("items"))
         self._update_account_info(results.get("account"))
         self.markets = data
         return data
+
+
+class AsyncSearchMarkets(SearchMarkets, AsyncParclLabsService):
+    """
+    Asyncio counterpart of SearchMarkets; ``retrieve`` returns a coroutine.
+    """
+
+    async def _search(self, params: dict[str, Any], auto_paginate: bool) -> pd.DataFrame:
+        index = self.client.market_index
+        if index is None:
+            results = await self._fetch_get(
+                url=self.full_url, params=params, auto_paginate=auto_paginate
+            )
+            return self._markets_as_pd_dataframe(results)
+
+        if index.needs_refresh():
+            results = await self._fetch_get(
+                url=self.full_url, params=self._market_index_params(), auto_paginate=True
+            )
+            self._update_market_index(results)
+        return self._markets_as_pd_dataframe({"items": index.search(params, auto_paginate)})
@@ -0,0 +1,94 @@
+"""Coalescing of identical requests that are in flight at the same time.
+
+A ``SingleFlight`` is owned by the client and consulted by
+``ParclLabsService._make_request`` (and its async counterpart). While a request
+is being sent, any identical request from another thread, or another coroutine
+on the async client, waits for it instead of sending its own, and receives the
+same response or exception. Each caller decodes its own copy of the body, so
+mutating one caller's result does not affect the others. A dashboard whose
+callbacks ask for the same metro at once then makes one set of requests and
+spends credits once:
+
+    client = ParclLabsClient(api_key, coalesce_requests=True)
+
+Requests are identical when their method, URL, canonicalized query parameters
+and JSON body match, as for ``ResponseCache`` keys. Nothing is kept once a
+request finishes; later requests are sent again (or served by a cache).
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Any
+
+
+class SingleFlight:
+    """Share each in-flight request with identical requests made while it runs.
+
+    ``shared`` counts the requests that were answered by another's flight, and
+    ``est_credits_saved`` the credits those responses reported.
+    """
+
+    def __init__(self) -> None:
+        self.shared = 0
+        self.est_credits_saved = 0
+        self._lock = threading.Lock()
+        self._flights: dict[str, Future] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def do(self, key: str, send: Callable[[], Any]) -> tuple[Any, bool]:
+        """Return ``send()``, or the result of the identical flight already running.
+
+        Returns the result and whether it came from another caller's flight.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.shared += 1
+            else:
+                self._flights[key] = leader = Future()
+        if flight is not None:
+            return flight.result(), True
+
+        try:
+            result = send()
+        except BaseException as exc:
+            self._land(key)
+            leader.set_exception(exc)
+            raise
+        self._land(key)
+        leader.set_result(result)
+        return result, False
+
+    async def do_async(self, key: str, send: Callable[[], Awaitable[Any]]) -> tuple[Any, bool]:
+        """Coroutine counterpart of ``do``, for requests made on one event loop.
+
+        The flight runs as a task, so a caller that is cancelled does not cancel
+        it for the others.
+        """
+        task = self._tasks.get(key)
+        shared = task is not None
+        if shared:
+            with self._lock:
+                self.shared += 1
+        else:
+            task = asyncio.ensure_future(send())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._land_task(key, done))
+        return await asyncio.shield(task), shared
+
+    def record_credits_saved(self, est_credits: float) -> None:
+        with self._lock:
+            self.est_credits_saved += est_credits
+
+    def stats(self) -> dict[str, Any]:
+        return {"shared": self.shared, "est_credits_saved": self.est_credits_saved}
+
+    def _land(self, key: str) -> None:
+        with self._lock:
+            del self._flights[key]
+
+    def _land_task(self, key: str, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
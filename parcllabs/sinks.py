@@ -0,0 +1,171 @@
+"""Output sinks that persist retrieved data as it arrives.
+
+``ParquetSink`` writes each DataFrame it is given to a Parquet dataset
+directory as its own row group, so a retrieval never has to hold more than one
+page in memory:
+
+    from parcllabs import ParquetSink
+
+    metadata = client.property_v2.search.retrieve(
+        parcl_ids=[2900187], sink=ParquetSink("events/", overwrite=True)
+    )
+    df = pd.read_parquet("events/")
+
+Requires ``pyarrow`` (``pip install parcllabs[parquet]``).
+"""
+
+import os
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # only ParquetSink needs pyarrow; it raises a clear error
+    pa = None
+    pq = None
+
+if TYPE_CHECKING:
+    import polars as pl
+
+PART_FILE_TEMPLATE = "part-{:05d}.parquet"
+PART_FILE_GLOB = "part-*.parquet"
+
+
+class ParquetSink:
+    """Write DataFrames to a Parquet dataset directory, one row group per frame.
+
+    The first frame sets the schema. Later frames are conformed to it: missing
+    columns are filled with nulls and compatible types are cast. When a frame
+    cannot be conformed (a new column, or a column that was all-null or integer so
+    far and now holds strings or floats), the schema is widened and a new part
+    file is started. On ``close`` every part written with an older schema is
+    rewritten, one row group at a time, so the finished dataset has one schema.
+
+    Args:
+        path: Dataset directory; created if it does not exist.
+        compression: Parquet compression codec.
+        overwrite: Delete part files left in ``path`` by a previous run. If False
+            and ``path`` already holds part files, ``FileExistsError`` is raised.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        compression: str = "snappy",
+        overwrite: bool = False,
+    ) -> None:
+        if pa is None:
+            raise ImportError(
+                "ParquetSink requires pyarrow. Install it with `pip install parcllabs[parquet]`."
+            )
+
+        self.path = Path(path)
+        self.compression = compression
+        self.path.mkdir(parents=True, exist_ok=True)
+        existing = sorted(self.path.glob(PART_FILE_GLOB))
+        if existing and not overwrite:
+            raise FileExistsError(
+                f"{self.path} already contains Parquet part files. "
+                "Pass overwrite=True to replace them."
+            )
+        for part in existing:
+            part.unlink()
+
+        self.schema: pa.Schema | None = None
+        self.rows_written = 0
+        self._writer: pq.ParquetWriter | None = None
+        self._parts: list[tuple[Path, pa.Schema]] = []
+
+    @classmethod
+    def coerce(cls, sink: "ParquetSink | str | os.PathLike") -> "ParquetSink":
+        """Return ``sink`` itself, or a new sink writing to the directory ``sink``."""
+        return sink if isinstance(sink, cls) else cls(sink)
+
+    @property
+    def files(self) -> list[Path]:
+        """Part files written so far."""
+        return [part for part, _ in self._parts]
+
+    def write(self, frame: "pd.DataFrame | pl.DataFrame") -> None:
+        """Append ``frame`` (pandas or Polars) to the dataset as a single row group."""
+        if not len(frame):
+            return
+
+        if isinstance(frame, pd.DataFrame):
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+        else:
+            table = frame.to_arrow()
+        table = table.replace_schema_metadata(None)
+        if self.schema is None:
+            self._start_part(table.schema)
+        else:
+            table = self._conform(table)
+
+        self._writer.write_table(table, row_group_size=max(1, table.num_rows))
+        self.rows_written += table.num_rows
+
+    def close(self) -> None:
+        """Finish the current part file and rewrite parts with an outdated schema."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+        for part, schema in self._parts:
+            if not schema.equals(self.schema):
+                self._rewrite_part(part)
+        self._parts = [(part, self.schema) for part, _ in self._parts]
+
+    def __enter__(self) -> "ParquetSink":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _conform(self, table: "pa.Table") -> "pa.Table":
+        """Align ``table`` to the current schema, widening the schema if needed."""
+        if table.schema.equals(self.schema):
+            return table
+
+        if set(table.column_names) <= set(self.schema.names):
+            try:
+                return self._align(table, self.schema)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                pass
+
+        widened = pa.unify_schemas([self.schema, table.schema], promote_options="permissive")
+        self._writer.close()
+        self._start_part(widened)
+        return self._align(table, widened)
+
+    @staticmethod
+    def _align(table: "pa.Table", schema: "pa.Schema") -> "pa.Table":
+        """Add missing columns as nulls, order columns as ``schema`` and cast."""
+        for field in schema:
+            if field.name not in table.column_names:
+                table = table.append_column(field.name, pa.nulls(table.num_rows, field.type))
+        return table.select(schema.names).cast(schema)
+
+    def _start_part(self, schema: "pa.Schema") -> None:
+        part = self.path / PART_FILE_TEMPLATE.format(len(self._parts))
+        self.schema = schema
+        self._writer = pq.ParquetWriter(part, schema, compression=self.compression)
+        self._parts.append((part, schema))
+
+    def _rewrite_part(self, part: Path) -> None:
+        staging = part.with_suffix(".rewrite")
+        source = pq.ParquetFile(part)
+        with pq.ParquetWriter(staging, self.schema, compression=self.compression) as writer:
+            for index in range(source.num_row_groups):
+                table = self._align(source.read_row_group(index), self.schema)
+                writer.write_table(table, row_group_size=max(1, table.num_rows))
+        source.close()
+        staging.replace(part)
@@ -0,0 +1,477 @@
+"""Local store of retrieved results, keyed on their natural keys.
+
+A store keeps one table per dataset in a local database file: ``SQLiteStore``
+uses SQLite, and ``DuckDBStore`` the columnar DuckDB engine, which suits large
+tables shared by many notebooks. Rows are upserted on the table's key columns,
+so storing an overlapping pull replaces the rows it repeats instead of
+duplicating them. The natural keys are ``METRIC_KEY`` (plus the dimension
+filters of the request), ``PROPERTY_KEY`` and ``EVENT_KEY``.
+
+The latest stored date of each parcl_id is the watermark ``retrieve_incremental``
+resumes from, and a client given a store answers repeated metric queries from
+it without a request, until the stored answer is older than the store's
+``max_age``:
+
+    from parcllabs import ParclLabsClient, SQLiteStore
+
+    store = SQLiteStore("~/parcllabs.sqlite3")
+    new_rows = client.market_metrics.housing_event_prices.retrieve_incremental(
+        parcl_ids=[2900187], store=store
+    )
+    history = store.read("market_metrics_housing_event_prices", parcl_ids=[2900187])
+
+    client = ParclLabsClient(api_key, store=store)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+from parcllabs.common import DATE_COLUMNS
+
+try:
+    import duckdb
+except ImportError:  # only DuckDBStore needs duckdb; it raises a clear error
+    duckdb = None
+
+if TYPE_CHECKING:
+    import polars as pl
+
+DATE_FORMAT = "%Y-%m-%d"
+# Stored query answers are requested again after a day, like cached responses.
+DEFAULT_MAX_AGE_SECONDS = 24 * 60 * 60
+# SQLite allows at most 32766 bound parameters per statement.
+MAX_BOUND_PARAMETERS = 30_000
+
+# Natural keys of stored rows. Metric rows are also keyed on the dimension
+# filters of their request, such as ``property_type``.
+METRIC_KEY = ("parcl_id", "date")
+PROPERTY_KEY = ("parcl_property_id",)
+EVENT_KEY = ("parcl_property_id", "event_date", "event_type", "event_name")
+# The API returns some events without an ``event_name``. Missing text key parts
+# are stored as this value, so such events can still be upserted.
+MISSING_KEY_TEXT = ""
+
+# Watermarks of ``PropertyV2Service.sync``, one per synced search.
+SYNC_TABLE = "_sync_watermarks"
+# Dates and columns each parcl_id returned for a stored query, and when; see
+# ``query_bounds``.
+QUERY_TABLE = "_store_queries"
+INTERNAL_TABLES = {
+    SYNC_TABLE: "(name TEXT PRIMARY KEY, watermark TEXT)",
+    QUERY_TABLE: (
+        "(name TEXT, parcl_id BIGINT, first_date TEXT, last_date TEXT, columns TEXT,"
+        " stored_at DOUBLE, PRIMARY KEY (name, parcl_id))"
+    ),
+}
+
+
+class LocalStore(ABC):
+    """Tables of results in a local database, upserted on their key columns.
+
+    A table is created by the first ``upsert`` into it, with that call's columns
+    and key; later upserts must use the same key and add any new columns. Dates
+    are read back as datetimes. Safe to use from the worker threads of a single
+    client. Use one of the subclasses, ``SQLiteStore`` or ``DuckDBStore``; a
+    backend implements the abstract hooks at the end of the class.
+
+    Args:
+        path: Database file; ``":memory:"`` keeps the tables in memory.
+        max_age: Seconds a stored query answer is used for before the query is
+            requested again; None keeps answers until they are replaced.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike, max_age: float | None = DEFAULT_MAX_AGE_SECONDS
+    ) -> None:
+        if str(path) != ":memory:":
+            path = Path(path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._connection = self._connect(path)
+        for table, columns in INTERNAL_TABLES.items():
+            self._connection.execute(f"CREATE TABLE IF NOT EXISTS {table} {columns}")
+        self._commit()
+
+    def tables(self) -> list[str]:
+        with self._lock:
+            names = self._table_names()
+        return sorted(name for name in names if name not in INTERNAL_TABLES)
+
+    def key(self, table: str) -> list[str]:
+        """Key columns of ``table``, in key order; empty if it does not exist."""
+        with self._lock:
+            return self._table_info(table)[1]
+
+    def upsert(
+        self,
+        table: str,
+        frame: "pd.DataFrame | pl.DataFrame",
+        key: Sequence[str],
+    ) -> int:
+        """Insert the rows of ``frame``, replacing stored rows with the same key.
+
+        Returns the number of rows written.
+        """
+        if not isinstance(frame, pd.DataFrame):
+            frame = frame.to_pandas()
+        if frame.empty:
+            return 0
+        missing = [col for col in key if col not in frame.columns or frame[col].isna().any()]
+        if missing:
+            raise ValueError(f"Rows for {table} have missing values in key columns {missing}.")
+
+        with self._lock:
+            self._prepare_table(table, frame, key)
+            self._write(table, frame, list(key))
+            self._commit()
+        return len(frame)
+
+    def read(
+        self,
+        table: str,
+        parcl_ids: Iterable[int] | None = None,
+        where: Mapping[str, Any] | None = None,
+        id_column: str = "parcl_id",
+    ) -> pd.DataFrame:
+        """Rows of ``table``, optionally only those of ``parcl_ids`` and matching ``where``."""
+        batches = _batches(parcl_ids)
+        if table not in self.tables() or not batches:
+            return pd.DataFrame()
+
+        clauses, values = _where_clauses(where)
+        frames = []
+        for ids in batches:
+            id_clauses = clauses if ids is None else [*clauses, _in_clause(id_column, ids)]
+            query = f"SELECT * FROM {_quote(table)}" + _where(id_clauses)  # noqa: S608
+            with self._lock:
+                frames.append(self._select(query, [*values, *(ids or [])]))
+        frame = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        for col in DATE_COLUMNS:
+            if col in frame.columns and not pd.api.types.is_datetime64_any_dtype(frame[col]):
+                frame[col] = pd.to_datetime(frame[col], format=DATE_FORMAT, errors="coerce")
+        return frame
+
+    def watermarks(
+        self,
+        table: str,
+        parcl_ids: Iterable[int],
+        where: Mapping[str, Any] | None = None,
+        date_column: str = "date",
+        id_column: str = "parcl_id",
+    ) -> dict[int, str]:
+        """Latest stored ``date_column`` of each parcl_id that has rows, as ``YYYY-MM-DD``."""
+        if table not in self.tables():
+            return {}
+
+        clauses, values = _where_clauses(where)
+        watermarks = {}
+        for ids in _batches(parcl_ids):
+            query = (
+                f"SELECT {_quote(id_column)}, MAX({_quote(date_column)}) FROM {_quote(table)}"  # noqa: S608
+                + _where([*clauses, _in_clause(id_column, ids)])
+                + f" GROUP BY {_quote(id_column)}"
+            )
+            watermarks.update(self._query(query, [*values, *ids]))
+        return {
+            parcl_id: pd.Timestamp(date).strftime(DATE_FORMAT)
+            for parcl_id, date in watermarks.items()
+            if date is not None
+        }
+
+    def sync_watermark(self, name: str) -> str | None:
+        """Watermark last recorded for the sync ``name``; None if it never completed."""
+        rows = self._query(
+            f"SELECT watermark FROM {SYNC_TABLE} WHERE name = ?",  # noqa: S608
+            [name],
+        )
+        return rows[0][0] if rows else None
+
+    def set_sync_watermark(self, name: str, watermark: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                f"INSERT INTO {SYNC_TABLE} VALUES (?, ?) "  # noqa: S608
+                "ON CONFLICT (name) DO UPDATE SET watermark = excluded.watermark",
+                (name, watermark),
+            )
+            self._commit()
+
+    def query_bounds(
+        self, name: str, parcl_ids: Iterable[int]
+    ) -> dict[int, tuple[str | None, str | None]]:
+        """First and last date the stored query ``name`` returned for each parcl_id.
+
+        parcl_ids the query was not stored for, or stored more than ``max_age``
+        seconds ago, are left out; ``(None, None)`` means it returned no rows for
+        that parcl_id.
+        """
+        return {
+            parcl_id: (first, last)
+            for parcl_id, first, last, _ in self._stored_queries(name, parcl_ids)
+        }
+
+    def query_columns(self, name: str, parcl_ids: Iterable[int]) -> list[str]:
+        """Columns, in order, of the answers ``query_bounds`` returns for ``name``."""
+        columns = {}
+        for *_, stored_columns in self._stored_queries(name, parcl_ids):
+            columns.update(dict.fromkeys(json.loads(stored_columns)))
+        return list(columns)
+
+    def set_query_bounds(
+        self,
+        name: str,
+        bounds: Mapping[int, tuple[str | None, str | None]],
+        columns: Sequence[str] = (),
+    ) -> None:
+        """Record the dates and columns the query ``name`` returned for each parcl_id."""
+        stored_columns, stored_at = json.dumps(list(columns)), time.time()
+        rows = [
+            (name, int(parcl_id), first, last, stored_columns, stored_at)
+            for parcl_id, (first, last) in bounds.items()
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._connection.executemany(
+                f"INSERT INTO {QUERY_TABLE} VALUES (?, ?, ?, ?, ?, ?) "  # noqa: S608
+                "ON CONFLICT (name, parcl_id) DO UPDATE SET "
+                "first_date = excluded.first_date, last_date = excluded.last_date, "
+                "columns = excluded.columns, stored_at = excluded.stored_at",
+                rows,
+            )
+            self._commit()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "LocalStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _stored_queries(self, name: str, parcl_ids: Iterable[int]) -> list[tuple]:
+        """``(parcl_id, first_date, last_date, columns)`` of the unexpired answers to ``name``."""
+        conditions, values = ["name = ?"], [name]
+        if self.max_age is not None:
+            conditions.append("stored_at >= ?")
+            values.append(time.time() - self.max_age)
+        rows = []
+        for ids in _batches(parcl_ids):
+            query = f"SELECT parcl_id, first_date, last_date, columns FROM {QUERY_TABLE}" + _where(  # noqa: S608
+                [*conditions, _in_clause("parcl_id", ids)]
+            )
+            rows.extend(self._query(query, [*values, *ids]))
+        return rows
+
+    def _query(self, query: str, values: Sequence[Any] = ()) -> list[tuple]:
+        with self._lock:
+            return self._connection.execute(query, values).fetchall()
+
+    def _prepare_table(self, table: str, frame: pd.DataFrame, key: Sequence[str]) -> None:
+        """Create ``table`` for ``frame``, or add the columns it lacks."""
+        stored_columns, stored_key = self._table_info(table)
+        if not stored_columns:
+            columns = [f"{_quote(col)} {self._column_type(col, frame[col])}" for col in frame]
+            primary_key = ", ".join(_quote(col) for col in key)
+            self._connection.execute(
+                f"CREATE TABLE {_quote(table)} ({', '.join(columns)}, PRIMARY KEY ({primary_key}))"
+            )
+            return
+
+        if stored_key != list(key):
+            raise ValueError(
+                f"{table} is keyed on {stored_key}, not {list(key)}. "
+                "Store rows with a different key in another table."
+            )
+        for col in frame.columns:
+            if col not in stored_columns:
+                self._connection.execute(
+                    f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(col)} "
+                    + self._column_type(col, frame[col])
+                )
+
+    # Database-specific parts, called with the lock held (except _connect).
+
+    @abstractmethod
+    def _connect(self, path: str | Path) -> Any:  # noqa: ANN401
+        ...
+
+    @abstractmethod
+    def _commit(self) -> None: ...
+
+    @abstractmethod
+    def _table_names(self) -> list[str]: ...
+
+    @abstractmethod
+    def _table_info(self, table: str) -> tuple[list[str], list[str]]:
+        """Columns of ``table`` and its key columns in key order; empty if it does not exist."""
+
+    @abstractmethod
+    def _column_type(self, name: str, values: pd.Series) -> str: ...
+
+    @abstractmethod
+    def _write(self, table: str, frame: pd.DataFrame, key: list[str]) -> None: ...
+
+    @abstractmethod
+    def _select(self, query: str, values: Sequence[Any]) -> pd.DataFrame: ...
+
+
+class SQLiteStore(LocalStore):
+    """A ``LocalStore`` in a SQLite file. Dates are stored as ``YYYY-MM-DD`` text."""
+
+    def _connect(self, path: str | Path) -> sqlite3.Connection:
+        return sqlite3.connect(path, check_same_thread=False)
+
+    def _commit(self) -> None:
+        self._connection.commit()
+
+    def _table_names(self) -> list[str]:
+        rows = self._connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        return [name for (name,) in rows]
+
+    def _table_info(self, table: str) -> tuple[list[str], list[str]]:
+        rows = self._connection.execute(f"PRAGMA table_info({_quote(table)})").fetchall()
+        keyed = sorted((position, name) for _, name, _, _, _, position in rows if position)
+        return [name for _, name, *_ in rows], [name for _, name in keyed]
+
+    def _column_type(self, name: str, values: pd.Series) -> str:  # noqa: ARG002
+        if pd.api.types.is_bool_dtype(values) or pd.api.types.is_integer_dtype(values):
+            return "INTEGER"
+        if pd.api.types.is_float_dtype(values):
+            return "REAL"
+        return "TEXT"
+
+    def _write(self, table: str, frame: pd.DataFrame, key: list[str]) -> None:
+        rows = f"VALUES ({', '.join('?' * len(frame.columns))})"
+        self._connection.executemany(
+            _upsert_statement(table, list(frame.columns), key, rows), _to_sql_values(frame)
+        )
+
+    def _select(self, query: str, values: Sequence[Any]) -> pd.DataFrame:
+        return pd.read_sql_query(query, self._connection, params=list(values))
+
+
+class DuckDBStore(LocalStore):
+    """A ``LocalStore`` in a DuckDB file.
+
+    DuckDB stores tables by column, so scans and aggregations over long
+    histories are fast, and frames are inserted column-wise instead of row by
+    row. Dates are stored as ``DATE``. Requires ``duckdb``
+    (``pip install parcllabs[duckdb]``).
+    """
+
+    def __init__(
+        self, path: str | os.PathLike, max_age: float | None = DEFAULT_MAX_AGE_SECONDS
+    ) -> None:
+        if duckdb is None:
+            raise ImportError(
+                "DuckDBStore requires duckdb. Install it with `pip install parcllabs[duckdb]`."
+            )
+        super().__init__(path, max_age)
+
+    def _connect(self, path: str | Path) -> "duckdb.DuckDBPyConnection":
+        return duckdb.connect(str(path))
+
+    def _commit(self) -> None:
+        """DuckDB commits every statement as it runs."""
+
+    def _table_names(self) -> list[str]:
+        rows = self._connection.execute("SELECT table_name FROM duckdb_tables()").fetchall()
+        return [name for (name,) in rows]
+
+    def _table_info(self, table: str) -> tuple[list[str], list[str]]:
+        columns = self._connection.execute(
+            "SELECT column_name FROM duckdb_columns() WHERE table_name = ? ORDER BY column_index",
+            [table],
+        ).fetchall()
+        key = self._connection.execute(
+            "SELECT constraint_column_names FROM duckdb_constraints() "
+            "WHERE table_name = ? AND constraint_type = 'PRIMARY KEY'",
+            [table],
+        ).fetchall()
+        return [name for (name,) in columns], list(key[0][0]) if key else []
+
+    def _column_type(self, name: str, values: pd.Series) -> str:
+        if name in DATE_COLUMNS:
+            return "DATE"
+        if pd.api.types.is_bool_dtype(values):
+            return "BOOLEAN"
+        if pd.api.types.is_integer_dtype(values):
+            return "BIGINT"
+        if pd.api.types.is_float_dtype(values):
+            return "DOUBLE"
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return "TIMESTAMP"
+        return "VARCHAR"
+
+    def _write(self, table: str, frame: pd.DataFrame, key: list[str]) -> None:
+        # A statement cannot update the same row twice; as in SQLite, the last row wins.
+        frame = frame.drop_duplicates(subset=key, keep="last")
+        columns = list(frame.columns)
+        rows = f"SELECT {', '.join(_quote(col) for col in columns)} FROM upsert_rows"  # noqa: S608
+        self._connection.register("upsert_rows", frame)
+        try:
+            self._connection.execute(_upsert_statement(table, columns, key, rows))
+        finally:
+            self._connection.unregister("upsert_rows")
+
+    def _select(self, query: str, values: Sequence[Any]) -> pd.DataFrame:
+        return self._connection.execute(query, list(values)).df()
+
+
+def _upsert_statement(table: str, columns: list[str], key: list[str], rows: str) -> str:
+    """Insert ``rows`` into ``columns`` of ``table``, updating rows with the same key."""
+    updates = [f"{_quote(col)} = excluded.{_quote(col)}" for col in columns if col not in key]
+    return (
+        f"INSERT INTO {_quote(table)} ({', '.join(_quote(col) for col in columns)}) {rows} "
+        f"ON CONFLICT ({', '.join(_quote(col) for col in key)}) "
+        + (f"DO UPDATE SET {', '.join(updates)}" if updates else "DO NOTHING")
+    )
+
+
+def _quote(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _to_sql_values(frame: pd.DataFrame) -> list[tuple]:
+    """Rows of ``frame`` as tuples of Python values, with missing values as None."""
+    columns = {}
+    for col in frame.columns:
+        values = frame[col]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            text = values.dt.strftime(DATE_FORMAT) if col in DATE_COLUMNS else values.astype(str)
+            values = text.where(values.notna(), None)
+        columns[col] = values.astype(object).where(values.notna(), None).tolist()
+    return list(zip(*columns.values(), strict=True))
+
+
+def _where_clauses(where: Mapping[str, Any] | None) -> tuple[list[str], list[Any]]:
+    items = list((where or {}).items())
+    return [f"{_quote(col)} = ?" for col, _ in items], [value for _, value in items]
+
+
+def _in_clause(column: str, values: Sequence[Any]) -> str:
+    return f"{_quote(column)} IN ({', '.join('?' * len(values))})"
+
+
+def _where(clauses: list[str]) -> str:
+    return " WHERE " + " AND ".join(clauses) if clauses else ""
+
+
+def _batches(parcl_ids: Iterable[int] | None) -> list[list[int] | None]:
+    """parcl_ids in batches small enough to bind, or ``[None]`` for no filter."""
+    if parcl_ids is None:
+        return [None]
+    ids = list(dict.fromkeys(parcl_ids))
+    return [ids[i : i + MAX_BOUND_PARAMETERS] for i in range(0, len(ids), MAX_BOUND_PARAMETERS)]
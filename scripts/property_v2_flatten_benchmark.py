@@ -0,0 +1,142 @@
+"""
+Benchmark PropertyV2Service._as_pd_dataframe against the previous flattening.
+
+Builds a synthetic `/v2/property_search` payload (by default 1M events spread
+over properties with long histories), then flattens it twice: once with the
+previous row-wise approach, which copied the property record for every event,
+ran `pd.json_normalize` over the combined records and wrote event columns back
+one at a time, and once with the current columnar property/event join. Both
+results are checked for identical columns and values.
+
+Usage:
+    python scripts/property_v2_flatten_benchmark.py --events 1000000 --events_per_property 50
+"""
+
+import argparse
+import logging
+import random
+import time
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from parcllabs.services.properties.property_v2 import PropertyV2Service
+
+logging.basicConfig(
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
+)
+logger = logging.getLogger("Property_V2_Flatten_Benchmark")
+
+DEFAULT_EVENTS = 1_000_000
+DEFAULT_EVENTS_PER_PROPERTY = 50
+DEFAULT_PAGE_SIZE = 1000
+EVENT_TYPES = ["SALE", "LISTING", "RENTAL"]
+
+
+def make_payload(events: int, events_per_property: int, page_size: int) -> list[dict]:
+    """Build API pages holding `events` events in total."""
+    rng = random.Random(0)  # noqa: S311 (synthetic data)
+    properties = []
+    for parcl_property_id in range(events // events_per_property):
+        properties.append(
+            {
+                "parcl_property_id": parcl_property_id,
+                "property_metadata": {
+                    "address1": f"{parcl_property_id} Main St",
+                    "zip5": "10001",
+                    "bedrooms": rng.randint(1, 5),
+                    "square_footage": rng.randint(600, 4000),
+                    "latitude": 40.7,
+                    "longitude": -74.0,
+                },
+                "events": [
+                    {
+                        "event_type": rng.choice(EVENT_TYPES),
+                        "event_name": "SOLD",
+                        "event_date": "2024-01-01",
+                        "price": rng.randint(100_000, 1_000_000),
+                        "owner_occupied_flag": rng.randint(0, 1),
+                        "investor_flag": rng.randint(0, 1),
+                        "record_updated_date": "2024-06-01",
+                    }
+                    for _ in range(events_per_property)
+                ],
+            }
+        )
+    return [
+        {"data": properties[start : start + page_size], "account_info": {}}
+        for start in range(0, len(properties), page_size)
+    ]
+
+
+def legacy_as_pd_dataframe(data: list[dict]) -> pd.DataFrame:
+    """The row-wise flattening `_as_pd_dataframe` used before."""
+    properties_with_events = []
+    for results in data:
+        for property_data in results["data"]:
+            events = property_data.get("events", [])
+            property_record = {k: v for k, v in property_data.items() if k != "events"}
+            if not events:
+                properties_with_events.append(property_record)
+            else:
+                for event in events:
+                    combined_record = property_record.copy()
+                    combined_record["event"] = event
+                    properties_with_events.append(combined_record)
+
+    all_data_df = pd.json_normalize(properties_with_events, sep="_")
+    if "event" in all_data_df.columns:
+        event_indices = all_data_df["event"].notna()
+        if event_indices.any():
+            event_df = pd.json_normalize(all_data_df.loc[event_indices, "event"].tolist(), sep="_")
+            event_df.columns = ["event_" + col for col in event_df.columns]
+            for col in event_df.columns:
+                all_data_df.loc[event_indices, col] = event_df[col].to_numpy()
+            all_data_df = all_data_df.drop("event", axis=1)
+    return all_data_df
+
+
+def timed(func: object, *args: object) -> tuple[pd.DataFrame, float]:
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark PropertyV2 event flattening.")
+    parser.add_argument("--events", type=int, default=DEFAULT_EVENTS, help="Total events.")
+    parser.add_argument(
+        "--events_per_property",
+        type=int,
+        default=DEFAULT_EVENTS_PER_PROPERTY,
+        help="Events in each property's history.",
+    )
+    parser.add_argument(
+        "--page_size", type=int, default=DEFAULT_PAGE_SIZE, help="Properties per page."
+    )
+    args = parser.parse_args()
+
+    payload = make_payload(args.events, args.events_per_property, args.page_size)
+    client = MagicMock()
+    client.api_url = "https://api.parcllabs.com"
+    client.compact_dtypes = False
+    client.dataframe_backend = "pandas"
+    service = PropertyV2Service(client=client, url="/v2/property_search")
+
+    legacy_df, legacy_seconds = timed(legacy_as_pd_dataframe, payload)
+    current_df, current_seconds = timed(service._as_pd_dataframe, payload)
+
+    pd.testing.assert_frame_equal(
+        legacy_df[sorted(legacy_df.columns)],
+        current_df[sorted(current_df.columns)],
+        check_dtype=False,
+    )
+
+    logger.info(f"rows: {len(current_df)}, columns: {len(current_df.columns)}")
+    logger.info(f"legacy row-wise flattening: {legacy_seconds:.3f}s")
+    logger.info(f"columnar property/event join: {current_seconds:.3f}s")
+    logger.info(f"speedup: {legacy_seconds / current_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
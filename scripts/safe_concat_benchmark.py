@@ -0,0 +1,138 @@
+"""
+Benchmark safe_concat_and_format_dtypes against the previous implementation.
+
+Builds a synthetic metric pull of `--chunks` DataFrames (one per 1,000-parcl_id
+chunk response) with numeric, text, all-missing and all-blank columns, then
+combines them twice: once with the previous implementation, which copied every
+chunk twice and cast every text column of every chunk to `str` to find blank
+columns, and once with the current single-pass version. Reports wall time and
+peak traced memory for each, and checks that both return the same DataFrame.
+
+Usage:
+    python scripts/safe_concat_benchmark.py --chunks 1000 --rows_per_chunk 1000
+"""
+
+import argparse
+import logging
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from parcllabs.common import DATE_COLUMNS, ID_COLUMNS
+from parcllabs.services.data_utils import safe_concat_and_format_dtypes
+
+logging.basicConfig(
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
+)
+logger = logging.getLogger("Safe_Concat_Benchmark")
+
+DEFAULT_CHUNKS = 1000
+DEFAULT_ROWS_PER_CHUNK = 1000
+
+
+def make_chunks(chunks: int, rows_per_chunk: int) -> list[pd.DataFrame]:
+    """Build chunk DataFrames shaped like metric responses."""
+    rng = np.random.default_rng(0)
+    frames = []
+    for chunk in range(chunks):
+        frames.append(
+            pd.DataFrame(
+                {
+                    "parcl_id": np.arange(rows_per_chunk) + chunk * rows_per_chunk,
+                    "date": pd.Series(["2024-01-01"] * rows_per_chunk, dtype=object),
+                    "property_type": pd.Series(["SINGLE_FAMILY"] * rows_per_chunk, dtype=object),
+                    "median_price": rng.uniform(100_000, 900_000, rows_per_chunk),
+                    "count_sales": rng.integers(0, 100, rows_per_chunk),
+                    "name": pd.Series([f"market {chunk}"] * rows_per_chunk, dtype=object),
+                    "notes": pd.Series([""] * rows_per_chunk, dtype=object),
+                    "unused": np.full(rows_per_chunk, np.nan),
+                }
+            )
+        )
+    return frames
+
+
+def legacy_safe_concat_and_format_dtypes(data_container: list) -> pd.DataFrame:
+    """The previous implementation of safe_concat_and_format_dtypes."""
+
+    def process_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+        processed_df = df.copy()
+        processed_df = processed_df.dropna(axis=1, how="all")
+        for col in processed_df.columns:
+            if (
+                processed_df[col].dtype == object
+                and processed_df[col].astype(str).str.strip().eq("").all()
+            ):
+                processed_df[col] = np.nan
+        return processed_df.dropna(axis=1, how="all")
+
+    non_empty_dfs = [df for df in data_container if not df.empty]
+    if not non_empty_dfs:
+        return pd.DataFrame()
+    original_columns = non_empty_dfs[0].columns.tolist()
+    common_columns = list(set.intersection(*[set(df.columns) for df in non_empty_dfs]))
+
+    processed_dfs = []
+    for df in non_empty_dfs:
+        processed_df = process_dataframe(df[common_columns].copy())
+        if not processed_df.empty:
+            processed_dfs.append(processed_df)
+    if not processed_dfs:
+        return pd.DataFrame()
+
+    output = pd.concat(processed_dfs, axis=0, ignore_index=True)
+    for col in DATE_COLUMNS:
+        if col in output.columns:
+            output[col] = pd.to_datetime(output[col], errors="coerce")
+
+    final_columns = [next(col for col in ID_COLUMNS if col in output.columns)]
+    final_columns += [col for col in ["date", "event_date"] if col in output.columns][:1]
+    final_columns += [
+        col for col in original_columns if col in output.columns and col not in final_columns
+    ]
+    return output[final_columns]
+
+
+def measure(func: object, chunks: list[pd.DataFrame]) -> tuple[pd.DataFrame, float, float]:
+    """Run `func` and return its result, wall time and peak traced memory (MiB).
+
+    Memory is traced on a second run so tracing does not inflate the wall time.
+    """
+    start = time.perf_counter()
+    result = func(chunks)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(chunks)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark safe_concat_and_format_dtypes.")
+    parser.add_argument("--chunks", type=int, default=DEFAULT_CHUNKS, help="Chunk DataFrames.")
+    parser.add_argument(
+        "--rows_per_chunk", type=int, default=DEFAULT_ROWS_PER_CHUNK, help="Rows in each chunk."
+    )
+    args = parser.parse_args()
+
+    chunks = make_chunks(args.chunks, args.rows_per_chunk)
+
+    legacy_df, legacy_seconds, legacy_peak = measure(legacy_safe_concat_and_format_dtypes, chunks)
+    current_df, current_seconds, current_peak = measure(safe_concat_and_format_dtypes, chunks)
+    pd.testing.assert_frame_equal(legacy_df, current_df)
+
+    logger.info(f"rows: {len(current_df)}, columns: {current_df.columns.tolist()}")
+    logger.info(f"previous: {legacy_seconds:.3f}s, peak {legacy_peak:.1f} MiB")
+    logger.info(f"single pass: {current_seconds:.3f}s, peak {current_peak:.1f} MiB")
+    logger.info(
+        f"speedup: {legacy_seconds / current_seconds:.1f}x, "
+        f"peak memory: {legacy_peak / current_peak:.1f}x lower"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Benchmark pooled keep-alive sessions against per-request connections.
+
+Starts a local stub of the `/v2/property_search` endpoint that serves a fixed
+number of pages, then runs the same paginated pull twice: once through the
+client's pooled session, and once with every request opening its own
+connection (the SDK's behaviour before the session was shared). The stub counts
+accepted TCP connections so the difference is visible directly.
+
+A loopback connection costs almost nothing to open, so the stub sleeps for
+``--handshake_ms`` on every new connection to stand in for the TCP + TLS
+round trips paid against the real API.
+
+Usage:
+    python scripts/session_pool_benchmark.py --pages 50 --page_size 100 --latency_ms 20
+"""
+
+import argparse
+import json
+import logging
+import threading
+import time
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from parcllabs import ParclLabsClient
+
+logging.basicConfig(
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
+)
+logger = logging.getLogger("Session_Pool_Benchmark")
+
+DEFAULT_PAGES = 50
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_LATENCY_MS = 20
+DEFAULT_HANDSHAKE_MS = 30
+DEFAULT_NUM_WORKERS = 8
+
+
+class CountingHTTPServer(ThreadingHTTPServer):
+    """Threading HTTP server that counts accepted TCP connections."""
+
+    daemon_threads = True
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def get_request(self) -> tuple:
+        request = super().get_request()
+        with self._lock:
+            self.connections += 1
+        return request
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.connections = 0
+            self.requests = 0
+
+
+def make_handler(
+    total: int, page_size: int, latency: float, handshake: float
+) -> type[BaseHTTPRequestHandler]:
+    class PropertySearchHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Buffer each response into a single write; separate header/body writes on
+        # a kept-alive socket otherwise stall on delayed ACKs.
+        wbufsize = -1
+        disable_nagle_algorithm = True
+
+        def setup(self) -> None:
+            time.sleep(handshake)
+            super().setup()
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length", 0))
+            self.rfile.read(length)
+            query = parse_qs(urlparse(self.path).query)
+            offset = int(query.get("offset", ["0"])[0])
+            limit = min(int(query.get("limit", [str(page_size)])[0]), page_size)
+            count = max(0, min(limit, total - offset))
+
+            with self.server._lock:
+                self.server.requests += 1
+            time.sleep(latency)
+
+            body = json.dumps(
+                {
+                    "data": [
+                        {
+                            "parcl_property_id": offset + i,
+                            "property_type": "SINGLE_FAMILY",
+                            "events": [{"event_type": "SALE", "price": 100_000 + i}],
+                        }
+                        for i in range(count)
+                    ],
+                    "metadata": {"results": {"returned_count": count, "total_available": total}},
+                    "pagination": {
+                        "limit": page_size,
+                        "offset": offset,
+                        "has_more": offset + count < total,
+                    },
+                    "account_info": {},
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    return PropertySearchHandler
+
+
+class UnpooledSession:
+    """Stand-in session that opens a fresh connection for every request."""
+
+    def request(self, *args: object, **kwargs: object) -> requests.Response:
+        return requests.request(*args, **kwargs)  # noqa: S113 (timeout is in kwargs)
+
+    def close(self) -> None:
+        pass
+
+
+def run_pull(client: ParclLabsClient, server: CountingHTTPServer) -> dict:
+    server.reset_counts()
+    start = time.perf_counter()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        df, _ = client.property_v2.search.retrieve(parcl_ids=[1])
+    elapsed = time.perf_counter() - start
+    return {
+        "rows": len(df),
+        "requests": server.requests,
+        "connections": server.connections,
+        "wall_time_seconds": round(elapsed, 4),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark pooled HTTP sessions.")
+    parser.add_argument("--pages", type=int, default=DEFAULT_PAGES, help="Pages to serve.")
+    parser.add_argument(
+        "--page_size", type=int, default=DEFAULT_PAGE_SIZE, help="Properties per page."
+    )
+    parser.add_argument(
+        "--latency_ms",
+        type=float,
+        default=DEFAULT_LATENCY_MS,
+        help="Simulated server latency per request.",
+    )
+    parser.add_argument(
+        "--handshake_ms",
+        type=float,
+        default=DEFAULT_HANDSHAKE_MS,
+        help="Simulated connection setup cost for every new connection.",
+    )
+    parser.add_argument(
+        "--num_workers", type=int, default=DEFAULT_NUM_WORKERS, help="Client worker threads."
+    )
+    args = parser.parse_args()
+
+    handler = make_handler(
+        args.pages * args.page_size,
+        args.page_size,
+        args.latency_ms / 1000,
+        args.handshake_ms / 1000,
+    )
+    server = CountingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    results = {}
+    with ParclLabsClient(
+        api_key="benchmark", api_url=api_url, num_workers=args.num_workers
+    ) as client:
+        pooled_session = client.session
+        client.session = UnpooledSession()
+        results["per_request_connections"] = run_pull(client, server)
+        client.session = pooled_session
+        results["pooled_session"] = run_pull(client, server)
+
+    server.shutdown()
+
+    for name, result in results.items():
+        logger.info(f"{name}: {result}")
+
+    before = results["per_request_connections"]
+    after = results["pooled_session"]
+    logger.info(
+        f"Connections: {before['connections']} -> {after['connections']}, wall time: "
+        f"{before['wall_time_seconds']:.3f}s -> {after['wall_time_seconds']:.3f}s "
+        f"({before['wall_time_seconds'] / after['wall_time_seconds']:.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -28,7 +28,16 @@ setup(
         "pandas",
         "numpy",
     ],
-    extras_require={"test": ["pytest", "responses"]},
+    extras_require={
+        "test": ["pytest", "responses"],
+        "async": ["httpx"],
+        "parquet": ["pyarrow"],
+        "arrow": ["pyarrow"],
+        "polars": ["polars"],
+        "duckdb": ["duckdb"],
+        "fastjson": ["msgspec", "orjson"],
+        "compression": ["brotli", "zstandard", "backports.zstd; python_version < '3.14'"],
+    },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -0,0 +1,159 @@
+import asyncio
+import json
+import warnings
+
+import pandas as pd
+import pytest
+
+from parcllabs import AsyncParclLabsClient, ParclLabsClient
+from parcllabs.services.async_parcllabs_service import AsyncParclLabsService
+
+httpx = pytest.importorskip("httpx")
+
+
+def _client_with_transport(handler: object, **kwargs: object) -> AsyncParclLabsClient:
+    client = AsyncParclLabsClient(api_key="test_api_key", api_url="https://api.test", **kwargs)
+    client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_async_client_mirrors_service_groups() -> None:
+    sync_client = ParclLabsClient(api_key="test_api_key")
+    async_client = AsyncParclLabsClient(api_key="test_api_key")
+
+    for group_name in ["price_feed", "market_metrics", "property", "property_v2", "search"]:
+        sync_group = getattr(sync_client, group_name)
+        async_group = getattr(async_client, group_name)
+        assert async_group.services == sync_group.services
+        for name in async_group.services:
+            service = getattr(async_group, name)
+            assert isinstance(service, AsyncParclLabsService)
+            assert isinstance(service, type(getattr(sync_group, name)))
+
+
+def test_async_client_rejects_sync_with() -> None:
+    client = AsyncParclLabsClient(api_key="test_api_key")
+
+    with pytest.raises(TypeError, match="async with"), client:
+        pass
+
+
+def test_async_metric_retrieve_gathers_chunks() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        items = [{"parcl_id": int(pid), "date": "2024-01-01"} for pid in body["parcl_id"]]
+        return httpx.Response(200, json={"items": items, "account": {"est_credits_used": 1}})
+
+    async def run() -> pd.DataFrame:
+        async with _client_with_transport(handler) as client:
+            return await client.market_metrics.housing_event_prices.retrieve(
+                parcl_ids=list(range(2500)), property_type="single_family"
+            )
+
+    result = asyncio.run(run())
+
+    assert len(result) == 2500
+    assert result["parcl_id"].tolist() == list(range(2500))
+
+
+def test_async_property_v2_pages_respect_max_concurrency() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        offset = int(request.url.params.get("offset", 0))
+        return httpx.Response(
+            200,
+            json={
+                "data": [{"parcl_property_id": offset, "events": []}],
+                "metadata": {"results": {"returned_count": 1, "total_available": 10}},
+                "pagination": {"limit": 1, "offset": offset, "has_more": offset < 9},
+            },
+        )
+
+    async def run() -> tuple[pd.DataFrame, dict]:
+        async with _client_with_transport(handler, max_concurrency=2) as client:
+            return await client.property_v2.search.retrieve(parcl_ids=[1])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        df, metadata = asyncio.run(run())
+
+    assert sorted(df["parcl_property_id"].tolist()) == list(range(10))
+    assert metadata["results"]["returned_count"] == 10
+    assert peak <= 2
+
+
+def test_async_metric_auto_paginate_gathers_planned_pages() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params.get("offset", 0))
+        return httpx.Response(
+            200,
+            json={
+                "parcl_id": 1,
+                "items": [{"date": f"2024-01-0{offset + 1}"}],
+                "total": 3,
+                "limit": 1,
+                "offset": offset,
+                "links": {
+                    "next": None if offset == 2 else f"https://api.test/next?offset={offset + 1}"
+                },
+            },
+        )
+
+    async def run() -> pd.DataFrame:
+        async with _client_with_transport(handler) as client:
+            return await client.market_metrics.housing_event_prices.retrieve(
+                parcl_ids=[1], auto_paginate=True
+            )
+
+    result = asyncio.run(run())
+
+    assert result["date"].astype(str).tolist() == ["2024-01-01", "2024-01-02", "2024-01-03"]
+
+
+def test_async_iter_frames_yields_pages_in_order() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params.get("offset", 0))
+        return httpx.Response(
+            200,
+            json={
+                "data": [{"parcl_property_id": offset, "events": []}],
+                "metadata": {"results": {"returned_count": 1, "total_available": 4}},
+                "pagination": {"limit": 1, "offset": offset, "has_more": offset < 3},
+            },
+        )
+
+    async def run() -> list[pd.DataFrame]:
+        async with _client_with_transport(handler, max_concurrency=2) as client:
+            return [frame async for frame in client.property_v2.search.iter_frames(parcl_ids=[1])]
+
+    frames = asyncio.run(run())
+
+    assert [frame["parcl_property_id"].tolist() for frame in frames] == [[0], [1], [2], [3]]
+
+
+def test_async_metric_retrieve_arrow_gathers_chunks() -> None:
+    pytest.importorskip("pyarrow")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        assert body["property_type"] == "SINGLE_FAMILY"
+        items = [{"parcl_id": int(pid), "date": "2024-01-01"} for pid in body["parcl_id"]]
+        return httpx.Response(200, json={"items": items, "account": {"est_credits_used": 1}})
+
+    async def run() -> object:
+        async with _client_with_transport(handler) as client:
+            return await client.market_metrics.housing_event_prices.retrieve_arrow(
+                parcl_ids=list(range(2500)), property_type="single_family"
+            )
+
+    table = asyncio.run(run())
+
+    assert table.column_names == ["parcl_id", "date"]
+    assert table["parcl_id"].to_pylist() == list(range(2500))
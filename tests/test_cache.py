@@ -0,0 +1,212 @@
+import asyncio
+import json
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+
+from parcllabs import AsyncParclLabsClient, ParclLabsClient, ResponseCache
+
+page = {
+    "parcl_id": 1,
+    "items": [{"date": "2024-01-01", "metric": 10}, {"date": "2024-02-01", "metric": 20}],
+    "links": {},
+    "account": {"est_credits_used": 2, "est_remaining_credits": 98},
+}
+body = json.dumps(page).encode()
+
+
+def test_key_ignores_param_and_body_key_order() -> None:
+    key = ResponseCache.key("GET", "https://api.test/v1/x?b=2", {"a": 1, "c": None}, None)
+
+    assert key == ResponseCache.key("get", "https://api.test/v1/x", {"b": 2, "a": "1"})
+    assert ResponseCache.key("POST", "u", body={"a": 1, "b": [1, 2]}) == ResponseCache.key(
+        "POST", "u", body={"b": [1, 2], "a": 1}
+    )
+    assert key != ResponseCache.key("POST", "https://api.test/v1/x?b=2", {"a": 1})
+
+
+def test_ttl_uses_longest_matching_prefix(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path, ttl=60, ttls={"/v1/search": 600, "/v1/search/markets": 0})
+
+    assert cache.ttl_for("https://api.test/v1/market_metrics/1") == 60
+    assert cache.ttl_for("https://api.test/v1/search/properties") == 600
+    cache.set("k", "https://api.test/v1/search/markets", b"{}", {})
+    assert cache.get("k") is None
+
+
+def test_entries_expire(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path, ttl=60)
+    with patch("parcllabs.cache.time.time", return_value=1000.0):
+        cache.set("k", "https://api.test/v1/x", body, {"Content-Type": "application/json"})
+        entry = cache.get("k")
+        assert entry.fresh
+        assert (entry.body, entry.headers) == (body, {"Content-Type": "application/json"})
+    with patch("parcllabs.cache.time.time", return_value=1061.0):
+        assert not cache.get("k").fresh
+
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    entry = bytes(range(256)) * 4  # incompressible enough to take ~1 KiB
+    cache = ResponseCache(tmp_path, max_bytes=2500, compression_level=0)
+    clock = iter(range(1000, 1010))
+    with patch("parcllabs.cache.time.time", side_effect=lambda: next(clock)):
+        cache.set("a", "u", entry, {})
+        cache.set("b", "u", entry, {})
+        cache.get("a")
+        cache.set("c", "u", entry, {})
+
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["entries"] == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+
+def test_cache_persists_across_instances(tmp_path: Path) -> None:
+    ResponseCache(tmp_path).set("k", "u", body, {})
+
+    assert ResponseCache(tmp_path).get("k").body == body
+
+
+def test_repeated_retrieve_is_served_from_cache(tmp_path: Path) -> None:
+    client = ParclLabsClient(api_key="test_api_key", response_cache=ResponseCache(tmp_path))
+    client.session = Mock()
+    client.session.request.return_value = Mock(status_code=200, headers={}, content=body)
+    service = client.market_metrics.housing_event_prices
+
+    first = service.retrieve(parcl_ids=[1], start_date="2024-01-01")
+    second = service.retrieve(parcl_ids=[1], start_date="2024-01-01")
+
+    pd.testing.assert_frame_equal(first, second)
+    assert client.session.request.call_count == 1
+    account = client.account()
+    assert account["est_session_credits_used"] == 2
+    assert account["cache"]["hits"] == 1
+    assert account["cache"]["misses"] == 1
+    assert account["cache"]["est_credits_saved"] == 2
+
+
+def test_async_client_is_served_from_cache(tmp_path: Path) -> None:
+    httpx = pytest.importorskip("httpx")
+    requests_sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_sent.append(request)
+        return httpx.Response(200, content=body)
+
+    async def run() -> tuple[pd.DataFrame, pd.DataFrame]:
+        cache = ResponseCache(tmp_path)
+        async with AsyncParclLabsClient(api_key="test_api_key", response_cache=cache) as client:
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            service = client.market_metrics.housing_event_prices
+            return await service.retrieve(parcl_ids=[1]), await service.retrieve(parcl_ids=[1])
+
+    first, second = asyncio.run(run())
+
+    pd.testing.assert_frame_equal(first, second)
+    assert len(requests_sent) == 1
+
+
+def test_async_client_reads_and_writes_the_cache_off_the_event_loop(tmp_path: Path) -> None:
+    httpx = pytest.importorskip("httpx")
+    cache = ResponseCache(tmp_path)
+    threads = []
+    for name in ("get", "set"):
+        method = getattr(cache, name)
+
+        def record(*args: object, method: Callable[..., object] = method) -> object:
+            threads.append(threading.current_thread())
+            return method(*args)
+
+        setattr(cache, name, record)
+
+    async def run() -> None:
+        async with AsyncParclLabsClient(api_key="test_api_key", response_cache=cache) as client:
+            client.session = httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda _: httpx.Response(200, content=body))
+            )
+            await client.market_metrics.housing_event_prices.retrieve(parcl_ids=[1])
+
+    asyncio.run(run())
+
+    assert threads
+    assert threading.main_thread() not in threads
+
+
+def test_stale_entries_send_their_validators(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path, ttl=60)
+    headers = {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT", "Server": "x"}
+    with patch("parcllabs.cache.time.time", return_value=1000.0):
+        cache.set("k", "u", body, headers)
+
+    assert cache.get("k").validators() == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+
+
+def _expire(cache: ResponseCache) -> None:
+    cache._connection.execute("UPDATE responses SET expires_at = 0")
+
+
+def test_not_modified_responses_are_served_from_cache(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path)
+    client = ParclLabsClient(api_key="test_api_key", response_cache=cache)
+    client.session = Mock()
+    client.session.request.side_effect = [
+        Mock(status_code=200, headers={"ETag": '"v1"'}, content=body),
+        Mock(status_code=304, headers={"ETag": '"v1"'}, content=b""),
+    ]
+    service = client.market_metrics.housing_event_prices
+
+    first = service.retrieve(parcl_ids=[1])
+    _expire(cache)
+    second = service.retrieve(parcl_ids=[1])
+
+    pd.testing.assert_frame_equal(first, second)
+    assert client.session.request.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+    stats = client.account()["cache"]
+    assert stats["not_modified"] == 1
+    assert stats["revalidation_bytes_saved"] == len(body)
+    assert stats["revalidation_est_credits_saved"] == 2
+    assert stats["misses"] == 2
+
+
+def test_unchanged_content_is_detected_by_hash(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path, hash_content=True)
+    cache.set("k", "u", body, {})
+    _expire(cache)
+
+    cache.set("k", "u", body, {}, stale=cache.get("k"))
+
+    assert cache.get("k").fresh
+    assert cache.stats()["unchanged"] == 1
+
+
+def test_async_client_serves_not_modified_responses(tmp_path: Path) -> None:
+    httpx = pytest.importorskip("httpx")
+    cache = ResponseCache(tmp_path)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=body, headers={"ETag": '"v1"'})
+
+    async def run() -> tuple[pd.DataFrame, pd.DataFrame]:
+        async with AsyncParclLabsClient(api_key="test_api_key", response_cache=cache) as client:
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            service = client.market_metrics.housing_event_prices
+            first = await service.retrieve(parcl_ids=[1])
+            _expire(cache)
+            return first, await service.retrieve(parcl_ids=[1])
+
+    first, second = asyncio.run(run())
+
+    pd.testing.assert_frame_equal(first, second)
+    assert cache.stats()["not_modified"] == 1
@@ -0,0 +1,118 @@
+import asyncio
+import gzip
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from parcllabs import AsyncParclLabsClient, ParclLabsClient
+from parcllabs.compression import (
+    INSTALLED_ENCODINGS,
+    REQUEST_COMPRESSION_MIN_BYTES,
+    TransferStats,
+    accept_encoding,
+    compress,
+    validate_request_compression,
+)
+
+
+def test_accept_encoding_keeps_the_default_and_adds_installed_codecs() -> None:
+    installed = [name for name in ("br", "zstd") if INSTALLED_ENCODINGS[name]]
+
+    assert accept_encoding("gzip, deflate") == ", ".join(["gzip", "deflate", *installed])
+    assert accept_encoding("gzip,deflate,br,zstd") == "gzip, deflate, br, zstd"
+    assert accept_encoding("identity") == ", ".join(["identity", "gzip", *installed])
+
+
+def test_client_session_advertises_compression() -> None:
+    with ParclLabsClient(api_key="test_api_key") as client:
+        encodings = client.session.headers["Accept-Encoding"].split(", ")
+
+    assert encodings[:2] == ["gzip", "deflate"]
+    assert {name for name, ok in INSTALLED_ENCODINGS.items() if ok} <= set(encodings)
+
+
+@pytest.mark.parametrize("encoding", [name for name, ok in INSTALLED_ENCODINGS.items() if ok])
+def test_compress_shrinks_repetitive_json(encoding: str) -> None:
+    body = json.dumps({"parcl_property_ids": list(range(10_000))}).encode()
+
+    assert len(compress(body, encoding)) < len(body) / 2
+
+
+def test_validate_request_compression_rejects_unknown_encoding() -> None:
+    assert validate_request_compression(None) is None
+    with pytest.raises(ValueError, match="request_compression"):
+        validate_request_compression("deflate")
+
+
+def test_transfer_stats_sum_requests() -> None:
+    stats = TransferStats(history=1)
+    sizes = {
+        "bytes_sent": 10,
+        "bytes_sent_uncompressed": 40,
+        "bytes_received": 100,
+        "bytes_received_uncompressed": 800,
+    }
+    stats.record("POST", "https://api.test/a", "gzip", **sizes)
+    stats.record("POST", "https://api.test/b", "gzip", **sizes)
+
+    totals = stats.totals()
+    assert totals["requests"] == 2
+    assert totals["bytes_received"] == 200
+    assert totals["compression_ratio"] == 8
+    assert [entry["url"] for entry in stats.history] == ["https://api.test/b"]
+
+
+def test_large_post_bodies_are_compressed_and_counted() -> None:
+    client = ParclLabsClient(api_key="test_api_key", request_compression="gzip")
+    client.session = Mock()
+    client.session.request.return_value = Mock(status_code=200, headers={}, content=b"{}")
+    data = {"parcl_property_ids": list(range(10_000))}
+
+    client.property_v2.search._post(url="https://api.test", data=data, params={})
+
+    kwargs = client.session.request.call_args.kwargs
+    assert "json" not in kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["data"])) == data
+    totals = client.account()["transfer"]
+    assert totals["requests"] == 1
+    assert totals["bytes_sent_uncompressed"] >= REQUEST_COMPRESSION_MIN_BYTES
+
+
+def test_small_post_bodies_are_sent_as_json() -> None:
+    client = ParclLabsClient(api_key="test_api_key", request_compression="gzip")
+    client.session = Mock()
+    client.session.request.return_value = Mock(status_code=200, headers={}, content=b"{}")
+
+    client.property_v2.search._post(url="https://api.test", data={"parcl_ids": [1]}, params={})
+
+    kwargs = client.session.request.call_args.kwargs
+    assert kwargs["json"] == {"parcl_ids": [1]}
+    assert "Content-Encoding" not in kwargs["headers"]
+
+
+def test_async_client_counts_compressed_response_bytes() -> None:
+    httpx = pytest.importorskip("httpx")
+    payload = json.dumps({"items": [{"parcl_id": 1, "date": "2024-01-01"}] * 500}).encode()
+    compressed = gzip.compress(payload)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert "gzip" in request.headers["Accept-Encoding"]
+        return httpx.Response(
+            200, stream=httpx.ByteStream(compressed), headers={"Content-Encoding": "gzip"}
+        )
+
+    async def run() -> dict:
+        async with AsyncParclLabsClient(api_key="test_api_key") as client:
+            client.session = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler),
+                headers={"Accept-Encoding": "gzip"},
+            )
+            await client.market_metrics.housing_event_prices.retrieve(parcl_ids=[1])
+            return client.account()["transfer"]
+
+    totals = asyncio.run(run())
+
+    assert totals["bytes_received"] == len(compressed)
+    assert totals["bytes_received_uncompressed"] == len(payload)
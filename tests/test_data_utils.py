@@ -0,0 +1,200 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from parcllabs.services.data_utils import (
+    COMPACT_DTYPES_BYTES_SAVED,
+    PANDAS,
+    POLARS,
+    compact_dtypes,
+    flatten_records,
+    safe_concat_and_format_dtypes,
+    validate_dataframe_backend,
+)
+
+
+def test_safe_concat_drops_columns_without_data() -> None:
+    first = pd.DataFrame(
+        {
+            "value": [1.0, 2.0],
+            "parcl_id": [1, 2],
+            "notes": pd.Series(["", " "], dtype=object),
+            "unused": [np.nan, np.nan],
+            "only_first": [1, 2],
+        }
+    )
+    second = pd.DataFrame(
+        {
+            "parcl_id": [3],
+            "value": [np.nan],
+            "notes": pd.Series(["note"], dtype=object),
+            "unused": [np.nan],
+        }
+    )
+
+    result = safe_concat_and_format_dtypes([first, pd.DataFrame(), second])
+
+    assert result.columns.tolist() == ["parcl_id", "value", "notes"]
+    assert result["parcl_id"].tolist() == [1, 2, 3]
+    assert result["notes"].isna().tolist() == [True, True, False]
+    assert result["value"].isna().tolist() == [False, False, True]
+
+
+def test_safe_concat_does_not_modify_inputs() -> None:
+    chunk = pd.DataFrame({"parcl_id": [1], "date": ["2024-01-01"]})
+
+    result = safe_concat_and_format_dtypes([chunk])
+
+    assert pd.api.types.is_datetime64_any_dtype(result["date"])
+    assert chunk["date"].tolist() == ["2024-01-01"]
+
+
+def test_safe_concat_of_chunks_without_data() -> None:
+    chunk = pd.DataFrame({"notes": pd.Series([" "], dtype=object), "unused": [None]})
+
+    assert safe_concat_and_format_dtypes([chunk]).empty
+    assert safe_concat_and_format_dtypes([]).empty
+
+
+def test_flatten_records_matches_json_normalize() -> None:
+    records = [
+        {"id": 1, "owner": {"name": "A", "address": {"zip5": "10001"}}},
+        {"id": 2, "owner": None},
+        {"id": 3},
+    ]
+
+    result = flatten_records(records)
+    expected = pd.json_normalize(records, sep="_")
+
+    assert sorted(result.columns) == sorted(expected.columns)
+    pd.testing.assert_frame_equal(
+        result[sorted(result.columns)].astype(object).where(result.notna(), None),
+        expected[sorted(expected.columns)].astype(object).where(expected.notna(), None),
+    )
+
+
+RAGGED_RECORDS = [
+    {"id": 1, "owner": {"name": "A"}, "city": "X"},
+    {"id": 2, "owner": {"name": "B", "address": {"zip5": "10001"}}, "city": "Y", "beds": 3},
+    {"id": 3, "owner": None, "sale": {"price": 100}},
+]
+
+
+def test_flatten_records_keeps_json_normalize_column_order() -> None:
+    expected = pd.json_normalize(RAGGED_RECORDS, sep="_").columns.tolist()
+
+    assert flatten_records(RAGGED_RECORDS).columns.tolist() == expected
+
+
+def test_polars_flatten_records_keeps_json_normalize_column_order() -> None:
+    pytest.importorskip("polars")
+    expected = pd.json_normalize(RAGGED_RECORDS, sep="_").columns.drop("owner").tolist()
+
+    assert POLARS.flatten_records(RAGGED_RECORDS).columns == expected
+
+
+def test_compact_dtypes_shrinks_columns_without_losing_values() -> None:
+    rows = 1000
+    df = pd.DataFrame(
+        {
+            "parcl_property_id": np.where(np.arange(rows) % 10, np.arange(rows), np.nan),
+            "event_event_type": np.resize(["SALE", "LISTING", "SOMETHING_NEW"], rows),
+            "event_name": np.resize(["SOLD", "LISTED_SALE"], rows),
+            "state_abbreviation": np.resize(["CA", "NY"], rows),
+            "bedrooms": np.resize([1, 2, 3], rows),
+            "price": np.resize([100_000.0, np.nan], rows),
+            "ratio": np.resize([0.1, 0.2], rows),
+            "address": [f"{i} Main St" for i in range(rows)],
+        }
+    )
+
+    result = compact_dtypes(df)
+
+    assert result["parcl_property_id"].dtype == "Int64"
+    assert result["parcl_property_id"].isna().sum() == 100
+    assert result["event_event_type"].cat.categories.tolist() == [
+        "SALE",
+        "LISTING",
+        "RENTAL",
+        "ALL",
+        "SOMETHING_NEW",
+    ]
+    assert isinstance(result["event_name"].dtype, pd.CategoricalDtype)
+    assert isinstance(result["state_abbreviation"].dtype, pd.CategoricalDtype)
+    assert result["bedrooms"].dtype == np.int32
+    assert result["price"].dtype == np.float32
+    assert result["ratio"].dtype == np.float64
+    assert result["address"].dtype == df["address"].dtype
+    for column in df.columns:
+        assert result[column].isna().tolist() == df[column].isna().tolist()
+        assert result[column].dropna().astype(object).tolist() == df[column].dropna().tolist()
+    assert result.attrs[COMPACT_DTYPES_BYTES_SAVED] == (
+        df.memory_usage(deep=True).sum() - result.memory_usage(deep=True).sum()
+    )
+    assert result.attrs[COMPACT_DTYPES_BYTES_SAVED] > 0
+
+
+def test_polars_backend_flattens_and_concats_like_pandas() -> None:
+    pytest.importorskip("polars")
+    pages = [
+        {"parcl_id": 5, "items": [{"date": "2024-02-01", "value": {"low": 1}, "notes": " "}]},
+        {"parcl_id": 6, "items": [{"date": "2024-01-01", "value": {"low": 2}, "notes": ""}]},
+    ]
+
+    expected = PANDAS.concat_and_format([PANDAS.normalize_page(page) for page in pages])
+    result = POLARS.concat_and_format([POLARS.normalize_page(page) for page in pages])
+
+    assert result.columns == expected.columns.tolist() == ["parcl_id", "date", "value_low"]
+    assert result["parcl_id"].to_list() == [5, 6]
+    assert result["date"].dt.strftime("%Y-%m-%d").to_list() == ["2024-02-01", "2024-01-01"]
+    assert result["value_low"].to_list() == [1, 2]
+
+
+def test_arithmetic_on_compacted_frames_matches_the_original() -> None:
+    df = pd.DataFrame(
+        {
+            "parcl_id": [1, 2, 3],
+            "bedrooms": [3, 4, 5],
+            "sqft": [2_000, 3_000, 30_000],
+            "count": pd.array([100, None, 120], dtype="Int64"),
+        }
+    )
+
+    result = compact_dtypes(df)
+
+    assert result["bedrooms"].dtype == np.int32
+    assert result["count"].dtype == "Int32"
+    pd.testing.assert_series_equal(
+        (result["bedrooms"] * result["sqft"] * 100).astype("int64"),
+        df["bedrooms"] * df["sqft"] * 100,
+    )
+    assert result["sqft"].sum() == df["sqft"].sum()
+    assert (result["count"] * 1_000).sum() == (df["count"] * 1_000).sum()
+
+
+def test_polars_compact_keeps_integers_at_least_int32() -> None:
+    pl = pytest.importorskip("polars")
+    frame = pl.DataFrame({"bedrooms": [3, 4, 5], "sqft": [2_000, 3_000, 30_000]})
+
+    result = POLARS.compact(frame)
+
+    assert result.schema["bedrooms"] == pl.Int32
+    assert (result["bedrooms"] * result["sqft"] * 100).to_list() == (
+        frame["bedrooms"] * frame["sqft"] * 100
+    ).to_list()
+
+
+def test_polars_backend_take_rows_fills_missing_rows() -> None:
+    pl = pytest.importorskip("polars")
+    frame = POLARS.flatten_records([{"a": 1, "b": {"c": "x"}}, {"a": 2}])
+
+    result = POLARS.take_rows(frame, np.array([1, -1, 0]))
+
+    assert result.columns == ["a", "b_c"]
+    assert result["a"].to_list() == [2, None, 1]
+    assert result.schema["a"] == pl.Int64
+
+
+def test_validate_dataframe_backend_rejects_unknown_backend() -> None:
+    with pytest.raises(ValueError, match="dataframe_backend"):
+        validate_dataframe_backend("arrow")
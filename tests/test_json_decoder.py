@@ -0,0 +1,62 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from parcllabs import JSONDecoder, ParclLabsClient
+from parcllabs.json_decoder import INSTALLED_LIBRARIES, DecodeError
+
+PAGE = {
+    "data": [{"parcl_property_id": 1, "events": [{"event_type": "SALE"}]}],
+    "metadata": {"results": {"returned_count": 1}},
+    "debug": {"query_plan": ["scan", "filter"]},
+}
+
+
+@pytest.mark.parametrize("library", [name for name, ok in INSTALLED_LIBRARIES.items() if ok])
+def test_decode_matches_stdlib(library: str) -> None:
+    content = json.dumps(PAGE).encode()
+
+    assert JSONDecoder(library).decode(content) == PAGE
+
+
+@pytest.mark.parametrize("library", [name for name, ok in INSTALLED_LIBRARIES.items() if ok])
+def test_malformed_bodies_raise_decode_error(library: str) -> None:
+    with pytest.raises(DecodeError):
+        JSONDecoder(library).decode(b'{"data": [')
+
+
+def test_default_library_prefers_fast_libraries() -> None:
+    installed = [name for name, ok in INSTALLED_LIBRARIES.items() if ok]
+
+    assert JSONDecoder().library == installed[0]
+
+
+def test_decode_keeps_only_requested_fields() -> None:
+    pytest.importorskip("msgspec")
+    decoder = JSONDecoder("msgspec")
+
+    result = decoder.decode(json.dumps(PAGE).encode(), ("data", "metadata", "pagination"))
+
+    assert result == {"data": PAGE["data"], "metadata": PAGE["metadata"]}
+    assert decoder.decode(b"[1, 2]", ("data",)) == [1, 2]
+
+
+def test_unknown_library_is_rejected() -> None:
+    with pytest.raises(ValueError, match="library"):
+        JSONDecoder("simdjson")
+
+
+def test_make_request_decodes_with_client_decoder() -> None:
+    decoder = Mock(wraps=JSONDecoder("json"))
+    client = ParclLabsClient(api_key="test_api_key", json_decoder=decoder)
+    client.session = Mock()
+    response = Mock(status_code=200, content=json.dumps(PAGE).encode())
+    client.session.request.return_value = response
+
+    result = client.property_v2.search._post(url="https://api.test", data={}, params={}).json()
+
+    assert result == PAGE
+    decoder.decode.assert_called_once_with(
+        response.content, ("data", "metadata", "pagination", "account_info")
+    )
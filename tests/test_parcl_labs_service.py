@@ -1,8 +1,17 @@
 import platform
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
 
+import pandas as pd
 import pytest
+import requests
 
 import parcllabs
+from parcllabs import JSONDecoder, ParclLabsClient, RateLimiter, RetryPolicy
+from parcllabs.compression import TransferStats
+from parcllabs.services import arrow_utils
 from parcllabs.services.parcllabs_service import ParclLabsService
 
 
@@ -12,6 +21,17 @@ class MockClient:
         self.api_key = "test_api_key"
         self.account_info = {"est_session_credits_used": 0}
         self.timeout = (10, 90)
+        self.request_semaphore = threading.BoundedSemaphore(1)
+        self.rate_limiter = RateLimiter()
+        self.retry_policy = RetryPolicy()
+        self.compact_dtypes = False
+        self.dataframe_backend = "pandas"
+        self.json_decoder = JSONDecoder()
+        self.request_compression = None
+        self.transfer_stats = TransferStats()
+        self.response_cache = None
+        self.store = None
+        self.single_flight = None
 
 
 @pytest.fixture
@@ -45,8 +65,195 @@ def test_as_pd_dataframe(parcl_labs_service: ParclLabsService) -> None:
     assert test_df.iloc[1]["field1"] == "value2"
 
 
+def test_as_pd_dataframe_compacts_dtypes_when_client_opts_in(
+    parcl_labs_service: ParclLabsService,
+) -> None:
+    data = [
+        {
+            "parcl_id": 5,
+            "items": [
+                {"property_type": "CONDO", "count": 1},
+                {"property_type": "OTHER", "count": 2},
+            ],
+        }
+    ]
+    parcl_labs_service.client.compact_dtypes = True
+
+    test_df = parcl_labs_service._as_pd_dataframe(data)
+
+    assert test_df["parcl_id"].dtype == "Int64"
+    assert isinstance(test_df["property_type"].dtype, pd.CategoricalDtype)
+    assert test_df["count"].dtype == "int32"
+    assert "compact_dtypes_bytes_saved" in test_df.attrs
+
+
+def test_as_arrow_table_matches_as_pd_dataframe(parcl_labs_service: ParclLabsService) -> None:
+    pytest.importorskip("pyarrow")
+    data = [
+        {
+            "parcl_id": 5,
+            "items": [
+                {"date": "2024-02-01", "median_price": 100.5, "notes": " ", "extra": None},
+                {"date": "2024-01-01", "median_price": None, "notes": "", "extra": None},
+            ],
+        },
+        None,
+        {"parcl_id": 6, "items": [{"date": "2024-01-01", "median_price": 3, "notes": ""}]},
+    ]
+
+    table = parcl_labs_service._as_arrow_table(data)
+    expected = parcl_labs_service._as_pd_dataframe(data)
+
+    assert table.column_names == expected.columns.tolist()
+    assert table.column_names == ["parcl_id", "date", "median_price"]
+    assert table["parcl_id"].to_pylist() == [5, 5, 6]
+    assert table["median_price"].to_pylist() == [100.5, None, 3.0]
+    assert table.to_pandas()["date"].tolist() == expected["date"].tolist()
+
+
+def test_retrieve_arrow_requires_pyarrow(
+    parcl_labs_service: ParclLabsService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(arrow_utils, "pa", None)
+
+    with pytest.raises(ImportError, match=r"parcllabs\[arrow\]"):
+        parcl_labs_service.retrieve_arrow(parcl_ids=[1])
+
+
 def test_update_account_info(parcl_labs_service: ParclLabsService) -> None:
     data = {"est_credits_used": 1, "est_remaining_credits": 9999}
     parcl_labs_service._update_account_info(data)
     assert parcl_labs_service.client.account_info["est_session_credits_used"] == 1
     assert parcl_labs_service.client.account_info["est_remaining_credits"] == 9999
+
+
+def test_services_share_client_session() -> None:
+    client = ParclLabsClient(api_key="test_api_key", num_workers=7)
+    assert client.pool_size == 7
+    assert client.market_metrics.housing_event_prices.client.session is client.session
+    assert client.property_v2.search.client.session is client.session
+
+    adapter = client.session.get_adapter("https://api.parcllabs.com")
+    assert adapter._pool_maxsize == 7
+    client.close()
+
+
+def test_pool_size_overrides_num_workers() -> None:
+    with ParclLabsClient(api_key="test_api_key", num_workers=4, pool_size=16) as client:
+        assert client.session.get_adapter("https://api.parcllabs.com")._pool_maxsize == 16
+
+
+def test_make_request_uses_client_session(parcl_labs_service: ParclLabsService) -> None:
+    response = Mock(content=b"")
+    response.raise_for_status.return_value = None
+    parcl_labs_service.client.session = Mock()
+    parcl_labs_service.client.session.request.return_value = response
+
+    result = parcl_labs_service._make_request("GET", "https://api.example.com/1")
+
+    assert result is response
+    parcl_labs_service.client.session.request.assert_called_once()
+
+
+def test_max_concurrency_defaults_to_pool_size() -> None:
+    with ParclLabsClient(api_key="test_api_key", num_workers=6) as client:
+        assert client.max_concurrency == 6
+    with ParclLabsClient(api_key="test_api_key", num_workers=6, max_concurrency=2) as client:
+        assert client.max_concurrency == 2
+
+
+def test_make_request_caps_in_flight_requests() -> None:
+    client = ParclLabsClient(api_key="test_api_key", num_workers=8, max_concurrency=2)
+    service = client.market_metrics.housing_event_prices
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def request(*args: object, **kwargs: object) -> Mock:  # noqa: ARG001
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return Mock(content=b"")
+
+    client.session = Mock()
+    client.session.request.side_effect = request
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: service._get(f"https://api.example.com/{i}"), range(16)))
+
+    assert client.session.request.call_count == 16
+    assert peak == 2
+
+
+def test_make_request_retries_after_rate_limit() -> None:
+    client = ParclLabsClient(
+        api_key="test_api_key",
+        rate_limiter=RateLimiter(rate=10),
+        retry_policy=RetryPolicy(backoff=0),
+    )
+    service = client.market_metrics.housing_event_prices
+    throttled = Mock(status_code=429, headers={"Retry-After": "0"})
+    ok = Mock(status_code=200, headers={}, content=b"")
+    client.session = Mock()
+    client.session.request.side_effect = [throttled, ok]
+
+    assert service._get("https://api.example.com/1") is ok
+    assert client.session.request.call_count == 2
+    assert client.rate_limiter.rate < 10
+
+
+def test_rate_limiter_is_opt_in_and_grows_only_after_success() -> None:
+    assert ParclLabsClient(api_key="test_api_key").rate_limiter is None
+
+    client = ParclLabsClient(api_key="test_api_key", rate_limiter=RateLimiter(rate=10))
+    service = client.market_metrics.housing_event_prices
+    invalid = Mock(status_code=422, headers={})
+    invalid.json.return_value = {"detail": [{"msg": "invalid"}]}
+    invalid.raise_for_status.side_effect = requests.exceptions.HTTPError()
+    client.session = Mock()
+    client.session.request.return_value = invalid
+
+    with pytest.raises(requests.exceptions.RequestException):
+        service._get("https://api.example.com/1")
+    assert client.rate_limiter.rate == 10
+
+    client.session.request.return_value = Mock(status_code=200, headers={}, content=b"")
+    service._get("https://api.example.com/1")
+    assert client.rate_limiter.rate > 10
+
+
+def test_make_request_retries_transient_errors_then_raises() -> None:
+    client = ParclLabsClient(
+        api_key="test_api_key", retry_policy=RetryPolicy(max_attempts=3, backoff=0)
+    )
+    service = client.market_metrics.housing_event_prices
+    unavailable = Mock(status_code=503, headers={})
+    unavailable.json.return_value = {"detail": "Service Unavailable"}
+    unavailable.raise_for_status.side_effect = requests.exceptions.HTTPError()
+    client.session = Mock()
+    client.session.request.side_effect = [
+        requests.exceptions.ReadTimeout("slow"),
+        unavailable,
+        unavailable,
+    ]
+
+    with pytest.raises(requests.RequestException, match="503 Server Error"):
+        service._post("https://api.example.com/1", data={})
+    assert client.session.request.call_count == 3
+
+
+def test_make_request_does_not_retry_client_errors() -> None:
+    client = ParclLabsClient(api_key="test_api_key", retry_policy=RetryPolicy(backoff=0))
+    service = client.market_metrics.housing_event_prices
+    bad_request = Mock(status_code=422, headers={})
+    bad_request.json.return_value = {"detail": [{"msg": "invalid"}]}
+    bad_request.raise_for_status.side_effect = requests.exceptions.HTTPError()
+    client.session = Mock()
+    client.session.request.return_value = bad_request
+
+    with pytest.raises(requests.RequestException, match="invalid"):
+        service._get("https://api.example.com/1")
+    assert client.session.request.call_count == 1
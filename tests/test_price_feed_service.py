@@ -1,3 +1,5 @@
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pandas as pd
@@ -5,6 +7,7 @@ import pytest
 import requests
 from requests.exceptions import RequestException
 
+from parcllabs import RateLimiter, RetryPolicy
 from parcllabs.common import GET_METHOD, POST_METHOD
 from parcllabs.exceptions import NotFoundError
 from parcllabs.services.parcllabs_service import ParclLabsService
@@ -16,9 +19,18 @@ class TestParclLabsService:
         mock_client = Mock()
         mock_client.api_url = "https://api.example.com"
         mock_client.api_key = "test_api_key"
+        mock_client.compact_dtypes = False
         mock_client.turbo_mode = False
         mock_client.estimated_session_credit_usage = 0
         mock_client.timeout = (10, 90)
+        mock_client.num_workers = 4
+        mock_client.request_semaphore = threading.BoundedSemaphore(4)
+        mock_client.rate_limiter = RateLimiter()
+        mock_client.retry_policy = RetryPolicy()
+        mock_client.request_compression = None
+        mock_client.response_cache = None
+        mock_client.store = None
+        mock_client.single_flight = None
         return ParclLabsService("/test", mock_client)
 
     def test_init(self, service: ParclLabsService) -> None:
@@ -42,10 +54,10 @@ class TestParclLabsService:
         cleaned = service._clean_params(params)
         assert cleaned == {"a": 1, "c": "test"}
 
-    @patch("requests.request")
-    def test_make_request_get(self, mock_request: Mock, service: ParclLabsService) -> None:
-        mock_response = Mock()
+    def test_make_request_get(self, service: ParclLabsService) -> None:
+        mock_response = Mock(content=b"")
         mock_response.raise_for_status.return_value = None
+        mock_request = service.client.session.request
         mock_request.return_value = mock_response
 
         service._make_request(GET_METHOD, "https://api.example.com/test")
@@ -57,10 +69,10 @@ class TestParclLabsService:
             timeout=(10, 90),
         )
 
-    @patch("requests.request")
-    def test_make_request_post(self, mock_request: Mock, service: ParclLabsService) -> None:
-        mock_response = Mock()
+    def test_make_request_post(self, service: ParclLabsService) -> None:
+        mock_response = Mock(content=b"")
         mock_response.raise_for_status.return_value = None
+        mock_request = service.client.session.request
         mock_request.return_value = mock_response
 
         service._make_request(
@@ -76,13 +88,12 @@ class TestParclLabsService:
             timeout=(10, 90),
         )
 
-    @patch("requests.request")
-    def test_make_request_http_error(self, mock_request: Mock, service: ParclLabsService) -> None:
+    def test_make_request_http_error(self, service: ParclLabsService) -> None:
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
         mock_response.status_code = 400  # Set a specific status code
         mock_response.json.return_value = {"detail": "Bad Request"}
-        mock_request.return_value = mock_response
+        service.client.session.request.return_value = mock_response
 
         with pytest.raises(RequestException):
             service._make_request(GET_METHOD, "https://api.example.com/test")
@@ -125,6 +136,22 @@ class TestParclLabsService:
             service._fetch_get_many_parcl_ids([1, 2], {"param": "test"}, False)
             assert mock_fetch_get.call_count == 2
 
+    def test_fetch_get_many_parcl_ids_keeps_order_and_skips_not_found(
+        self, service: ParclLabsService
+    ) -> None:
+        def fetch_get(url: str, params: dict, auto_paginate: bool) -> dict:  # noqa: ARG001
+            parcl_id = int(url.rsplit("/", 1)[-1])
+            if parcl_id == 3:
+                raise NotFoundError
+            time.sleep(0.01 * (10 - parcl_id))  # later ids finish first
+            return {"parcl_id": parcl_id}
+
+        service.full_url = "https://api.example.com/test/{parcl_id}"
+        with patch.object(service, "_fetch_get", side_effect=fetch_get):
+            results = service._fetch_get_many_parcl_ids(list(range(1, 9)), {}, False)
+
+        assert [r["parcl_id"] for r in results] == [1, 2, 4, 5, 6, 7, 8]
+
     @patch("parcllabs.services.parcllabs_service.ParclLabsService._post")
     def test_process_and_paginate_response_post(
         self, mock_post: Mock, service: ParclLabsService
@@ -216,3 +243,94 @@ class TestParclLabsService:
         response.json.return_value = {"error": "Rate Limit Exceeded"}
         with pytest.raises(RequestException, match="429 Client Error"):
             service.error_handling(response)
+
+    def test_retrieve_dispatches_chunks_in_order(self, service: ParclLabsService) -> None:
+        def fetch(chunk: list[int], params: dict, auto_paginate: bool) -> dict:  # noqa: ARG001
+            if chunk[0] == 1000:
+                raise NotFoundError
+            time.sleep(0.01 * (3 - chunk[0] // 1000))  # later chunks finish first
+            return {"items": [{"parcl_id": chunk[0]}, {"parcl_id": chunk[-1]}]}
+
+        with patch.object(service, "_fetch", side_effect=fetch) as mock_fetch:
+            result = service.retrieve(list(range(3500)))
+
+        assert mock_fetch.call_count == 4
+        assert result["parcl_id"].tolist() == [0, 999, 2000, 2999, 3000, 3499]
+
+    def test_plan_page_urls_rewrites_offset(self) -> None:
+        first_page = {
+            "items": [],
+            "total": 250,
+            "limit": 100,
+            "offset": 0,
+            "links": {"next": "https://api.example.com/test?limit=100&offset=100&x=1"},
+        }
+
+        assert ParclLabsService._plan_page_urls(first_page) == [
+            "https://api.example.com/test?limit=100&x=1&offset=100",
+            "https://api.example.com/test?limit=100&x=1&offset=200",
+        ]
+        assert ParclLabsService._plan_page_urls({**first_page, "total": None}) is None
+
+    def test_process_and_paginate_response_fetches_planned_pages(
+        self, service: ParclLabsService
+    ) -> None:
+        first_response = Mock(status_code=200)
+        first_response.json.return_value = {
+            "items": [0],
+            "total": 4,
+            "limit": 1,
+            "offset": 0,
+            "links": {"next": "https://api.example.com/next?limit=1&offset=1"},
+        }
+
+        def get(url: str, params: dict) -> Mock:  # noqa: ARG001
+            offset = int(url.rsplit("=", 1)[1])
+            time.sleep(0.01 * (4 - offset))  # later pages finish first
+            page = Mock()
+            page.json.return_value = {"items": [offset], "links": {}}
+            return page
+
+        with patch.object(service, "_get", side_effect=get) as mock_get:
+            result = service._process_and_paginate_response(first_response, True, {}, None, "get")
+
+        assert mock_get.call_count == 3
+        assert result["items"] == [0, 1, 2, 3]
+
+    def test_iter_pages_streams_pages_in_order(self, service: ParclLabsService) -> None:
+        service.client.limit = None
+        service.full_url = "https://api.example.com/test/{parcl_id}"
+
+        def fetch_page_url(url: str, params: dict, data: None, method: str) -> dict:  # noqa: ARG001
+            parcl_id = int(url.rsplit("/", 1)[1])
+            if parcl_id == 2:
+                raise NotFoundError
+            time.sleep(0.01 * (4 - parcl_id))  # later parcl_ids finish first
+            return {"parcl_id": parcl_id, "items": [{"date": "2024-01-01"}], "links": {}}
+
+        with patch.object(service, "_fetch_page_url", side_effect=fetch_page_url):
+            pages = list(service.iter_pages([1, 2, 3]))
+            frames = list(service.iter_frames([1, 2, 3]))
+
+        assert [page["parcl_id"] for page in pages] == [1, 3]
+        assert [frame["parcl_id"].tolist() for frame in frames] == [[1], [3]]
+
+    def test_iter_pages_yields_each_planned_page(self, service: ParclLabsService) -> None:
+        service.client.limit = None
+        service.full_post_url = "https://api.example.com/test"
+
+        def fetch_page_url(url: str, params: dict, data: dict, method: str) -> dict:  # noqa: ARG001
+            offset = int(url.rsplit("=", 1)[1]) if "offset" in url else 0
+            return {
+                "items": [offset],
+                "total": 3,
+                "limit": 1,
+                "offset": offset,
+                "links": {"next": f"https://api.example.com/test?offset={offset + 1}"},
+            }
+
+        with patch.object(service, "_fetch_page_url", side_effect=fetch_page_url) as mock_fetch:
+            pages = list(service.iter_pages([1, 2], auto_paginate=True))
+
+        assert [page["items"] for page in pages] == [[0], [1], [2]]
+        assert mock_fetch.call_count == 3
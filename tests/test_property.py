@@ -1,4 +1,6 @@
 import json
+import threading
+import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pandas as pd
@@ -66,6 +68,7 @@ def property_events_service() -> PropertyEventsService:
     client_mock = MagicMock()
     client_mock.api_url = "https://api.parcllabs.com"
     client_mock.api_key = "test_api_key"
+    client_mock.compact_dtypes = False
     client_mock.num_workers = 1
     return PropertyEventsService(client=client_mock, url="/v1/property_events")
 
@@ -117,7 +120,8 @@ def property_search_service() -> PropertySearch:
     client_mock = MagicMock()
     client_mock.api_url = "https://api.parcllabs.com"
     client_mock.api_key = "test_api_key"
-    # PropertySearch specific attributes if needed
+    client_mock.compact_dtypes = False
+    client_mock.num_workers = 4
     return PropertySearch(client=client_mock, url="/v1/property/search")
 
 
@@ -227,3 +231,53 @@ def test_retrieve_with_has_pool(mock_get: Mock, property_search_service: Propert
     # Check second call (has_pool=False)
     _, call_off_kwargs = mock_get.call_args_list[1]
     assert call_off_kwargs["params"] == expected_params_off
+
+
+def test_search_markets_concurrent_keeps_order_and_reports_no_data(
+    property_search_service: PropertySearch, capsys: pytest.CaptureFixture
+) -> None:
+    def get(url: str, params: dict) -> MagicMock:  # noqa: ARG001
+        parcl_id = params["parcl_id"]
+        if parcl_id in {2, 5}:
+            raise NotFoundError("Not found")
+        time.sleep(0.01 * (6 - parcl_id))  # later markets finish first
+        response = MagicMock()
+        response.json.return_value = {"items": [{"parcl_id": parcl_id}], "account": {}}
+        return response
+
+    params = {"property_type": "SINGLE_FAMILY"}
+    with patch.object(property_search_service, "_get", side_effect=get):
+        result = property_search_service._search_markets([1, 2, 3, 4, 5], params)
+
+    assert result["parcl_id"].tolist() == [1, 3, 4]
+    assert params == {"property_type": "SINGLE_FAMILY"}
+    assert "No data found for markets with parcl_ids: 2, 5" in capsys.readouterr().out
+
+
+def test_search_markets_records_credits_on_the_calling_thread(
+    property_search_service: PropertySearch,
+) -> None:
+    property_search_service.client.account_info = {"est_session_credits_used": 0}
+    update_threads = []
+    update_account_info = property_search_service._update_account_info
+
+    def record(account_info: dict) -> None:
+        update_threads.append(threading.current_thread())
+        update_account_info(account_info)
+
+    def get(url: str, params: dict) -> MagicMock:  # noqa: ARG001
+        response = MagicMock()
+        response.json.return_value = {
+            "items": [{"parcl_id": params["parcl_id"]}],
+            "account": {"est_credits_used": 1},
+        }
+        return response
+
+    with (
+        patch.object(property_search_service, "_get", side_effect=get),
+        patch.object(property_search_service, "_update_account_info", side_effect=record),
+    ):
+        property_search_service._search_markets(list(range(20)), {})
+
+    assert property_search_service.client.account_info["est_session_credits_used"] == 20
+    assert set(update_threads) == {threading.current_thread()}
@@ -51,6 +51,7 @@ def property_events_service() -> PropertyAddressSearch:
     client_mock = MagicMock()
     client_mock.api_url = "https://api.parcllabs.com"
     client_mock.api_key = "test_api_key"
+    client_mock.compact_dtypes = False
     client_mock.num_workers = 1
     return PropertyAddressSearch(client=client_mock, url="/v1/property/search_address")
 
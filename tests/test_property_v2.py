@@ -1,15 +1,21 @@
+import json
 import warnings
+from functools import partial
+from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pandas as pd
 import pytest
+import requests
 from requests.exceptions import RequestException
 
+from parcllabs import JSONDecoder, ParclLabsClient, RetryPolicy
 from parcllabs import warnings as parcllabs_warnings
 from parcllabs.common import PARCL_PROPERTY_IDS
 from parcllabs.enums import RequestLimits
 from parcllabs.schemas.schemas import GeoCoordinates, PropertyV2RetrieveParams
 from parcllabs.services.properties.property_v2 import PropertyV2Service
+from parcllabs.store import SQLiteStore
 
 
 @pytest.fixture
@@ -17,6 +23,7 @@ def property_v2_service() -> PropertyV2Service:
     client_mock = MagicMock()
     client_mock.api_url = "https://api.parcllabs.com"
     client_mock.api_key = "test_api_key"
+    client_mock.compact_dtypes = False
     client_mock.num_workers = 1
     return PropertyV2Service(client=client_mock, url="/v2/property_search")
 
@@ -270,6 +277,8 @@ def _page(
         "pagination": {"limit": limit, "offset": offset, "has_more": has_more},
         "account_info": {"credits_used": returned_count, "credits_remaining": 999},
     }
+    # Responses that pass through _make_request are decoded from their body.
+    response.content = json.dumps(response.json.return_value).encode()
     return response
 
 
@@ -366,20 +375,21 @@ def test_no_truncation_warning_when_complete(
     assert not [w for w in caught if w.category is parcllabs_warnings.ParclLabsTruncationWarning]
 
 
-@patch.object(PropertyV2Service, "_post")
-def test_page_retry_recovers_from_transient_failure(
-    mock_post: Mock, property_v2_service: PropertyV2Service
-) -> None:
-    mock_post.side_effect = [
+def test_page_retry_recovers_from_transient_failure() -> None:
+    client = ParclLabsClient(
+        api_key="test_api_key", retry_policy=RetryPolicy(backoff=0, jitter=False)
+    )
+    service = client.property_v2.search
+    client.session = Mock()
+    client.session.request.side_effect = [
         _page(1, total_available=2, limit=1, offset=0, has_more=True),
-        RequestException("boom"),
+        requests.exceptions.ConnectionError("boom"),
         _page(2, total_available=2, limit=1, offset=1, has_more=False),
     ]
 
-    with patch("parcllabs.services.properties.property_v2.time.sleep"):
-        result = property_v2_service._fetch_post(params={"limit": 1}, data={}, max_results=None)
+    result = service._fetch_post(params={"limit": 1}, data={}, max_results=None)
 
-    assert mock_post.call_count == 3
+    assert client.session.request.call_count == 3
     assert len(result) == 2
 
 
@@ -396,10 +406,7 @@ def test_incomplete_pages_warn_every_call(
     for _ in range(2):
         mock_post.reset_mock()
         mock_post.side_effect = responses()
-        with (
-            patch("parcllabs.services.properties.property_v2.time.sleep"),
-            pytest.warns(parcllabs_warnings.ParclLabsIncompleteResultWarning),
-        ):
+        with pytest.warns(parcllabs_warnings.ParclLabsIncompleteResultWarning):
             result = property_v2_service._fetch_post(params={"limit": 1}, data={}, max_results=None)
         assert result[0]["_parcllabs"]["incomplete_pages"] == [1]
 
@@ -418,10 +425,7 @@ def test_failed_pages_suppress_contradictory_truncation_warning(
     first = _page(1, total_available=108_295, limit=1, offset=0, has_more=True)
     mock_post.side_effect = [first, *[RequestException("boom")] * 3]
 
-    with (
-        patch("parcllabs.services.properties.property_v2.time.sleep"),
-        warnings.catch_warnings(record=True) as caught,
-    ):
+    with warnings.catch_warnings(record=True) as caught:
         warnings.simplefilter("always")
         property_v2_service._fetch_post(params={"limit": 1}, data={}, max_results=2)
 
@@ -539,6 +543,122 @@ def test_as_pd_dataframe(property_v2_service: PropertyV2Service, mock_response:
     assert test_df.iloc[0]["event_price"] == 500000
 
 
+def test_as_pd_dataframe_joins_properties_and_events(
+    property_v2_service: PropertyV2Service,
+) -> None:
+    data = [
+        {
+            "data": [
+                {
+                    "parcl_property_id": 1,
+                    "property_metadata": {"bedrooms": 3, "address": {"zip5": "10001"}},
+                    "events": [
+                        {"event_type": "SALE", "price": 100},
+                        {"event_type": "LISTING", "price": 120, "owner": {"name": "A"}},
+                    ],
+                },
+                {"parcl_property_id": 2, "property_metadata": {"bedrooms": 2}, "events": []},
+            ]
+        },
+        None,
+        {"data": [{"parcl_property_id": 3, "events": [{"event_type": "RENTAL"}]}]},
+    ]
+
+    test_df = property_v2_service._as_pd_dataframe(data)
+
+    assert test_df["parcl_property_id"].tolist() == [1, 1, 2, 3]
+    assert test_df["property_metadata_address_zip5"].tolist()[:2] == ["10001", "10001"]
+    assert test_df["property_metadata_bedrooms"].tolist()[:3] == [3, 3, 2]
+    assert test_df["event_event_type"].tolist()[:2] == ["SALE", "LISTING"]
+    assert test_df["event_event_type"].isna().tolist() == [False, False, True, False]
+    assert test_df["event_owner_name"].isna().tolist() == [True, False, True, True]
+    assert "events" not in test_df.columns
+
+
+def test_as_arrow_table_matches_as_pd_dataframe(property_v2_service: PropertyV2Service) -> None:
+    pytest.importorskip("pyarrow")
+    data = [
+        {
+            "data": [
+                {
+                    "parcl_property_id": 1,
+                    "property_metadata": {"bedrooms": 3, "address": {"zip5": "10001"}},
+                    "events": [
+                        {"event_type": "SALE", "price": 100},
+                        {"event_type": "LISTING", "price": 120},
+                    ],
+                },
+                {"parcl_property_id": 2, "property_metadata": {"bedrooms": 2}, "events": []},
+            ]
+        },
+        None,
+        {"data": [{"parcl_property_id": 3, "events": [{"event_type": "RENTAL", "price": 5}]}]},
+    ]
+
+    table = property_v2_service._as_arrow_table(data)
+    expected = property_v2_service._as_pd_dataframe(data)
+
+    assert sorted(table.column_names) == sorted(expected.columns)
+    assert table["parcl_property_id"].to_pylist() == [1, 1, 2, 3]
+    assert table["property_metadata_bedrooms"].to_pylist() == [3, 3, 2, None]
+    assert table["event_event_type"].to_pylist() == ["SALE", "LISTING", None, "RENTAL"]
+    assert table["event_price"].to_pylist() == [100, 120, None, 5]
+
+
+@patch.object(PropertyV2Service, "_fetch_post")
+def test_retrieve_arrow_returns_table_and_metadata(
+    mock_fetch_post: Mock, property_v2_service: PropertyV2Service
+) -> None:
+    pytest.importorskip("pyarrow")
+    mock_fetch_post.return_value = [
+        {
+            "data": [
+                {"parcl_property_id": 1, "events": []},
+                {"parcl_property_id": 1, "events": []},
+            ],
+            "metadata": {"results": {"returned_count": 2, "total_available": 2}},
+        }
+    ]
+
+    with pytest.warns(parcllabs_warnings.ParclLabsIncompleteResultWarning, match="integrity"):
+        table, metadata = property_v2_service.retrieve_arrow(parcl_ids=[123])
+
+    assert table.column_names == ["parcl_property_id"]
+    assert table.num_rows == 2
+    assert metadata["results"]["returned_count"] == 2
+
+
+@patch.object(PropertyV2Service, "_fetch_post")
+def test_retrieve_with_polars_backend_returns_polars_frame(
+    mock_fetch_post: Mock, property_v2_service: PropertyV2Service
+) -> None:
+    pl = pytest.importorskip("polars")
+    property_v2_service.client.dataframe_backend = "polars"
+    mock_fetch_post.return_value = [
+        {
+            "data": [
+                {
+                    "parcl_property_id": 1,
+                    "property_metadata": {"bedrooms": 3},
+                    "events": [{"event_type": "SALE"}, {"event_type": "LISTING"}],
+                },
+                {"parcl_property_id": 2, "property_metadata": {"bedrooms": 2}, "events": []},
+            ],
+            "metadata": {"results": {"returned_count": 2, "total_available": 2}},
+        }
+    ]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        df, metadata = property_v2_service.retrieve(parcl_ids=[123])
+
+    assert isinstance(df, pl.DataFrame)
+    assert df.columns == ["parcl_property_id", "property_metadata_bedrooms", "event_event_type"]
+    assert df["parcl_property_id"].to_list() == [1, 1, 2]
+    assert df["event_event_type"].to_list() == ["SALE", "LISTING", None]
+    assert metadata["results"]["returned_count"] == 2
+
+
 def test_get_metadata(property_v2_service: PropertyV2Service) -> None:
     results = [
         {"metadata": {"results": {"returned_count": 2, "total_available": 5}}},
@@ -587,6 +707,58 @@ def test_retrieve(
     assert data["event_filters"]["event_names"] == ["LISTING"]
 
 
+@patch.object(PropertyV2Service, "_fetch_post")
+def test_retrieve_split_events_returns_property_and_event_tables(
+    mock_fetch_post: Mock, property_v2_service: PropertyV2Service
+) -> None:
+    mock_fetch_post.return_value = [
+        {
+            "data": [
+                {
+                    "parcl_property_id": 1,
+                    "property_metadata": {"bedrooms": 3},
+                    "events": [
+                        {"event_type": "SALE", "price": 100},
+                        {"event_type": "LISTING", "price": 120},
+                    ],
+                },
+                {"parcl_property_id": 2, "property_metadata": {"bedrooms": 2}, "events": []},
+                {"parcl_property_id": 3, "events": [{"event_type": "RENTAL", "price": 5}]},
+            ],
+            "metadata": {"results": {"returned_count": 3, "total_available": 3}},
+        }
+    ]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        properties, events, metadata = property_v2_service.retrieve(
+            parcl_ids=[123], split_events=True
+        )
+
+    assert properties["parcl_property_id"].tolist() == [1, 2, 3]
+    assert properties["property_metadata_bedrooms"].tolist()[:2] == [3, 2]
+    assert "events" not in properties.columns
+    assert events.columns.tolist() == ["parcl_property_id", "event_type", "price"]
+    assert events["parcl_property_id"].tolist() == [1, 1, 3]
+    assert events["event_type"].tolist() == ["SALE", "LISTING", "RENTAL"]
+    assert metadata["results"]["returned_count"] == 3
+
+
+def test_retrieve_split_events_rejects_sink(
+    property_v2_service: PropertyV2Service, tmp_path: Path
+) -> None:
+    with pytest.raises(ValueError, match="split_events"):
+        property_v2_service.retrieve(parcl_ids=[123], sink=tmp_path, split_events=True)
+
+
+def test_as_pd_tables_without_data(property_v2_service: PropertyV2Service) -> None:
+    properties, events = property_v2_service._as_pd_tables([{"data": []}])
+
+    assert properties.empty
+    assert events.empty
+    assert events.columns.tolist() == ["parcl_property_id"]
+
+
 @patch.object(PropertyV2Service, "_fetch_post")
 def test_retrieve_with_geo_coordinates(
     mock_fetch_post: Mock, property_v2_service: PropertyV2Service, mock_response: Mock
@@ -659,3 +831,157 @@ def test_build_boolean_filters_has_pool(property_v2_service: PropertyV2Service)
     params = PropertyV2RetrieveParams()
     filters = property_v2_service._build_boolean_filters(params)
     assert "has_pool" not in filters
+
+
+@patch.object(PropertyV2Service, "_post")
+def test_iter_pages_streams_pages_in_offset_order(
+    mock_post: Mock, property_v2_service: PropertyV2Service
+) -> None:
+    first = _page(1, total_available=3, limit=1, offset=0, has_more=True)
+
+    def post(url: str, data: dict, params: dict) -> Mock:  # noqa: ARG001
+        offset = params.get("offset", 0)
+        if offset == 0:
+            return first
+        return _page(offset + 1, total_available=3, limit=1, offset=offset)
+
+    mock_post.side_effect = post
+    property_v2_service.client.num_workers = 2
+
+    pages = list(property_v2_service.iter_pages(parcl_ids=[123]))
+    frames = list(property_v2_service.iter_frames(parcl_ids=[123]))
+
+    assert [page["data"][0]["parcl_property_id"] for page in pages] == [1, 2, 3]
+    assert [frame["parcl_property_id"].tolist() for frame in frames] == [[1], [2], [3]]
+
+
+@patch.object(PropertyV2Service, "_post")
+def test_iter_pages_warns_about_failed_pages_after_last_page(
+    mock_post: Mock, property_v2_service: PropertyV2Service
+) -> None:
+    mock_post.side_effect = [
+        _page(1, total_available=2, limit=1, offset=0, has_more=True),
+        RequestException("boom"),
+    ]
+
+    with pytest.warns(parcllabs_warnings.ParclLabsIncompleteResultWarning):
+        pages = list(property_v2_service.iter_pages(parcl_ids=[123], limit=None))
+
+    assert len(pages) == 1
+
+
+@patch.object(PropertyV2Service, "_post")
+def test_retrieve_with_sink_writes_pages_and_returns_metadata(
+    mock_post: Mock, property_v2_service: PropertyV2Service, tmp_path: Path
+) -> None:
+    pytest.importorskip("pyarrow")
+
+    def post(url: str, data: dict, params: dict) -> Mock:  # noqa: ARG001
+        offset = params.get("offset", 0)
+        return _page(offset + 1, total_available=3, limit=1, offset=offset, has_more=offset < 2)
+
+    mock_post.side_effect = post
+
+    metadata = property_v2_service.retrieve(parcl_ids=[123], limit=3, sink=tmp_path / "events")
+
+    assert metadata["results"]["returned_count"] == 3
+    written = pd.read_parquet(tmp_path / "events")
+    assert written["parcl_property_id"].tolist() == [1, 2, 3]
+
+
+def _updated_since(since: str | None) -> list[dict]:
+    """Pages of a search returning property 1 always, and property 2 once updated.
+
+    Property 2's event has no ``event_name``, as some API events do.
+    """
+    properties = [
+        {
+            "parcl_property_id": 1,
+            "bedrooms": 3 if since is None else 4,
+            "events": [
+                {"event_date": "2024-01-01", "event_type": "SALE", "event_name": "SOLD"},
+            ],
+        }
+    ]
+    if since is not None:
+        properties.append(
+            {
+                "parcl_property_id": 2,
+                "events": [{"event_date": "2024-02-01", "event_type": "SALE", "event_name": None}],
+            }
+        )
+    count = len(properties)
+    return [
+        {
+            "data": properties,
+            "metadata": {"results": {"returned_count": count, "total_available": count}},
+        }
+    ]
+
+
+@patch.object(PropertyV2Service, "_fetch_post")
+def test_sync_requests_only_records_updated_since_the_last_run(
+    mock_fetch_post: Mock, property_v2_service: PropertyV2Service
+) -> None:
+    store = SQLiteStore(":memory:")
+    mock_fetch_post.side_effect = lambda params, data, max_results: _updated_since(  # noqa: ARG005
+        data["event_filters"].get("min_record_updated_date")
+    )
+
+    property_v2_service.sync(store, parcl_ids=[456])
+    with patch("parcllabs.services.properties.property_v2.datetime") as mock_datetime:
+        mock_datetime.now.return_value = pd.Timestamp("2024-03-01", tz="UTC")
+        property_v2_service.sync(store, parcl_ids=[123], event_names=["SOLD"])
+        properties, events, metadata = property_v2_service.sync(
+            store, parcl_ids=[123], event_names=["SOLD"]
+        )
+
+    filters = [call.kwargs["data"]["event_filters"] for call in mock_fetch_post.call_args_list]
+    assert [f.get("min_record_updated_date") for f in filters] == [None, None, "2024-03-01"]
+    assert properties["parcl_property_id"].tolist() == [1, 2]
+    assert metadata["sync"]["watermark"] == "2024-03-01"
+    stored = store.read("property_v2_properties", id_column="parcl_property_id")
+    assert stored.set_index("parcl_property_id").loc[1, "bedrooms"] == 4
+    assert events["event_name"].isna().tolist() == [False, True]
+    stored_events = store.read("property_v2_events", id_column="parcl_property_id")
+    assert stored_events.sort_values("parcl_property_id")["event_name"].tolist() == ["SOLD", ""]
+    assert store.key("property_v2_events") == [
+        "parcl_property_id",
+        "event_date",
+        "event_type",
+        "event_name",
+    ]
+
+
+@patch.object(PropertyV2Service, "_fetch_post")
+def test_sync_keeps_the_watermark_when_pages_failed(
+    mock_fetch_post: Mock, property_v2_service: PropertyV2Service
+) -> None:
+    store = SQLiteStore(":memory:")
+    pages = _updated_since(None)
+    pages[0]["_parcllabs"] = {"incomplete_pages": [100]}
+    mock_fetch_post.return_value = pages
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        property_v2_service.sync(store, parcl_ids=[123])
+
+    assert store.tables() == ["property_v2_events", "property_v2_properties"]
+    with pytest.raises(ValueError, match="limit"):
+        property_v2_service.sync(store, parcl_ids=[123], limit=10)
+    property_v2_service.sync(store, parcl_ids=[123])
+    assert (
+        "min_record_updated_date" not in mock_fetch_post.call_args.kwargs["data"]["event_filters"]
+    )
+
+
+def test_parse_chunk_response_reports_malformed_json_from_msgspec(
+    property_v2_service: PropertyV2Service,
+) -> None:
+    pytest.importorskip("msgspec")
+    body = b'{"data": ['
+    result = Mock(status_code=200, text=body.decode())
+    result.json = partial(JSONDecoder("msgspec").decode, body)
+
+    with pytest.raises(RuntimeError, match="Chunk 2 failed: Invalid JSON"):
+        property_v2_service._parse_chunk_response(2, result)
@@ -0,0 +1,72 @@
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+
+from parcllabs.rate_limiter import RateLimiter, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def test_reserve_allows_burst_then_spaces_requests(clock: FakeClock) -> None:
+    limiter = RateLimiter(rate=4, burst=2, increase=0, clock=clock)
+
+    assert [limiter.reserve() for _ in range(4)] == [0, 0, 0.25, 0.5]
+
+    clock.now += 10  # idle long enough to refill the bucket
+    assert limiter.reserve() == 0
+
+
+def test_on_success_increases_rate_up_to_max(clock: FakeClock) -> None:
+    limiter = RateLimiter(rate=4, max_rate=5, increase=0.5, clock=clock)
+
+    limiter.on_success()
+    assert limiter.rate == 4.5
+    limiter.on_success()
+    limiter.on_success()
+    assert limiter.rate == 5
+
+
+def test_on_rate_limited_halves_rate_once_and_waits_out_retry_after(clock: FakeClock) -> None:
+    limiter = RateLimiter(rate=8, burst=4, min_rate=1, clock=clock)
+
+    limiter.on_rate_limited(retry_after=2)
+    limiter.on_rate_limited(retry_after=2)  # already in flight; same signal
+
+    assert limiter.rate == 4
+    assert limiter.reserve() == 2
+    assert limiter.reserve() == 2.25
+
+    clock.now += 5
+    limiter.on_rate_limited(retry_after=2)
+    limiter.on_rate_limited(retry_after=2)
+    clock.now += 5
+    limiter.on_rate_limited(retry_after=2)
+    assert limiter.rate == 1
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after("3") == 3
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+    retry_at = datetime.now(UTC) + timedelta(seconds=30)
+    assert 25 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+
+
+def test_invalid_rates_raise() -> None:
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter(decrease_factor=1)
@@ -0,0 +1,51 @@
+import pytest
+
+from parcllabs.common import GET_METHOD, POST_METHOD
+from parcllabs.retry import RetryPolicy
+
+
+def test_retry_delay_backs_off_exponentially_up_to_max() -> None:
+    policy = RetryPolicy(max_attempts=10, backoff=1, max_backoff=5, jitter=False)
+
+    assert [policy.retry_delay(GET_METHOD, attempt, 0) for attempt in range(1, 5)] == [1, 2, 4, 5]
+
+
+def test_retry_delay_jitter_stays_within_backoff() -> None:
+    policy = RetryPolicy(max_attempts=10, backoff=1)
+
+    delays = [policy.retry_delay(GET_METHOD, 3, 0) for _ in range(50)]
+
+    assert all(0 <= delay <= 4 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_retry_delay_gives_up_after_max_attempts() -> None:
+    policy = RetryPolicy(max_attempts=3, jitter=False)
+
+    assert policy.retry_delay(POST_METHOD, 2, 0) is not None
+    assert policy.retry_delay(POST_METHOD, 3, 0) is None
+
+
+def test_retry_delay_respects_deadline_and_retry_after() -> None:
+    policy = RetryPolicy(backoff=1, deadline=10, jitter=False)
+
+    assert policy.retry_delay(GET_METHOD, 1, 0, retry_after=7) == 7
+    assert policy.retry_delay(GET_METHOD, 1, 5, retry_after=7) is None
+
+
+def test_non_idempotent_methods_are_not_retried() -> None:
+    policy = RetryPolicy(idempotent_methods=frozenset({GET_METHOD}))
+
+    assert policy.retry_delay(POST_METHOD, 1, 0) is None
+    assert RetryPolicy.disabled().retry_delay(GET_METHOD, 1, 0) is None
+
+
+def test_retryable_statuses() -> None:
+    policy = RetryPolicy()
+
+    assert policy.is_retryable_status(503)
+    assert policy.is_retryable_status(429)
+    assert not policy.is_retryable_status(404)
+
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
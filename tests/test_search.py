@@ -1,8 +1,11 @@
+from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pandas as pd
 import pytest
 
+from parcllabs.enums import SortByParams
+from parcllabs.services.market_index import MarketIndex
 from parcllabs.services.search import SearchMarkets
 
 # Mock Data for testing
@@ -20,7 +23,9 @@ def search_service() -> SearchMarkets:
     client_mock = MagicMock()
     client_mock.api_url = "https://api.parcllabs.com"
     client_mock.api_key = "test_api_key"
+    client_mock.compact_dtypes = False
     client_mock.limit = 100
+    client_mock.market_index = None
     return SearchMarkets(client=client_mock, url="/v1/search/markets")
 
 
@@ -35,3 +40,124 @@ def test_retrieve(mock_sync_request: Mock, search_service: SearchMarkets) -> Non
     assert len(result) == 2
     assert result.iloc[0]["parcl_id"] == 1
     assert result.iloc[1]["parcl_id"] == 2
+
+
+markets = [
+    {
+        "parcl_id": 1,
+        "geoid": "12420",
+        "name": "Austin-Round Rock-San Marcos, Tx",
+        "state_abbreviation": None,
+        "location_type": "CBSA",
+        "total_population": 2_400_000,
+    },
+    {
+        "parcl_id": 2,
+        "geoid": "4805000",
+        "name": "Austin",
+        "state_abbreviation": "TX",
+        "location_type": "CITY",
+        "total_population": 970_000,
+    },
+    {
+        "parcl_id": 3,
+        "geoid": "2703214",
+        "name": "Austin",
+        "state_abbreviation": "MN",
+        "location_type": "CITY",
+        "total_population": 26_000,
+    },
+    {
+        "parcl_id": 4,
+        "geoid": "4835000",
+        "name": "Houston",
+        "state_abbreviation": "TX",
+        "location_type": "CITY",
+        "total_population": None,
+    },
+]
+
+
+@pytest.fixture
+def market_index() -> MarketIndex:
+    index = MarketIndex()
+    index.update(markets)
+    return index
+
+
+def _parcl_ids(results: list[dict]) -> list[int]:
+    return [market["parcl_id"] for market in results]
+
+
+def test_market_index_filters(market_index: MarketIndex) -> None:
+    assert _parcl_ids(market_index.search({"parcl_id": 3})) == [3]
+    assert _parcl_ids(market_index.search({"geoid": "4835000"})) == [4]
+    assert _parcl_ids(market_index.search({"state_abbreviation": "TX"})) == [2, 4]
+    assert _parcl_ids(market_index.search({"location_type": "ALL"})) == [1, 2, 3, 4]
+    assert _parcl_ids(market_index.search({"location_type": "CITY", "query": "aus"})) == [2, 3]
+
+
+def test_market_index_matches_name_prefixes_and_substrings(market_index: MarketIndex) -> None:
+    assert _parcl_ids(market_index.search({"query": "ro"})) == [1]
+    assert _parcl_ids(market_index.search({"query": "ston"})) == [4]
+    assert _parcl_ids(market_index.search({"query": "marcos, tx"})) == [1]
+    assert market_index.search({"query": "dallas"}) == []
+
+
+def test_market_index_sorts_and_limits(market_index: MarketIndex) -> None:
+    params = {"location_type": "CITY", "sort_by": "TOTAL_POPULATION", "sort_order": "ASC"}
+
+    assert _parcl_ids(market_index.search(params)) == [3, 2, 4]
+    assert _parcl_ids(market_index.search({**params, "sort_order": "DESC", "limit": 2})) == [2, 3]
+    assert len(market_index.search({"limit": 1}, auto_paginate=True)) == 4
+
+
+@pytest.mark.parametrize("sort_by", list(SortByParams))
+def test_market_index_sorts_on_the_field_of_each_api_sort_by(sort_by: SortByParams) -> None:
+    field = sort_by.value.lower()
+    index = MarketIndex()
+    index.update([{"parcl_id": i, "name": "x", field: value} for i, value in enumerate([2, 3, 1])])
+
+    assert _parcl_ids(index.search({"sort_by": sort_by.value})) == [1, 0, 2]
+    assert _parcl_ids(index.search({"sort_by": sort_by.value, "sort_order": "asc"})) == [2, 0, 1]
+
+
+def test_market_index_rejects_sorts_the_api_rejects(market_index: MarketIndex) -> None:
+    with pytest.raises(ValueError, match="sort_by"):
+        market_index.search({"sort_by": "NAME"})
+    with pytest.raises(ValueError, match="sort_order"):
+        market_index.search({"sort_by": "TOTAL_POPULATION", "sort_order": "UP"})
+
+
+def test_market_index_query_length_selects_prefix_or_substring(market_index: MarketIndex) -> None:
+    # "st" is not the start of a word, but "ston" is inside "houston".
+    assert market_index.search({"query": "st"}) == []
+    assert _parcl_ids(market_index.search({"query": "ho"})) == [4]
+    assert _parcl_ids(market_index.search({"query": "sti"})) == [1, 2, 3]
+
+
+def test_market_index_loads_from_disk_until_stale(tmp_path: Path) -> None:
+    path = tmp_path / "markets.json.gz"
+    MarketIndex(path).update(markets)
+
+    index = MarketIndex(path, refresh_interval=60)
+    assert not index.needs_refresh()
+    assert _parcl_ids(index.search({"query": "houston"})) == [4]
+    with patch("parcllabs.services.market_index.time.time", return_value=index.downloaded_at + 61):
+        assert index.needs_refresh()
+
+
+@patch("parcllabs.services.search.SearchMarkets._fetch_get")
+def test_retrieve_with_market_index_downloads_once(
+    mock_fetch_get: Mock, search_service: SearchMarkets
+) -> None:
+    mock_fetch_get.return_value = {"items": markets, "links": {}}
+    search_service.client.market_index = MarketIndex()
+
+    first = search_service.retrieve(query="austin", location_type="city", limit=5)
+    second = search_service.retrieve(state_abbreviation="tx", limit=5)
+
+    mock_fetch_get.assert_called_once()
+    assert mock_fetch_get.call_args.kwargs["auto_paginate"]
+    assert first["parcl_id"].tolist() == [2, 3]
+    assert second["parcl_id"].tolist() == [2, 4]
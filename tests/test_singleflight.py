@@ -0,0 +1,129 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from parcllabs import AsyncParclLabsClient, ParclLabsClient
+from parcllabs.singleflight import SingleFlight
+
+page = {
+    "parcl_id": 1,
+    "items": [{"date": "2024-01-01", "metric": 10}],
+    "links": {},
+    "account": {"est_credits_used": 2, "est_remaining_credits": 98},
+}
+body = json.dumps(page).encode()
+
+
+def _wait_for(condition: object) -> None:
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_identical_requests_in_flight_share_one_response() -> None:
+    client = ParclLabsClient(api_key="test_api_key", num_workers=4, coalesce_requests=True)
+    service = client.market_metrics.housing_event_prices
+    release = threading.Event()
+
+    def request(*args: object, **kwargs: object) -> Mock:  # noqa: ARG001
+        release.wait(5)
+        return Mock(status_code=200, headers={}, content=body)
+
+    client.session = Mock()
+    client.session.request.side_effect = request
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(service.retrieve, [1]) for _ in range(4)]
+        _wait_for(lambda: client.single_flight.shared == 3)
+        release.set()
+        frames = [future.result() for future in futures]
+
+    for frame in frames[1:]:
+        pd.testing.assert_frame_equal(frames[0], frame)
+    frames[1].loc[0, "metric"] = -1
+    assert frames[0].loc[0, "metric"] == 10
+    assert frames[2].loc[0, "metric"] == 10
+    assert client.session.request.call_count == 1
+    account = client.account()
+    assert account["est_session_credits_used"] == 2
+    assert account["coalesced"] == {"shared": 3, "est_credits_saved": 6}
+
+
+def test_coalesced_callers_decode_independent_copies() -> None:
+    client = ParclLabsClient(api_key="test_api_key", coalesce_requests=True)
+    service = client.market_metrics.housing_event_prices
+    release = threading.Event()
+
+    def request(*args: object, **kwargs: object) -> Mock:  # noqa: ARG001
+        release.wait(5)
+        return Mock(status_code=200, headers={}, content=body)
+
+    client.session = Mock()
+    client.session.request.side_effect = request
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(service._get, "https://api.example.com/1") for _ in range(2)]
+        _wait_for(lambda: client.single_flight.shared == 1)
+        release.set()
+        first, second = (future.result().json() for future in futures)
+
+    first["items"].clear()
+    assert second["items"] == page["items"]
+    assert client.session.request.call_count == 1
+
+
+def test_followers_receive_the_leaders_exception() -> None:
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def send() -> None:
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flight.do, "k", send)
+        started.wait(5)
+        follower = executor.submit(flight.do, "k", Mock())
+        _wait_for(lambda: flight.shared == 1)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(ValueError, match="boom"):
+                future.result()
+
+    assert flight.do("k", lambda: 1) == (1, False)
+
+
+def test_requests_are_not_coalesced_by_default() -> None:
+    client = ParclLabsClient(api_key="test_api_key")
+
+    assert client.single_flight is None
+    assert "coalesced" not in client.account()
+
+
+def test_async_identical_requests_share_one_response() -> None:
+    httpx = pytest.importorskip("httpx")
+    requests_sent = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests_sent.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, content=body)
+
+    async def run() -> list[pd.DataFrame]:
+        async with AsyncParclLabsClient(api_key="test_api_key", coalesce_requests=True) as client:
+            client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            service = client.market_metrics.housing_event_prices
+            frames = await asyncio.gather(*(service.retrieve([1]) for _ in range(3)))
+            assert client.account()["est_session_credits_used"] == 2
+            return frames
+
+    frames = asyncio.run(run())
+
+    pd.testing.assert_frame_equal(frames[0], frames[2])
+    assert len(requests_sent) == 1
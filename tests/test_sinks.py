@@ -0,0 +1,49 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from parcllabs import ParquetSink
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def test_each_frame_is_written_as_one_row_group(tmp_path: Path) -> None:
+    with ParquetSink(tmp_path) as sink:
+        sink.write(pd.DataFrame({"id": [1, 2]}))
+        sink.write(pd.DataFrame({"id": [3]}))
+        sink.write(pd.DataFrame({"id": []}))
+
+    assert sink.rows_written == 3
+    assert len(sink.files) == 1
+    assert pq.ParquetFile(sink.files[0]).num_row_groups == 2
+    assert pd.read_parquet(tmp_path)["id"].tolist() == [1, 2, 3]
+
+
+def test_schema_is_widened_and_rewritten_on_close(tmp_path: Path) -> None:
+    with ParquetSink(tmp_path) as sink:
+        sink.write(pd.DataFrame({"id": [1], "price": [100]}))
+        sink.write(pd.DataFrame({"id": [2]}))
+        sink.write(pd.DataFrame({"id": [3], "price": [1.5], "event": ["SALE"]}))
+
+    assert len(sink.files) == 2
+    schemas = {str(pq.read_schema(part)) for part in sink.files}
+    assert len(schemas) == 1
+
+    result = pd.read_parquet(tmp_path)
+    assert result["id"].tolist() == [1, 2, 3]
+    assert result["price"].tolist()[0] == 100.0
+    assert pd.isna(result["price"].tolist()[1])
+    assert result["event"].isna().tolist() == [True, True, False]
+
+
+def test_existing_dataset_requires_overwrite(tmp_path: Path) -> None:
+    with ParquetSink(tmp_path) as sink:
+        sink.write(pd.DataFrame({"id": [1]}))
+
+    with pytest.raises(FileExistsError):
+        ParquetSink(tmp_path)
+
+    with ParquetSink(tmp_path, overwrite=True) as sink:
+        sink.write(pd.DataFrame({"id": [2]}))
+    assert pd.read_parquet(tmp_path)["id"].tolist() == [2]
@@ -0,0 +1,245 @@
+import asyncio
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+
+from parcllabs import AsyncParclLabsClient, DuckDBStore, ParclLabsClient, SQLiteStore
+from parcllabs.store import LocalStore
+
+DATES = ["2024-01-01", "2024-02-01", "2024-03-01"]
+
+
+@pytest.fixture(params=[SQLiteStore, DuckDBStore])
+def store_class(request: pytest.FixtureRequest) -> type[LocalStore]:
+    if request.param is DuckDBStore:
+        pytest.importorskip("duckdb")
+    return request.param
+
+
+def _frame(parcl_id: int, dates: list[str], value: float = 1.0) -> pd.DataFrame:
+    return pd.DataFrame(
+        {"parcl_id": parcl_id, "date": pd.to_datetime(dates), "median_price": value}
+    )
+
+
+def test_upsert_replaces_rows_with_the_same_key(store_class: type[LocalStore]) -> None:
+    store = store_class(":memory:")
+    store.upsert("prices", _frame(1, DATES[:2]), key=["parcl_id", "date"])
+    store.upsert("prices", _frame(1, DATES[1:], value=2.0), key=["parcl_id", "date"])
+
+    stored = store.read("prices").sort_values("date", ignore_index=True)
+
+    assert stored["median_price"].tolist() == [1.0, 2.0, 2.0]
+    assert stored["date"].tolist() == list(pd.to_datetime(DATES))
+    assert store.key("prices") == ["parcl_id", "date"]
+
+
+def test_upsert_adds_new_columns_and_rejects_another_key(store_class: type[LocalStore]) -> None:
+    store = store_class(":memory:")
+    store.upsert("prices", _frame(1, DATES[:1]), key=["parcl_id", "date"])
+    store.upsert("prices", _frame(2, DATES[:1]).assign(count=3), key=["parcl_id", "date"])
+
+    assert store.read("prices", parcl_ids=[2])["count"].tolist() == [3]
+    with pytest.raises(ValueError, match="keyed on"):
+        store.upsert("prices", _frame(1, DATES[:1]), key=["parcl_id"])
+    with pytest.raises(ValueError, match="missing values"):
+        store.upsert("prices", _frame(1, [None]), key=["parcl_id", "date"])
+
+
+def test_backend_missing_hooks_fails_when_created() -> None:
+    class PartialStore(LocalStore):
+        def _connect(self, path: str) -> None:  # noqa: ARG002
+            return None
+
+    with pytest.raises(TypeError, match="abstract"):
+        PartialStore(":memory:")
+
+
+def test_watermarks_are_the_latest_date_per_parcl_id(
+    store_class: type[LocalStore], tmp_path: Path
+) -> None:
+    with store_class(tmp_path / "store.db") as store:
+        store.upsert("prices", _frame(1, DATES).assign(kind="A"), key=["parcl_id", "date", "kind"])
+        store.upsert(
+            "prices", _frame(2, DATES[:1]).assign(kind="A"), key=["parcl_id", "date", "kind"]
+        )
+
+    store = store_class(tmp_path / "store.db")
+    assert store.watermarks("prices", [1, 2, 3], where={"kind": "A"}) == {
+        1: "2024-03-01",
+        2: "2024-01-01",
+    }
+    assert store.watermarks("prices", [1], where={"kind": "B"}) == {}
+    assert store.watermarks("missing", [1]) == {}
+
+
+def _metric_pages(available: dict[int, list[str]]) -> Mock:
+    """A ``_fetch`` returning each parcl_id's dates on or after ``start_date``, newest first."""
+
+    def fetch(parcl_ids: list[int], params: dict, auto_paginate: bool) -> dict:  # noqa: ARG001
+        start = params.get("start_date", "")
+        items = [
+            {"parcl_id": parcl_id, "date": date, "median_price": 100}
+            for parcl_id in parcl_ids
+            for date in sorted(available[parcl_id], reverse=True)
+            if date >= start
+        ]
+        return {"items": items, "property_type": params.get("property_type"), "links": {}}
+
+    return Mock(side_effect=fetch)
+
+
+def test_retrieve_incremental_fetches_only_new_dates() -> None:
+    client = ParclLabsClient(api_key="test_api_key")
+    service = client.market_metrics.housing_event_prices
+    store = SQLiteStore(":memory:")
+    service._fetch = _metric_pages({1: DATES[:2], 2: DATES[:2], 3: DATES[:1]})
+    first = service.retrieve_incremental([1, 2, 3], store, property_type="single_family")
+
+    service._fetch = _metric_pages({1: DATES, 2: DATES, 3: DATES})
+    second = service.retrieve_incremental([1, 2, 3], store, property_type="single_family")
+
+    assert len(first) == 5
+    assert service._fetch.call_count == 2
+    requested = {call.args[1]["start_date"]: call.args[0] for call in service._fetch.call_args_list}
+    assert requested == {"2024-02-02": [1, 2], "2024-01-02": [3]}
+    assert sorted(zip(second["parcl_id"], second["date"].dt.strftime("%Y-%m-%d"), strict=True)) == [
+        (1, "2024-03-01"),
+        (2, "2024-03-01"),
+        (3, "2024-02-01"),
+        (3, "2024-03-01"),
+    ]
+    stored = store.read(service.store_table)
+    assert len(stored) == 9
+    assert set(stored["property_type"]) == {"SINGLE_FAMILY"}
+    assert store.key(service.store_table) == ["parcl_id", "date", "property_type"]
+
+
+def test_retrieve_incremental_skips_parcl_ids_past_end_date() -> None:
+    client = ParclLabsClient(api_key="test_api_key")
+    service = client.market_metrics.housing_stock
+    store = SQLiteStore(":memory:")
+    store.upsert(service.store_table, _frame(1, DATES), key=["parcl_id", "date"])
+    service._fetch = _metric_pages({1: DATES, 2: DATES})
+
+    result = service.retrieve_incremental([1, 2], store, end_date="2024-03-01")
+
+    service._fetch.assert_called_once()
+    assert service._fetch.call_args.args[0] == [2]
+    assert len(result) == 3
+
+
+def test_async_retrieve_incremental() -> None:
+    pytest.importorskip("httpx")
+    store = SQLiteStore(":memory:")
+    store.upsert("market_metrics_housing_stock", _frame(1, DATES[:1]), key=["parcl_id", "date"])
+
+    async def run() -> pd.DataFrame:
+        async with AsyncParclLabsClient(api_key="test_api_key") as client:
+            service = client.market_metrics.housing_stock
+            pages = _metric_pages({1: DATES})
+            service._fetch = Mock(
+                side_effect=lambda *args, **kwargs: _resolved(pages(*args, **kwargs))
+            )
+            return await service.retrieve_incremental([1], store)
+
+    result = asyncio.run(run())
+
+    assert result["date"].dt.strftime("%Y-%m-%d").tolist() == DATES[:0:-1]
+    assert len(store.read("market_metrics_housing_stock")) == 3
+
+
+def test_repeated_retrieve_is_answered_from_the_store(store_class: type[LocalStore]) -> None:
+    client = ParclLabsClient(api_key="test_api_key", store=store_class(":memory:"))
+    service = client.market_metrics.housing_event_prices
+    service._fetch = _metric_pages({1: DATES, 2: DATES[:1], 3: DATES, 4: []})
+
+    first = service.retrieve([1, 2, 4], start_date="2024-02-01")
+    repeat = service.retrieve([1, 2, 4], start_date="2024-02-01")
+    overlapping = service.retrieve([3, 1], start_date="2024-02-01")
+    service.retrieve([1], start_date="2024-01-01")
+
+    requested = [call.args[0] for call in service._fetch.call_args_list]
+    assert requested == [[1, 2, 4], [3], [1]]
+    pd.testing.assert_frame_equal(first, repeat)
+    assert first["date"].dt.strftime("%Y-%m-%d").tolist() == ["2024-03-01", "2024-02-01"]
+    assert overlapping["parcl_id"].tolist() == [3, 3, 1, 1]
+    assert overlapping["date"].max() == pd.Timestamp("2024-03-01")
+
+
+def test_store_answers_match_the_frames_retrieve_returns_without_a_store() -> None:
+    available = {1: DATES, 2: DATES[:2]}
+    plain = ParclLabsClient(api_key="test_api_key", compact_dtypes=True)
+    stored = ParclLabsClient(
+        api_key="test_api_key", compact_dtypes=True, store=SQLiteStore(":memory:")
+    )
+    for client in (plain, stored):
+        client.market_metrics.housing_event_prices._fetch = _metric_pages(available)
+    params = {"property_type": "single_family"}
+
+    expected = plain.market_metrics.housing_event_prices.retrieve([2, 1], params=params)
+    service = stored.market_metrics.housing_event_prices
+    first = service.retrieve([2], params=params)
+    pd.testing.assert_frame_equal(
+        first, plain.market_metrics.housing_event_prices.retrieve([2], params=params)
+    )
+    combined = service.retrieve([2, 1], params=params)
+    repeat = service.retrieve([2, 1], params=params)
+
+    pd.testing.assert_frame_equal(combined, expected)
+    pd.testing.assert_frame_equal(repeat, expected)
+    assert service._fetch.call_count == 2
+
+
+def test_stored_answers_expire_after_max_age() -> None:
+    client = ParclLabsClient(api_key="test_api_key", store=SQLiteStore(":memory:", max_age=60))
+    service = client.market_metrics.housing_stock
+    service._fetch = _metric_pages({1: DATES})
+
+    with patch("parcllabs.store.time.time", return_value=1000.0):
+        service.retrieve([1])
+    with patch("parcllabs.store.time.time", return_value=1059.0):
+        service.retrieve([1])
+    assert service._fetch.call_count == 1
+    with patch("parcllabs.store.time.time", return_value=1061.0):
+        service.retrieve([1])
+    assert service._fetch.call_count == 2
+
+
+def test_retrieve_is_not_stored_in_a_table_keyed_on_other_dimensions() -> None:
+    store = SQLiteStore(":memory:")
+    client = ParclLabsClient(api_key="test_api_key", store=store)
+    service = client.market_metrics.housing_event_prices
+    service._fetch = _metric_pages({1: DATES})
+    service.retrieve_incremental([1], store, params={"property_type": "CONDO"})
+
+    result = service.retrieve([1])
+    service.retrieve([1])
+
+    assert len(result) == 3
+    assert service._fetch.call_count == 3
+
+
+def test_async_retrieve_is_answered_from_the_store() -> None:
+    pytest.importorskip("httpx")
+
+    async def run() -> tuple[pd.DataFrame, pd.DataFrame, Mock]:
+        store = SQLiteStore(":memory:")
+        async with AsyncParclLabsClient(api_key="test_api_key", store=store) as client:
+            service = client.market_metrics.housing_stock
+            pages = _metric_pages({1: DATES})
+            service._fetch = Mock(
+                side_effect=lambda *args, **kwargs: _resolved(pages(*args, **kwargs))
+            )
+            return await service.retrieve([1]), await service.retrieve([1]), service._fetch
+
+    first, repeat, fetch = asyncio.run(run())
+
+    pd.testing.assert_frame_equal(first, repeat)
+    fetch.assert_called_once()
+
+
+async def _resolved(value: object) -> object:
+    return value